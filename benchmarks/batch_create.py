@@ -0,0 +1,81 @@
+"""
+Compare throughput of single and batch short URL creation.
+
+Drives the application in-process and removes the created rows afterwards.
+
+Usage:
+    python -m benchmarks.batch_create [--links 5000] [--batch-size 500]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from typing import Any, Dict, List
+
+import httpx
+
+from sqlalchemy import delete
+
+from infrastructure.database import database
+from infrastructure.database.models import Short
+
+from src.main import app
+
+
+async def cleanup(ids: List[str]) -> None:
+    async with database.session_factory() as session:
+        await session.execute(delete(Short).where(Short.id.in_(ids)))
+        await session.commit()
+
+
+async def single(client: httpx.AsyncClient, links: int) -> List[str]:
+    ids: List[str] = []
+
+    for number in range(links):
+        response: httpx.Response = await client.post("/shorts/", json={"url": f"https://example.com/{number}"})
+        ids.append(response.json()["content"][0]["id"])
+
+    return ids
+
+
+async def batch(client: httpx.AsyncClient, links: int, batch_size: int) -> List[str]:
+    ids: List[str] = []
+
+    for start in range(0, links, batch_size):
+        response: httpx.Response = await client.post(
+            "/shorts/batch",
+            json=[{"url": f"https://example.com/{number}"} for number in range(start, min(links, start + batch_size))]
+        )
+        ids.extend(item["short"]["id"] for item in response.json()["content"] if item["success"])
+
+    return ids
+
+
+async def main(links: int, batch_size: int) -> None:
+    results: List[Dict[str, Any]] = []
+    transport: httpx.ASGITransport = httpx.ASGITransport(app=app)
+
+    async with app.router.lifespan_context(app), httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, run in (("single", single(client, links)), ("batch", batch(client, links, batch_size))):
+            started: float = time.perf_counter()
+            ids: List[str] = await run
+            elapsed: float = time.perf_counter() - started
+
+            results.append({"path": name, "links": len(ids), "seconds": elapsed, "links_per_second": len(ids) / elapsed})
+
+            await cleanup(ids)
+
+    print(json.dumps(results, indent=2))
+
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--links", type=int, default=5000, help="Number of links to create per path")
+    parser.add_argument("--batch-size", type=int, default=500, help="Items per batch request")
+    arguments: argparse.Namespace = parser.parse_args()
+
+    asyncio.run(main(links=arguments.links, batch_size=arguments.batch_size))
@@ -0,0 +1,107 @@
+"""
+Compare code generation strategies at different keyspace fill levels.
+
+The keyspace is shrunk to `--length` characters so that high fill levels
+are reachable; the table is filled inside a transaction that is rolled
+back afterwards, so the benchmark leaves the database untouched.
+
+Usage:
+    python -m benchmarks.code_generation [--length 3] [--codes 1000]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from typing import Any, Dict, List
+
+from sqlalchemy import Sequence, event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database import database
+from infrastructure.database.models import Short
+
+from src.routers.short.service.generators import (BaseCodeGenerator,
+                                                  RandomCodeGenerator,
+                                                  SequenceCodeGenerator)
+from src.routers.short.service.permutation import ALPHABET, encode_base62
+
+FILLS: List[float] = [0.1, 0.5, 0.9]
+CHUNK_SIZE: int = 10_000
+
+queries: int = 0
+
+
+@event.listens_for(database.engine.sync_engine, "before_cursor_execute")
+def count_query(*args: Any) -> None:
+    global queries
+    queries += 1
+
+
+async def fill(session: AsyncSession, length: int, ratio: float) -> None:
+    keyspace: int = len(ALPHABET) ** length
+    values: List[int] = random.sample(range(keyspace), int(keyspace * ratio))
+
+    for start in range(0, len(values), CHUNK_SIZE):
+        await session.execute(
+            insert(Short),
+            [{"code": encode_base62(value, length), "url": "https://example.com"}
+             for value in values[start:start + CHUNK_SIZE]]
+        )
+
+
+async def measure(session: AsyncSession, generator: BaseCodeGenerator, codes: int) -> Dict[str, float]:
+    global queries
+    queries = 0
+
+    started: float = time.perf_counter()
+
+    for _ in range(codes):
+        await generator.generate(session=session)
+
+    elapsed: float = time.perf_counter() - started
+
+    return {
+        "us_per_code": elapsed / codes * 1e6,
+        "queries_per_code": queries / codes,
+    }
+
+
+async def main(length: int, codes: int, block_size: int) -> None:
+    results: List[Dict[str, Any]] = []
+
+    for ratio in FILLS:
+        async with database.session_factory() as session:
+            await fill(session=session, length=length, ratio=ratio)
+            await session.execute(text("CREATE TEMPORARY SEQUENCE bench_code_seq"))
+
+            generators: Dict[str, BaseCodeGenerator] = {
+                "random": RandomCodeGenerator(length=length),
+                "sequence": SequenceCodeGenerator(
+                    length=length,
+                    secret=b"benchmark",
+                    block_size=block_size,
+                    sequence=Sequence("bench_code_seq")
+                ),
+            }
+
+            for name, generator in generators.items():
+                results.append({"strategy": name, "fill": ratio, **await measure(session, generator, codes)})
+
+            await session.rollback()
+
+    print(json.dumps(results, indent=2))
+
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--length", type=int, default=3, help="Code length of the shrunk keyspace")
+    parser.add_argument("--codes", type=int, default=1000, help="Codes generated per measurement")
+    parser.add_argument("--block-size", type=int, default=100, help="Sequence block size")
+    arguments: argparse.Namespace = parser.parse_args()
+
+    asyncio.run(main(length=arguments.length, codes=arguments.codes, block_size=arguments.block_size))
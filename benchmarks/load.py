@@ -0,0 +1,310 @@
+"""
+Load-test the application with mixed workloads and gate on latency regressions.
+
+Drives the application either in-process through the ASGI transport or
+over real sockets against a uvicorn server started for the run, using the
+storage backend configured through the environment (e.g.
+CONFIG__DATABASE__BACKEND=memory or a local Postgres). Short URLs created
+by the run are removed afterwards.
+
+Workloads:
+    redirect: redirects of seeded codes with occasional creates
+    create: single short URL creation
+    list: paginated listing with occasional exports
+    bulk: batch creation and NDJSON imports
+
+Results are printed as JSON. With --baseline, the run fails (exit code 1)
+when any operation's p95 latency grows, or its throughput drops, by more
+than --tolerance percent compared to the stored baseline.
+
+Usage:
+    python -m benchmarks.load [--workload redirect] [--transport asgi] [--duration 10] [--concurrency 16]
+                              [--output run.json] [--baseline baseline.json] [--tolerance 10] [--save-baseline]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+from sqlalchemy import delete
+
+from src.config import config
+
+from infrastructure.database import database
+from infrastructure.database.models import Short
+
+SEED_BATCH_SIZE: int = 500
+BULK_BATCH_SIZE: int = 100
+PORT: int = 8765
+
+Operation = Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+
+
+class Workload:
+    """Weighted mix of operations sharing the codes created during a run.
+
+    Args:
+        seed: Number of short URLs created before the run
+    """
+
+    def __init__(self, seed: int) -> None:
+        self.seed: int = seed
+        self.codes: List[str] = []
+        self.created: Set[str] = set()
+        self.operations: Dict[str, Tuple[float, Operation]] = {}
+
+    def track(self, response: httpx.Response) -> httpx.Response:
+        if response.is_success:
+            for item in response.json().get("content") or []:
+                short: Optional[Dict[str, Any]] = item.get("short", item)
+
+                if short and "code" in short:
+                    self.created.add(short["code"])
+
+        return response
+
+    def pick(self) -> Tuple[str, Operation]:
+        names: List[str] = list(self.operations)
+        weights: List[float] = [weight for weight, _ in self.operations.values()]
+        name: str = random.choices(names, weights)[0]
+
+        return name, self.operations[name][1]
+
+    async def prepare(self, client: httpx.AsyncClient) -> None:
+        for start in range(0, self.seed, SEED_BATCH_SIZE):
+            response: httpx.Response = self.track(await client.post(
+                "/shorts/batch",
+                json=[{"url": f"https://example.com/seed/{number}"}
+                      for number in range(start, min(self.seed, start + SEED_BATCH_SIZE))]
+            ))
+            self.codes.extend(item["short"]["code"] for item in response.json()["content"] if item["success"])
+
+    async def redirect(self, client: httpx.AsyncClient) -> httpx.Response:
+        return await client.get(f"/redirects/{random.choice(self.codes)}")
+
+    async def create(self, client: httpx.AsyncClient) -> httpx.Response:
+        return self.track(await client.post("/shorts/", json={"url": "https://example.com/create"}))
+
+    async def list(self, client: httpx.AsyncClient) -> httpx.Response:
+        response: httpx.Response = await client.get("/shorts/", params={"limit": 100})
+        cursor: Optional[str] = response.json().get("next_cursor")
+
+        if cursor is not None:
+            response = await client.get("/shorts/", params={"limit": 100, "cursor": cursor})
+
+        return response
+
+    async def export(self, client: httpx.AsyncClient) -> httpx.Response:
+        return await client.get("/shorts/export")
+
+    async def batch(self, client: httpx.AsyncClient) -> httpx.Response:
+        return self.track(await client.post(
+            "/shorts/batch",
+            json=[{"url": f"https://example.com/batch/{number}"} for number in range(BULK_BATCH_SIZE)]
+        ))
+
+    async def import_(self, client: httpx.AsyncClient) -> httpx.Response:
+        codes: List[str] = [uuid.uuid4().hex[:6] for _ in range(BULK_BATCH_SIZE)]
+        self.created.update(codes)
+
+        document: str = "".join(
+            json.dumps({"url": f"https://example.com/import/{code}", "code": code}) + "\n" for code in codes
+        )
+
+        return await client.post("/shorts/import", files={"file": ("load.ndjson", document)})
+
+
+def workload(name: str, seed: int) -> Workload:
+    mix: Workload = Workload(seed=seed)
+
+    mix.operations = {
+        "redirect": {"redirect": (0.95, mix.redirect), "create": (0.05, mix.create)},
+        "create": {"create": (1.0, mix.create)},
+        "list": {"list": (0.9, mix.list), "export": (0.1, mix.export)},
+        "bulk": {"batch": (0.7, mix.batch), "import": (0.3, mix.import_)},
+    }[name]
+
+    return mix
+
+
+@contextlib.asynccontextmanager
+async def connect(transport: str, workers: int) -> AsyncIterator[httpx.AsyncClient]:
+    if transport == "asgi":
+        from src.main import app
+
+        async with app.router.lifespan_context(app), httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://load", timeout=60
+        ) as client:
+            yield client
+
+        return
+
+    server: subprocess.Popen = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--port", str(PORT), "--workers", str(workers),
+         "--log-level", "warning"],
+        env=os.environ.copy()
+    )
+
+    try:
+        async with httpx.AsyncClient(
+                base_url=f"http://127.0.0.1:{PORT}",
+                timeout=60,
+                limits=httpx.Limits(max_connections=None, max_keepalive_connections=None)
+        ) as client:
+            for _ in range(100):
+                with contextlib.suppress(httpx.TransportError):
+                    if (await client.get("/healths/")).is_success:
+                        break
+
+                await asyncio.sleep(0.1)
+            else:
+                raise RuntimeError("uvicorn did not start")
+
+            yield client
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def summarize(latencies: List[float], errors: int, duration: float) -> Dict[str, Any]:
+    cuts: List[float] = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": len(latencies) / duration,
+        "p50_ms": cuts[49] * 1000,
+        "p95_ms": cuts[94] * 1000,
+        "p99_ms": cuts[98] * 1000,
+    }
+
+
+async def run(name: str, transport: str, duration: float, concurrency: int, seed: int, workers: int) -> Dict[str, Any]:
+    mix: Workload = workload(name=name, seed=seed)
+    latencies: Dict[str, List[float]] = {operation: [] for operation in mix.operations}
+    errors: Dict[str, int] = {operation: 0 for operation in mix.operations}
+
+    async def user(client: httpx.AsyncClient, deadline: float) -> None:
+        while time.perf_counter() < deadline:
+            operation, call = mix.pick()
+            started: float = time.perf_counter()
+
+            try:
+                response: httpx.Response = await call(client)
+                # Every operation targets existing data, so client errors (e.g. a 404 on a seeded code) are failures too
+                failed: bool = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+
+            latencies[operation].append(time.perf_counter() - started)
+            errors[operation] += failed
+
+    try:
+        async with connect(transport=transport, workers=workers) as client:
+            await mix.prepare(client)
+
+            started: float = time.perf_counter()
+            await asyncio.gather(*(user(client, started + duration) for _ in range(concurrency)))
+            elapsed: float = time.perf_counter() - started
+    finally:
+        if config.database.backend != "memory" and mix.created:
+            async with database.session_factory() as session:
+                await session.execute(delete(Short).where(Short.code.in_(mix.created)))
+                await session.commit()
+
+        await database.dispose()
+
+    return {
+        "workload": name,
+        "transport": transport,
+        "backend": config.database.backend,
+        "concurrency": concurrency,
+        "duration": elapsed,
+        "operations": {
+            operation: summarize(samples, errors[operation], elapsed)
+            for operation, samples in latencies.items() if samples
+        },
+        "total": summarize(
+            [sample for samples in latencies.values() for sample in samples], sum(errors.values()), elapsed
+        ),
+    }
+
+
+def regressions(result: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    found: List[str] = []
+
+    for operation, current in result["operations"].items():
+        previous: Optional[Dict[str, Any]] = baseline["operations"].get(operation)
+
+        if previous is None:
+            continue
+
+        if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance / 100):
+            found.append(f"{operation}: p95 {previous['p95_ms']:.2f} ms -> {current['p95_ms']:.2f} ms")
+
+        if current["throughput"] < previous["throughput"] * (1 - tolerance / 100):
+            found.append(f"{operation}: throughput {previous['throughput']:.1f}/s -> {current['throughput']:.1f}/s")
+
+    return found
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--workload", choices=["redirect", "create", "list", "bulk"], default="redirect")
+    parser.add_argument("--transport", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds of load per run")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent simulated users")
+    parser.add_argument("--seed", type=int, default=1000, help="Short URLs created before the run")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers (uvicorn transport only)")
+    parser.add_argument("--output", help="Also write the result to this file")
+    parser.add_argument("--baseline", help="Baseline result to compare against")
+    parser.add_argument("--tolerance", type=float, default=10, help="Allowed regression in percent")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the result as the new baseline")
+    arguments: argparse.Namespace = parser.parse_args()
+
+    if arguments.transport == "uvicorn" and arguments.workers > 1 and config.database.backend == "memory":
+        parser.error("--workers above 1 needs a shared backend: each worker would have its own in-memory store")
+
+    result: Dict[str, Any] = asyncio.run(run(
+        name=arguments.workload,
+        transport=arguments.transport,
+        duration=arguments.duration,
+        concurrency=arguments.concurrency,
+        seed=arguments.seed,
+        workers=arguments.workers
+    ))
+
+    print(json.dumps(result, indent=2))
+
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(result, file, indent=2)
+
+    if arguments.baseline and arguments.save_baseline:
+        with open(arguments.baseline, "w") as file:
+            json.dump(result, file, indent=2)
+    elif arguments.baseline:
+        with open(arguments.baseline) as file:
+            found: List[str] = regressions(result, json.load(file), arguments.tolerance)
+
+        if found:
+            print("Regressions beyond {}%:\n  {}".format(arguments.tolerance, "\n  ".join(found)), file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
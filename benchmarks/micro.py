@@ -0,0 +1,328 @@
+"""
+Microbenchmark hot functions and schemas in isolation.
+
+Each benchmark is warmed up, then timed in a number of samples of
+calibrated length with the garbage collector paused (as timeit does);
+per-call times are reported as median, mean, standard deviation, min and
+max. Database access is stubbed out, so no database is needed:
+    generate_code: random code generation (probe answered by a stub session)
+    base_short / response_short: model_validate from an ORM instance
+    response.<n>: Response construction and JSON serialization of n items
+    build_url: DatabaseConfig.build_url
+    redirect.hit / redirect.miss: redirect handler served from the cache
+                                  or from a stubbed repository
+    redirect.asgi.route / redirect.asgi.fast: a cached redirect through CORS
+                                              and routing, without and with
+                                              the redirect fast path
+
+With --history, medians are compared against the latest recorded run. A
+change counts when it exceeds --tolerance percent and three standard
+errors of the difference; the run fails (exit code 1) on slowdowns.
+--record appends the run to the history file.
+
+Usage:
+    python -m benchmarks.micro [--only response] [--repeat 20] [--warmup 0.2] [--min-time 0.02]
+                               [--history micro.jsonl] [--record] [--tolerance 5]
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import math
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from unittest import mock
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Scope
+
+from src.config import config
+from src.main import app
+from src.routers.redirect import RedirectMiddleware
+from src.routers.redirect.schemas import GetShortByCode, ResponseShort
+from src.routers.redirect.views import get_redirect
+from src.routers.schemas import Message as ResponseMessage, Response
+from src.routers.short.schemas import BaseShort
+from src.routers.short.service import Service
+
+from infrastructure.cache import redirect_cache, RedirectEntry
+from infrastructure.database.crud import ShortRepository
+from infrastructure.database.models import Short
+
+SIZES: List[int] = [1, 100, 10_000]
+
+Call = Callable[[], Any]
+
+
+class StubResult:
+    """Result of a statement executed by StubSession; never holds rows."""
+
+    def scalar_one_or_none(self) -> None:
+        return None
+
+
+class StubSession:
+    """Stand-in for AsyncSession that answers every statement with no rows."""
+
+    async def execute(self, *args: Any, **kwargs: Any) -> StubResult:
+        return StubResult()
+
+
+def short() -> Short:
+    now: datetime = datetime.now(tz=timezone.utc)
+
+    return Short(
+        id=uuid.uuid4(),
+        code="abc123",
+        url="https://example.com/some/long/path?with=query",
+        is_activated=True,
+        created_at=now,
+        last_updated_at=now,
+        expires_at=None
+    )
+
+
+def scope() -> Scope:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": "/redirects/abc123",
+        "raw_path": b"/redirects/abc123",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "scheme": "http",
+        "server": ("localhost", 80),
+        "http_version": "1.1",
+    }
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message: Message) -> None:
+    pass
+
+
+def cors_layer() -> ASGIApp:
+    """Find the application below any fast path: CORS, routing and the redirect route."""
+
+    layer: ASGIApp = app.build_middleware_stack()
+
+    while not isinstance(layer, CORSMiddleware):
+        layer = layer.app
+
+    return layer
+
+
+def benchmarks() -> Dict[str, Call]:
+    instance: Short = short()
+    entry: RedirectEntry = RedirectEntry(instance.id, instance.url, instance.is_activated, instance.expires_at)
+    service: Service = Service(strategy="random")
+    session: StubSession = StubSession()
+    model: GetShortByCode = GetShortByCode(code=instance.code)
+
+    async def redirect_hit() -> Any:
+        redirect_cache.set(model.code, entry)
+
+        return await get_redirect(model=model, request=Request(scope()))
+
+    async def redirect_miss() -> Any:
+        redirect_cache.delete(model.code)
+
+        return await get_redirect(model=model, request=Request(scope()))
+
+    routed: ASGIApp = cors_layer()
+    fast: ASGIApp = RedirectMiddleware(app=routed)
+
+    async def redirect_asgi(layer: ASGIApp) -> None:
+        redirect_cache.set(model.code, entry)
+
+        await layer(scope(), receive, send)
+
+    calls: Dict[str, Call] = {
+        "generate_code": lambda: service.generate_code(session=session),
+        "base_short": lambda: BaseShort.model_validate(instance),
+        "response_short": lambda: ResponseShort.model_validate(instance),
+        "build_url": lambda: config.database.build_url(host="localhost"),
+        "redirect.hit": redirect_hit,
+        "redirect.miss": redirect_miss,
+        "redirect.asgi.route": lambda: redirect_asgi(routed),
+        "redirect.asgi.fast": lambda: redirect_asgi(fast),
+    }
+
+    for size in SIZES:
+        shorts: List[Short] = [instance] * size
+
+        calls[f"response.{size}"] = lambda shorts=shorts: Response(
+            detail=[ResponseMessage(msg="Short URLs received")],
+            content=[BaseShort.model_validate(item) for item in shorts]
+        ).model_dump_json()
+
+    return calls
+
+
+def timer(call: Call, loop: asyncio.AbstractEventLoop) -> Callable[[int], float]:
+    """Build a function timing `number` consecutive calls, awaiting them when they return coroutines."""
+
+    probe: Any = call()
+
+    if not asyncio.iscoroutine(probe):
+        def run(number: int) -> float:
+            started: float = time.perf_counter()
+
+            for _ in range(number):
+                call()
+
+            return time.perf_counter() - started
+
+        return run
+
+    loop.run_until_complete(probe)
+
+    async def run_async(number: int) -> float:
+        started: float = time.perf_counter()
+
+        for _ in range(number):
+            await call()
+
+        return time.perf_counter() - started
+
+    return lambda number: loop.run_until_complete(run_async(number))
+
+
+def measure(call: Call, loop: asyncio.AbstractEventLoop, repeat: int, warmup: float, min_time: float) -> Dict[str, Any]:
+    run: Callable[[int], float] = timer(call=call, loop=loop)
+
+    deadline: float = time.perf_counter() + warmup
+
+    while time.perf_counter() < deadline:
+        run(1)
+
+    number: int = 1
+
+    while run(number) < min_time:
+        number *= 2
+
+    samples: List[float] = []
+
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+
+        try:
+            samples.append(run(number) / number)
+        finally:
+            gc.enable()
+
+    return {
+        "number": number,
+        "repeat": repeat,
+        "median_us": statistics.median(samples) * 1e6,
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "stdev_us": statistics.stdev(samples) * 1e6 if repeat > 1 else 0.0,
+        "min_us": min(samples) * 1e6,
+        "max_us": max(samples) * 1e6,
+    }
+
+
+def compare(current: Dict[str, Any], previous: Dict[str, Any], tolerance: float) -> Tuple[str, float]:
+    change: float = (current["median_us"] - previous["median_us"]) / previous["median_us"] * 100
+    error: float = math.sqrt(
+        current["stdev_us"] ** 2 / current["repeat"] + previous["stdev_us"] ** 2 / previous["repeat"]
+    )
+
+    if abs(current["median_us"] - previous["median_us"]) <= 3 * error or abs(change) <= tolerance:
+        return "unchanged", change
+
+    return "slower" if change > 0 else "faster", change
+
+
+def revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def latest(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path) as file:
+            lines: List[str] = [line for line in file if line.strip()]
+    except FileNotFoundError:
+        return None
+
+    return json.loads(lines[-1]) if lines else None
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--only", action="append", help="Run benchmarks whose name contains this (repeatable)")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed samples per benchmark")
+    parser.add_argument("--warmup", type=float, default=0.2, help="Seconds of untimed calls before sampling")
+    parser.add_argument("--min-time", type=float, default=0.02, help="Minimum seconds per sample")
+    parser.add_argument("--history", help="JSON lines file of previous runs to compare against")
+    parser.add_argument("--record", action="store_true", help="Append this run to the history file")
+    parser.add_argument("--tolerance", type=float, default=5, help="Ignored change in percent")
+    arguments: argparse.Namespace = parser.parse_args()
+
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    results: Dict[str, Dict[str, Any]] = {}
+
+    row: Tuple[Any, ...] = (
+        uuid.uuid4(), "https://example.com/some/long/path?with=query", True, None, datetime(2000, 1, 1, tzinfo=timezone.utc)
+    )
+
+    with mock.patch.object(ShortRepository, "get_redirect", mock.AsyncMock(return_value=row)):
+        for name, call in benchmarks().items():
+            if arguments.only and not any(part in name for part in arguments.only):
+                continue
+
+            results[name] = measure(
+                call=call, loop=loop, repeat=arguments.repeat, warmup=arguments.warmup, min_time=arguments.min_time
+            )
+
+    loop.close()
+
+    run: Dict[str, Any] = {
+        "recorded_at": datetime.now(tz=timezone.utc).isoformat(),
+        "revision": revision(),
+        "benchmarks": results,
+    }
+    regressed: bool = False
+
+    if arguments.history and (previous := latest(arguments.history)):
+        run["compared_to"] = previous["revision"]
+
+        for name, result in results.items():
+            if name in previous["benchmarks"]:
+                verdict, change = compare(result, previous["benchmarks"][name], arguments.tolerance)
+                result["change_percent"] = change
+                result["verdict"] = verdict
+                regressed |= verdict == "slower"
+
+    print(json.dumps(run, indent=2))
+
+    if arguments.history and arguments.record:
+        with open(arguments.history, "a") as file:
+            file.write(json.dumps(run) + "\n")
+
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare per-lookup CPU cost of resolving a redirect through the ORM and through the projected row.
+
+The ORM path loads the full Short entity and validates the response
+model from it, as the redirect endpoint used to; the projected path
+selects only the columns a redirect needs. CPU time is measured for this
+process only, so the database server's share is excluded. The created
+row is removed afterwards.
+
+Usage:
+    python -m benchmarks.redirect_lookup [--lookups 5000]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from typing import Any, Awaitable, Callable, Dict, List
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.cache import RedirectEntry
+from infrastructure.database import database
+from infrastructure.database.crud import ShortRepository
+from infrastructure.database.models import Short
+
+from src.routers.redirect.schemas import ResponseShort
+
+CODE: str = "bench0"
+
+
+async def orm(session: AsyncSession) -> None:
+    short: Short = await ShortRepository().get(session=session, target=Short.code, value=CODE)
+    ResponseShort.model_validate(short)
+
+
+async def projected(session: AsyncSession) -> None:
+    entry: RedirectEntry = RedirectEntry(*(await ShortRepository().get_redirect(session=session, code=CODE))[:4])
+    ResponseShort.model_validate(entry)
+
+
+async def measure(name: str, lookup: Callable[[AsyncSession], Awaitable[None]], lookups: int) -> Dict[str, Any]:
+    async with database.session_factory() as session:
+        for _ in range(100):
+            await lookup(session)
+
+        session.expunge_all()
+
+        cpu: float = time.process_time()
+        wall: float = time.perf_counter()
+
+        for _ in range(lookups):
+            await lookup(session)
+            session.expunge_all()
+
+        cpu = time.process_time() - cpu
+        wall = time.perf_counter() - wall
+
+    return {
+        "path": name,
+        "lookups": lookups,
+        "cpu_us_per_lookup": cpu / lookups * 1_000_000,
+        "wall_us_per_lookup": wall / lookups * 1_000_000,
+    }
+
+
+async def main(lookups: int) -> None:
+    async with database.session_factory() as session:
+        await ShortRepository().add(session=session, target=Short(code=CODE, url="https://example.com"))
+
+    try:
+        results: List[Dict[str, Any]] = [
+            await measure("orm", orm, lookups),
+            await measure("projected", projected, lookups),
+        ]
+    finally:
+        async with database.session_factory() as session:
+            await session.execute(delete(Short).where(Short.code == CODE))
+            await session.commit()
+
+    print(json.dumps(results, indent=2))
+
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lookups", type=int, default=5000, help="Number of lookups per path")
+    arguments: argparse.Namespace = parser.parse_args()
+
+    asyncio.run(main(lookups=arguments.lookups))
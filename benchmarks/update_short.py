@@ -0,0 +1,120 @@
+"""
+Compare latency of the previous four-statement short URL update and the single UPDATE ... RETURNING.
+
+Both flows are measured through the repository, the previous one being
+select by id, select by code, update and refresh. PUT /shorts/{id} is also
+driven through the application in-process for end-to-end numbers.
+Created rows are removed afterwards.
+
+Usage:
+    python -m benchmarks.update_short [--updates 2000]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from sqlalchemy import delete
+
+from infrastructure.database import database
+from infrastructure.database.crud import ShortRepository
+from infrastructure.database.models import Short
+
+from src.main import app
+
+
+def summarize(name: str, latencies: List[float]) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+
+    return {
+        "path": name,
+        "updates": len(latencies),
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+async def previous(short_id: str, updates: int) -> List[float]:
+    latencies: List[float] = []
+
+    for number in range(updates):
+        started: float = time.perf_counter()
+
+        async with database.session_factory() as session:
+            repository: ShortRepository = ShortRepository()
+            short: Optional[Short] = await repository.get(session=session, target=Short.id, value=short_id)
+            await repository.get(session=session, target=Short.code, value=None)
+            await repository.update(session=session, instance=short, url=f"https://example.com/{number}")
+
+        latencies.append(time.perf_counter() - started)
+
+    return latencies
+
+
+async def current(short_id: str, updates: int) -> List[float]:
+    latencies: List[float] = []
+
+    for number in range(updates):
+        started: float = time.perf_counter()
+
+        async with database.session_factory() as session:
+            await ShortRepository().update_returning(
+                session=session,
+                target=Short.id,
+                value=short_id,
+                previous=Short.code,
+                url=f"https://example.com/{number}"
+            )
+
+        latencies.append(time.perf_counter() - started)
+
+    return latencies
+
+
+async def endpoint(client: httpx.AsyncClient, short_id: str, updates: int) -> List[float]:
+    latencies: List[float] = []
+
+    for number in range(updates):
+        started: float = time.perf_counter()
+        await client.put(f"/shorts/{short_id}", headers={"id": short_id}, json={"url": f"https://example.com/{number}"})
+        latencies.append(time.perf_counter() - started)
+
+    return latencies
+
+
+async def main(updates: int) -> None:
+    transport: httpx.ASGITransport = httpx.ASGITransport(app=app)
+
+    async with app.router.lifespan_context(app), httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response: httpx.Response = await client.post("/shorts/", json={"url": "https://example.com"})
+        short_id: str = response.json()["content"][0]["id"]
+
+        try:
+            results: List[Dict[str, Any]] = [
+                summarize("previous", await previous(short_id, updates)),
+                summarize("current", await current(short_id, updates)),
+                summarize("endpoint", await endpoint(client, short_id, updates)),
+            ]
+        finally:
+            async with database.session_factory() as session:
+                await session.execute(delete(Short).where(Short.id == short_id))
+                await session.commit()
+
+    print(json.dumps(results, indent=2))
+
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--updates", type=int, default=2000, help="Number of updates per path")
+    arguments: argparse.Namespace = parser.parse_args()
+
+    asyncio.run(main(updates=arguments.updates))
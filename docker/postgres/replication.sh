@@ -0,0 +1,3 @@
+#!/bin/sh
+# Allow streaming replication connections from other containers.
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
@@ -0,0 +1,3 @@
+from .analytics import click_buffer
+
+__all__ = ["click_buffer"]
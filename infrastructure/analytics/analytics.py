@@ -0,0 +1,16 @@
+import uuid
+
+from typing import Tuple
+
+from src.config import config
+
+from .buffer import CounterBuffer
+
+click_buffer: CounterBuffer[Tuple[uuid.UUID, int]] = CounterBuffer(
+    max_size=config.clicks.max_buffer,
+    limit=config.clicks.buffer_limit
+)
+
+"""Redirect hits keyed by short URL identifier and hours since the epoch"""
+
+__all__ = ["click_buffer"]
@@ -0,0 +1,111 @@
+import asyncio
+
+from typing import Dict, Generic, Mapping, Optional, TypeVar
+
+K = TypeVar("K")
+
+
+class CounterBuffer(Generic[K]):
+    """
+    In-memory counters accumulated between periodic write-behind flushes.
+
+    Incrementing is a dictionary update, so the hot path never waits on
+    storage. Not thread-safe: meant to be used from a single event loop.
+
+    The buffer never holds more than `limit` distinct keys, so it cannot
+    grow without bound while flushes keep failing: counts of further keys
+    are dropped and added to `dropped`, while known keys keep counting.
+
+    Args:
+        max_size: Number of distinct keys that signals an early flush
+        limit: Maximum number of distinct keys held
+    """
+
+    def __init__(self, max_size: int, limit: int) -> None:
+        self._max_size: int = max_size
+        self._limit: int = limit
+        self._counts: Dict[K, int] = {}
+        self._full: asyncio.Event = asyncio.Event()
+
+        self.dropped: int = 0
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, key: K, amount: int = 1) -> None:
+        """
+        Increment the counter of a key.
+
+        Args:
+            key: Counted key
+            amount: Increment
+        """
+
+        if not self._merge(key, amount):
+            return
+
+        if len(self._counts) >= self._max_size:
+            self._full.set()
+
+    def drain(self) -> Dict[K, int]:
+        """
+        Take every buffered counter, leaving the buffer empty.
+
+        Returns:
+            Buffered counters
+        """
+
+        counts: Dict[K, int] = self._counts
+
+        self._counts = {}
+        self._full.clear()
+
+        return counts
+
+    def restore(self, counts: Mapping[K, int]) -> None:
+        """
+        Put back counters of a failed flush so they are retried.
+
+        Unlike `add`, this never signals a full buffer, so a failing flush
+        is not immediately retried.
+
+        Args:
+            counts: Counters previously returned by `drain`
+        """
+
+        for key, amount in counts.items():
+            self._merge(key, amount)
+
+    def _merge(self, key: K, amount: int) -> bool:
+        """
+        Add to the counter of a key, unless it is new and the buffer is at its limit.
+
+        Returns:
+            Whether the amount was counted rather than dropped
+        """
+
+        current: Optional[int] = self._counts.get(key)
+
+        if current is None and len(self._counts) >= self._limit:
+            self.dropped += amount
+            return False
+
+        self._counts[key] = amount if current is None else current + amount
+
+        return True
+
+    async def wait(self, timeout: float) -> None:
+        """
+        Wait until the buffer is full or the timeout elapses.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+        """
+
+        try:
+            await asyncio.wait_for(self._full.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+__all__ = ["CounterBuffer"]
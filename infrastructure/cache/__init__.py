@@ -0,0 +1,4 @@
+from .cache import redirect_cache, code_filter
+from .entries import RedirectEntry
+
+__all__ = ["redirect_cache", "code_filter", "RedirectEntry"]
@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+
+from typing import Any, Dict, Generic, Optional, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class BaseCache(ABC, Generic[K, V]):
+    """
+    Abstract base class for in-process cache implementations.
+
+    Type Parameters:
+        K: Key type
+        V: Value type
+    """
+
+    @abstractmethod
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get a cached value by key.
+
+        Must be implemented by concrete subclasses.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def set(self, key: K, value: V, *args: Any, **kwargs: Any) -> None:
+        """
+        Store a value under the given key.
+
+        Must be implemented by concrete subclasses.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete(self, key: K) -> None:
+        """
+        Remove a key from the cache if present.
+
+        Must be implemented by concrete subclasses.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+
+        Must be implemented by concrete subclasses.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache usage statistics.
+
+        Must be implemented by concrete subclasses.
+        """
+
+        raise NotImplementedError()
+
+
+__all__ = ["BaseCache", "K", "V"]
@@ -0,0 +1,147 @@
+import math
+
+from hashlib import blake2b
+
+from typing import Any, Dict, Iterator, List, Optional
+
+COUNTER_MAX: int = 255
+
+
+class CountingBloomFilter:
+    """
+    Probabilistic set membership filter over counting slots.
+
+    Each slot is a saturating 8-bit counter. Keys are never removed one by
+    one: a key that tests positive may be a false positive, or one added
+    through another worker, whose counters belong to other keys, and
+    decrementing them would turn live keys into false negatives. Removed
+    keys are dropped by rebuilding the filter instead. Lookups may return
+    false positives but never false negatives for added keys.
+
+    Until `ready` is set the filter answers "maybe" for every key.
+
+    Args:
+        capacity: Expected number of keys
+        error_rate: Target false-positive rate at full capacity
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self._capacity: int = capacity
+        self._error_rate: float = error_rate
+        self._size: int = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._hashes: int = max(1, round(self._size / capacity * math.log(2)))
+        self._counters: bytearray = bytearray(self._size)
+        self._pending: Optional[List[str]] = None
+
+        self.count: int = 0
+        self.ready: bool = False
+        self.rejections: int = 0
+        self.passes: int = 0
+
+    def _indexes(self, key: str) -> Iterator[int]:
+        digest: bytes = blake2b(key.encode(), digest_size=16).digest()
+
+        first: int = int.from_bytes(digest[:8], "little")
+        second: int = int.from_bytes(digest[8:], "little") | 1
+
+        return ((first + i * second) % self._size for i in range(self._hashes))
+
+    def __contains__(self, key: str) -> bool:
+        if not self.ready:
+            return True
+
+        counters: bytearray = self._counters
+
+        if all(counters[index] for index in self._indexes(key)):
+            self.passes += 1
+
+            return True
+
+        self.rejections += 1
+
+        return False
+
+    def add(self, key: str) -> None:
+        """
+        Add a key to the filter.
+
+        Args:
+            key: Key to add
+        """
+
+        counters: bytearray = self._counters
+
+        for index in self._indexes(key):
+            if counters[index] < COUNTER_MAX:
+                counters[index] += 1
+
+        self.count += 1
+
+        if self._pending is not None:
+            self._pending.append(key)
+
+    def clear(self) -> None:
+        """
+        Remove every key from the filter.
+        """
+
+        self._counters = bytearray(self._size)
+        self.count = 0
+
+    def spawn(self) -> "CountingBloomFilter":
+        """
+        Create an empty filter with the same parameters for a rebuild.
+
+        Keys added to this filter until `swap` is called are recorded and
+        replayed into the rebuilt filter.
+
+        Returns:
+            Empty filter to be filled and passed to `swap`
+        """
+
+        self._pending = []
+
+        return CountingBloomFilter(capacity=self._capacity, error_rate=self._error_rate)
+
+    def swap(self, other: "CountingBloomFilter") -> None:
+        """
+        Replace the contents of this filter with a rebuilt one.
+
+        Args:
+            other: Filter created by `spawn` and filled with current keys
+        """
+
+        pending: List[str] = self._pending or []
+        self._pending = None
+
+        for key in pending:
+            other.add(key)
+
+        self._counters = other._counters
+        self.count = other.count
+        self.ready = True
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get filter statistics.
+
+        Returns:
+            Key count, sizing, memory footprint, estimated false-positive rate and lookup outcomes
+        """
+
+        filled: int = self._size - self._counters.count(0)
+
+        return {
+            "ready": self.ready,
+            "count": self.count,
+            "capacity": self._capacity,
+            "hashes": self._hashes,
+            "memory_bytes": self._size,
+            "target_error_rate": self._error_rate,
+            "estimated_error_rate": (filled / self._size) ** self._hashes,
+            "rejections": self.rejections,
+            "passes": self.passes,
+        }
+
+
+__all__ = ["CountingBloomFilter"]
@@ -0,0 +1,30 @@
+from typing import Union
+
+from src.config import config
+
+from .bloom import CountingBloomFilter
+from .entries import RedirectEntry
+from .lru import LRUCache
+from .shared import SharedTable
+
+redirect_cache: Union[LRUCache[str, RedirectEntry], SharedTable]
+
+if config.cache.enabled and config.cache.shared and config.database.backend != "memory":
+    redirect_cache = SharedTable(
+        path=config.cache.shared_path,
+        max_size=config.cache.max_size,
+        ttl=config.cache.ttl,
+        heap_size=config.cache.shared_heap_size
+    )
+else:
+    redirect_cache = LRUCache(
+        max_size=config.cache.max_size if config.cache.enabled else 0,
+        ttl=config.cache.ttl
+    )
+
+code_filter: CountingBloomFilter = CountingBloomFilter(
+    capacity=config.filter.capacity if config.filter.enabled else 1,
+    error_rate=config.filter.error_rate
+)
+
+__all__ = ["redirect_cache", "code_filter"]
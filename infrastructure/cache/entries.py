@@ -0,0 +1,25 @@
+import uuid
+
+from datetime import datetime
+
+from typing import NamedTuple, Optional
+
+
+class RedirectEntry(NamedTuple):
+    """
+    Minimal short URL data needed to resolve a redirect.
+
+    Attributes:
+        id: Short URL identifier
+        url: Original long URL
+        is_activated: Whether the short URL is active
+        expires_at: Optional expiration datetime
+    """
+
+    id: uuid.UUID
+    url: str
+    is_activated: bool
+    expires_at: Optional[datetime]
+
+
+__all__ = ["RedirectEntry"]
@@ -0,0 +1,134 @@
+from collections import OrderedDict
+from itertools import islice
+from time import monotonic
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base import BaseCache, K, V
+
+
+class LRUCache(BaseCache[K, V]):
+    """
+    Bounded in-process cache with LRU eviction and per-entry TTL.
+
+    Not thread-safe: meant to be used from a single event loop.
+
+    Args:
+        max_size: Maximum number of entries (0 disables caching)
+        ttl: Default entry lifetime in seconds
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self._max_size: int = max_size
+        self._ttl: float = ttl
+        self._data: OrderedDict[K, Tuple[V, float]] = OrderedDict()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+
+        item: Optional[Tuple[V, float]] = self._data.get(key)
+
+        if item is None:
+            self.misses += 1
+            return None
+
+        value, deadline = item
+
+        if deadline <= monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entries if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Entry lifetime in seconds (default: cache TTL)
+        """
+
+        if self._max_size <= 0:
+            return
+
+        self._data[key] = (value, monotonic() + (self._ttl if ttl is None else ttl))
+        self._data.move_to_end(key)
+
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+    def hottest(self, count: int) -> List[Tuple[K, V, float]]:
+        """
+        Get the most recently used live entries without touching their recency or the counters.
+
+        Args:
+            count: Maximum number of entries
+
+        Returns:
+            Keys with their values and remaining lifetimes in seconds, most recently used first
+        """
+
+        now: float = monotonic()
+
+        return list(islice(
+            ((key, value, deadline - now) for key, (value, deadline) in reversed(self._data.items()) if deadline > now),
+            count
+        ))
+
+    def delete(self, key: K) -> None:
+        """
+        Remove a key from the cache if present.
+
+        Args:
+            key: Cache key
+        """
+
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+
+        self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache usage statistics.
+
+        Returns:
+            Size, capacity, hit and miss counters and hit ratio
+        """
+
+        lookups: int = self.hits + self.misses
+
+        return {
+            "size": len(self._data),
+            "max_size": self._max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+__all__ = ["LRUCache"]
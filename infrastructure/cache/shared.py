@@ -0,0 +1,588 @@
+import fcntl
+import math
+import mmap
+import os
+import random
+import struct
+import uuid
+import zlib
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from time import time
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .base import BaseCache
+from .entries import RedirectEntry
+
+MAGIC: bytes = b"RTBL"
+VERSION: int = 2
+
+CODE_SIZE: int = 8
+SPINS: int = 64
+SAMPLE: int = 16
+
+EMPTY: int = 0
+USED: int = 1
+
+# magic, version, reserved, slot count, URL heap size
+HEADER: struct.Struct = struct.Struct("<4sHHII")
+# reset sequence, odd while the table is being cleared
+EPOCH: struct.Struct = struct.Struct("<Q")
+EPOCH_OFFSET: int = 16
+# URL heap tail, used slots
+COUNTS: struct.Struct = struct.Struct("<II")
+COUNTS_OFFSET: int = 24
+SLOTS_OFFSET: int = 64
+
+# write sequence, odd while the slot is being written
+SEQUENCE: struct.Struct = struct.Struct("<Q")
+# code hash, state, is_activated, id, expires at (unix seconds, NaN if never),
+# cached until (unix seconds), code, URL heap offset, URL length
+BODY: struct.Struct = struct.Struct("<IBBxx16sdd8sII")
+SLOT: struct.Struct = struct.Struct("<QIBBxx16sdd8sII")
+KEY: struct.Struct = struct.Struct("<IB")
+DEADLINE: struct.Struct = struct.Struct("<d")
+DEADLINE_OFFSET: int = 40
+CODE_OFFSET: int = 48
+URL: struct.Struct = struct.Struct("<II")
+URL_OFFSET: int = 56
+
+EMPTY_BODY: Tuple[Any, ...] = (0, EMPTY, False, bytes(16), math.nan, 0.0, bytes(CODE_SIZE), 0, 0)
+
+
+class SharedTable(BaseCache[str, RedirectEntry]):
+    """
+    Redirect cache shared by all workers of a node through a memory-mapped file.
+
+    An open-addressing hash table with linear probing maps codes to fixed
+    64-byte slots; URLs live in a heap after the slots, referenced by
+    offset. Readers take no lock: every slot carries a sequence number a
+    writer makes odd while changing it, and readers retry when it was odd
+    or changed under them. Writers, in any worker, are serialized by a
+    record lock on the file. Stores through the mapping are assumed to
+    become visible to other processes in program order, as on x86-64.
+
+    Deletes shift the following entries of a probe sequence back instead
+    of leaving tombstones, and expired entries are overwritten by new
+    codes probing past them. A full table evicts the entry closest to its
+    deadline out of a random sample of slots; a full URL heap is compacted,
+    evicting entries the same way if live URLs alone do not leave room.
+    Readers that race with an entry being moved see a miss, never a wrong
+    entry.
+
+    Hit and miss counters belong to the current worker, everything else
+    to the node. The slot count and heap size are part of the file name,
+    so workers started with other sizes, e.g. during a rolling restart,
+    use a file of their own instead of resizing one in use.
+
+    Args:
+        path: Table file prefix, preferably on a memory filesystem such as /dev/shm
+        max_size: Maximum number of entries (0 disables caching)
+        ttl: Default entry lifetime in seconds
+        heap_size: Bytes reserved for URLs
+    """
+
+    def __init__(self, path: str, max_size: int, ttl: float, heap_size: int) -> None:
+        self._max_size: int = max_size
+        self._ttl: float = ttl
+        self._capacity: int = 1 << max(1, (2 * max_size - 1).bit_length())
+        self._mask: int = self._capacity - 1
+        self._heap_size: int = heap_size
+        self._heap_offset: int = SLOTS_OFFSET + self._capacity * SLOT.size
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self.path: str = f"{path}-v{VERSION}-{self._capacity}-{heap_size}"
+        size: int = self._heap_offset + heap_size
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        if not os.path.exists(self.path):
+            self._create(size)
+
+        self._fd: int = os.open(self.path, os.O_RDWR)
+
+        if os.fstat(self._fd).st_size != size:
+            os.close(self._fd)
+            raise ValueError(f"Shared redirect table {self.path} is not {size} bytes long")
+
+        self._view: mmap.mmap = mmap.mmap(self._fd, size)
+
+        with self._lock():
+            if HEADER.unpack_from(self._view) != (MAGIC, VERSION, 0, self._capacity, heap_size):
+                self._reset()
+                HEADER.pack_into(self._view, 0, MAGIC, VERSION, 0, self._capacity, heap_size)
+
+    def __len__(self) -> int:
+        return COUNTS.unpack_from(self._view, COUNTS_OFFSET)[1]
+
+    def _create(self, size: int) -> None:
+        """
+        Create the table file fully sized and initialized under a per-process
+        name, then link it into place unless another worker was first.
+        """
+
+        temporary: str = f"{self.path}.{os.getpid()}.tmp"
+        fd: int = os.open(temporary, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+
+        try:
+            os.ftruncate(fd, size)
+
+            with mmap.mmap(fd, size) as view:
+                HEADER.pack_into(view, 0, MAGIC, VERSION, 0, self._capacity, self._heap_size)
+
+            try:
+                os.link(temporary, self.path)
+            except FileExistsError:
+                pass
+        finally:
+            os.close(fd)
+            os.unlink(temporary)
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """
+        Hold the table's write lock. Record locks belong to the process, so
+        forked workers inheriting the descriptor still exclude each other.
+        """
+
+        fcntl.lockf(self._fd, fcntl.LOCK_EX)
+
+        try:
+            yield
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    def get(self, key: str) -> Optional[RedirectEntry]:
+        """
+        Get a cached entry without taking the write lock.
+
+        Args:
+            key: Short code
+
+        Returns:
+            Cached entry or None if missing, expired or unreadable while being rewritten
+        """
+
+        encoded: bytes = key.encode()
+
+        if len(encoded) > CODE_SIZE:
+            self.misses += 1
+            return None
+
+        padded: bytes = encoded.ljust(CODE_SIZE, b"\0")
+        code_hash: int = zlib.crc32(encoded)
+        view: mmap.mmap = self._view
+
+        for _ in range(SPINS):
+            epoch: int = EPOCH.unpack_from(view, EPOCH_OFFSET)[0]
+
+            if epoch & 1:
+                continue
+
+            slot: Optional[Tuple[Any, ...]] = None
+            url: bytes = b""
+            index: int = code_hash & self._mask
+            probes: int = 0
+            spins: int = 0
+
+            while probes < self._capacity and spins < SPINS:
+                position: int = SLOTS_OFFSET + index * SLOT.size
+                fields: Tuple[Any, ...] = SLOT.unpack_from(view, position)
+                sequence, slot_hash, state = fields[:3]
+
+                if sequence & 1:
+                    spins += 1
+                    continue
+
+                if state == EMPTY:
+                    break
+
+                if state == USED and slot_hash == code_hash and fields[7] == padded:
+                    url = view[self._heap_offset + fields[8]:self._heap_offset + fields[8] + fields[9]]
+
+                    if SEQUENCE.unpack_from(view, position)[0] != sequence:
+                        spins += 1
+                        continue
+
+                    slot = fields
+                    break
+
+                index = (index + 1) & self._mask
+                probes += 1
+
+            if spins >= SPINS or EPOCH.unpack_from(view, EPOCH_OFFSET)[0] != epoch:
+                continue
+
+            if slot is None or slot[6] <= time():
+                break
+
+            self.hits += 1
+
+            return RedirectEntry(
+                id=uuid.UUID(bytes=slot[4]),
+                url=url.decode(),
+                is_activated=bool(slot[3]),
+                expires_at=None if math.isnan(slot[5]) else datetime.fromtimestamp(slot[5], tz=timezone.utc)
+            )
+
+        self.misses += 1
+
+        return None
+
+    def set(self, key: str, value: RedirectEntry, ttl: Optional[float] = None) -> None:
+        """
+        Store an entry, evicting others if the table or its URL heap is full.
+
+        Args:
+            key: Short code
+            value: Entry to store
+            ttl: Entry lifetime in seconds (default: cache TTL)
+        """
+
+        encoded: bytes = key.encode()
+        url: bytes = value.url.encode()
+
+        if self._max_size <= 0 or len(encoded) > CODE_SIZE or len(url) > self._heap_size:
+            return
+
+        code_hash: int = zlib.crc32(encoded)
+        padded: bytes = encoded.ljust(CODE_SIZE, b"\0")
+
+        with self._lock():
+            if EPOCH.unpack_from(self._view, EPOCH_OFFSET)[0] & 1:
+                self._reset()
+
+            now: float = time()
+            position, state = self._find(code_hash, padded, now)
+
+            if state == EMPTY and len(self) >= self._max_size:
+                self._evict(now)
+                position, state = self._find(code_hash, padded, now)
+
+            if COUNTS.unpack_from(self._view, COUNTS_OFFSET)[0] + len(url) > self._heap_size:
+                self._compact(now, len(url))
+                position, state = self._find(code_hash, padded, now)
+
+            tail, used = COUNTS.unpack_from(self._view, COUNTS_OFFSET)
+
+            self._view[self._heap_offset + tail:self._heap_offset + tail + len(url)] = url
+
+            with self._writing(position):
+                BODY.pack_into(
+                    self._view,
+                    position + SEQUENCE.size,
+                    code_hash,
+                    USED,
+                    value.is_activated,
+                    value.id.bytes,
+                    value.expires_at.timestamp() if value.expires_at is not None else math.nan,
+                    now + (self._ttl if ttl is None else ttl),
+                    padded,
+                    tail,
+                    len(url)
+                )
+
+            COUNTS.pack_into(self._view, COUNTS_OFFSET, tail + len(url), used + (state == EMPTY))
+
+    def hottest(self, count: int) -> List[Tuple[str, RedirectEntry, float]]:
+        """
+        Get live entries without taking the write lock or touching the counters.
+
+        The table keeps no recency, so entries come in table order.
+
+        Args:
+            count: Maximum number of entries
+
+        Returns:
+            Codes with their entries and remaining lifetimes in seconds
+        """
+
+        entries: List[Tuple[str, RedirectEntry, float]] = []
+        now: float = time()
+
+        with memoryview(self._view) as buffer:
+            for index, fields in enumerate(SLOT.iter_unpack(buffer[SLOTS_OFFSET:self._heap_offset])):
+                if len(entries) >= count:
+                    break
+
+                sequence, _, state, is_activated, identifier, expires_at, deadline, code, offset, length = fields
+
+                if sequence & 1 or state != USED or deadline <= now:
+                    continue
+
+                url: bytes = self._view[self._heap_offset + offset:self._heap_offset + offset + length]
+
+                if SEQUENCE.unpack_from(self._view, SLOTS_OFFSET + index * SLOT.size)[0] != sequence:
+                    continue
+
+                entries.append((code.rstrip(b"\0").decode(), RedirectEntry(
+                    id=uuid.UUID(bytes=identifier),
+                    url=url.decode(),
+                    is_activated=bool(is_activated),
+                    expires_at=None if math.isnan(expires_at) else datetime.fromtimestamp(expires_at, tz=timezone.utc)
+                ), deadline - now))
+
+        return entries
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a code from the table if present.
+
+        Args:
+            key: Short code
+        """
+
+        encoded: bytes = key.encode()
+
+        if len(encoded) > CODE_SIZE:
+            return
+
+        code_hash: int = zlib.crc32(encoded)
+
+        with self._lock():
+            if EPOCH.unpack_from(self._view, EPOCH_OFFSET)[0] & 1:
+                self._reset()
+                return
+
+            position, found = self._locate(code_hash, encoded.ljust(CODE_SIZE, b"\0"))
+
+            if found:
+                self._remove(position)
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the table, for every worker.
+        """
+
+        with self._lock():
+            self._reset()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache usage statistics.
+
+        Returns:
+            Size, capacity, URL heap usage, hit and miss counters and hit ratio
+        """
+
+        lookups: int = self.hits + self.misses
+        tail, used = COUNTS.unpack_from(self._view, COUNTS_OFFSET)
+
+        return {
+            "size": used,
+            "max_size": self._max_size,
+            "url_bytes": tail,
+            "url_capacity": self._heap_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _position(self, index: int) -> int:
+        return SLOTS_OFFSET + index * SLOT.size
+
+    def _locate(self, code_hash: int, padded: bytes) -> Tuple[int, bool]:
+        """
+        Find the slot of a code. Called under the write lock.
+
+        Returns:
+            Position of the code's slot, or of the empty slot ending its probe sequence, and whether it was found
+        """
+
+        index: int = code_hash & self._mask
+
+        while True:
+            position: int = self._position(index)
+            slot_hash, state = KEY.unpack_from(self._view, position + SEQUENCE.size)
+
+            if state == EMPTY:
+                return position, False
+
+            code: bytes = self._view[position + CODE_OFFSET:position + CODE_OFFSET + CODE_SIZE]
+
+            if slot_hash == code_hash and code == padded:
+                return position, True
+
+            index = (index + 1) & self._mask
+
+    def _find(self, code_hash: int, padded: bytes, now: float) -> Tuple[int, int]:
+        """
+        Find the slot to store a code in: its own, else the first expired
+        slot of its probe sequence, else the empty one ending it. Called
+        under the write lock.
+
+        Returns:
+            Slot position and its state; USED if it holds the code or an expired entry
+        """
+
+        position, found = self._locate(code_hash, padded)
+
+        if found:
+            return position, USED
+
+        index: int = code_hash & self._mask
+
+        while (candidate := self._position(index)) != position:
+            if DEADLINE.unpack_from(self._view, candidate + DEADLINE_OFFSET)[0] <= now:
+                return candidate, USED
+
+            index = (index + 1) & self._mask
+
+        return position, EMPTY
+
+    def _remove(self, position: int) -> None:
+        """
+        Empty a slot, shifting later entries of its probe sequence back
+        into the gap so no tombstone is needed. Called under the write lock.
+        """
+
+        hole: int = (position - SLOTS_OFFSET) // SLOT.size
+        index: int = hole
+
+        while True:
+            index = (index + 1) & self._mask
+            slot_hash, state = KEY.unpack_from(self._view, self._position(index) + SEQUENCE.size)
+
+            if state == EMPTY:
+                break
+
+            home: int = slot_hash & self._mask
+
+            # Entries whose probe sequence starts after the hole stay reachable where they are
+            if (home - hole - 1) & self._mask < (index - hole) & self._mask:
+                continue
+
+            fields: Tuple[Any, ...] = BODY.unpack_from(self._view, self._position(index) + SEQUENCE.size)
+
+            with self._writing(self._position(hole)):
+                BODY.pack_into(self._view, self._position(hole) + SEQUENCE.size, *fields)
+
+            hole = index
+
+        with self._writing(self._position(hole)):
+            BODY.pack_into(self._view, self._position(hole) + SEQUENCE.size, *EMPTY_BODY)
+
+        tail, used = COUNTS.unpack_from(self._view, COUNTS_OFFSET)
+        COUNTS.pack_into(self._view, COUNTS_OFFSET, tail, used - 1)
+
+    def _evict(self, now: float) -> int:
+        """
+        Remove the entry closest to its deadline, expired ones first, out of
+        a sample of slots starting at a random one. Called under the write lock.
+
+        Returns:
+            Length of the evicted entry's URL
+        """
+
+        index: int = random.getrandbits(32) & self._mask
+        victim: int = -1
+        deadline: float = math.inf
+        seen: int = 0
+
+        for _ in range(self._capacity):
+            position: int = self._position(index)
+
+            if KEY.unpack_from(self._view, position + SEQUENCE.size)[1] == USED:
+                candidate: float = DEADLINE.unpack_from(self._view, position + DEADLINE_OFFSET)[0]
+                seen += 1
+
+                if candidate < deadline:
+                    victim, deadline = position, candidate
+
+                if seen >= SAMPLE or candidate <= now:
+                    break
+
+            index = (index + 1) & self._mask
+
+        if victim < 0:
+            return 0
+
+        length: int = URL.unpack_from(self._view, victim + URL_OFFSET)[1]
+        self._remove(victim)
+
+        return length
+
+    def _compact(self, now: float, needed: int) -> None:
+        """
+        Drop expired entries and slide live URLs to the start of the heap,
+        evicting entries first if they would still leave less than `needed`
+        bytes free. Called under the write lock.
+        """
+
+        live: int = 0
+        expired: List[Tuple[int, bytes]] = []
+
+        for index in range(self._capacity):
+            position: int = self._position(index)
+            slot_hash, state = KEY.unpack_from(self._view, position + SEQUENCE.size)
+
+            if state != USED:
+                continue
+
+            if DEADLINE.unpack_from(self._view, position + DEADLINE_OFFSET)[0] <= now:
+                expired.append((slot_hash, self._view[position + CODE_OFFSET:position + CODE_OFFSET + CODE_SIZE]))
+            else:
+                live += URL.unpack_from(self._view, position + URL_OFFSET)[1]
+
+        # Removing shifts entries back, so expired ones are located again by code
+        for slot_hash, padded in expired:
+            self._remove(self._locate(slot_hash, padded)[0])
+
+        while live + needed > self._heap_size and len(self):
+            live -= self._evict(now)
+
+        entries: List[Tuple[int, int, int]] = sorted(
+            (*URL.unpack_from(self._view, self._position(index) + URL_OFFSET), self._position(index))
+            for index in range(self._capacity)
+            if KEY.unpack_from(self._view, self._position(index) + SEQUENCE.size)[1] == USED
+        )
+        tail: int = 0
+
+        for offset, length, position in entries:
+            if offset != tail:
+                # The slot stays odd while its URL moves, so readers holding the old offset retry
+                with self._writing(position):
+                    self._view[self._heap_offset + tail:self._heap_offset + tail + length] = \
+                        self._view[self._heap_offset + offset:self._heap_offset + offset + length]
+                    URL.pack_into(self._view, position + URL_OFFSET, tail, length)
+
+            tail += length
+
+        COUNTS.pack_into(self._view, COUNTS_OFFSET, tail, len(self))
+
+    @contextmanager
+    def _writing(self, position: int) -> Iterator[None]:
+        """
+        Keep a slot's sequence odd while it is rewritten. Called under the write lock.
+        """
+
+        sequence: int = SEQUENCE.unpack_from(self._view, position)[0]
+        # An odd sequence was left by a writer that died mid-write; move past it
+        sequence += 1 if sequence % 2 == 0 else 2
+
+        SEQUENCE.pack_into(self._view, position, sequence)
+
+        try:
+            yield
+        finally:
+            SEQUENCE.pack_into(self._view, position, sequence + 1)
+
+    def _reset(self) -> None:
+        """
+        Empty every slot and the URL heap, keeping the epoch odd meanwhile. Called under the write lock.
+        """
+
+        epoch: int = EPOCH.unpack_from(self._view, EPOCH_OFFSET)[0]
+        epoch += 1 if epoch % 2 == 0 else 2
+
+        EPOCH.pack_into(self._view, EPOCH_OFFSET, epoch)
+        self._view[SLOTS_OFFSET:self._heap_offset] = bytes(self._heap_offset - SLOTS_OFFSET)
+        COUNTS.pack_into(self._view, COUNTS_OFFSET, 0, 0)
+        EPOCH.pack_into(self._view, EPOCH_OFFSET, epoch + 1)
+
+
+__all__ = ["SharedTable"]
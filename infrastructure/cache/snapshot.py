@@ -0,0 +1,154 @@
+import math
+import mmap
+import os
+import struct
+import uuid
+import zlib
+
+from datetime import datetime, timezone
+from hashlib import blake2b
+from time import time
+
+from typing import Iterable, List, Tuple
+
+from .entries import RedirectEntry
+
+MAGIC: bytes = b"HOTS"
+VERSION: int = 2
+
+# magic, version, reserved, source fingerprint, written at (unix seconds), entry count,
+# CRC-32 of the preceding header fields and the entries
+HEADER: struct.Struct = struct.Struct("<4sHHQdII")
+# id, is_activated, code length, url length, expires at (unix seconds, NaN if never), cached until (unix seconds)
+RECORD: struct.Struct = struct.Struct("<16sBBIdd")
+
+
+def write_snapshot(path: str, entries: Iterable[Tuple[str, RedirectEntry, float]], source: int) -> int:
+    """
+    Write redirect entries to a snapshot file, atomically replacing the previous one.
+
+    The file is written next to the target under a per-process name and
+    renamed over it, so readers, including other workers writing their
+    own snapshots, never see a partial file.
+
+    Args:
+        path: Snapshot file
+        entries: Codes with their entries and remaining cache lifetimes in seconds, hottest first
+        source: Fingerprint of the database the entries come from
+
+    Returns:
+        Number of written entries
+    """
+
+    chunks: List[bytes] = []
+    written_at: float = time()
+
+    for code, entry, lifetime in entries:
+        encoded_code: bytes = code.encode()
+        encoded_url: bytes = entry.url.encode()
+        expires_at: float = entry.expires_at.timestamp() if entry.expires_at is not None else math.nan
+
+        chunks.append(RECORD.pack(
+            entry.id.bytes, entry.is_activated, len(encoded_code), len(encoded_url), expires_at, written_at + lifetime
+        ))
+        chunks.append(encoded_code)
+        chunks.append(encoded_url)
+
+    payload: bytes = b"".join(chunks)
+    count: int = len(chunks) // 3
+    temporary: str = f"{path}.{os.getpid()}.tmp"
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    header: bytes = HEADER.pack(MAGIC, VERSION, 0, source, written_at, count, 0)[:-4]
+
+    with open(temporary, "wb") as file:
+        file.write(header)
+        file.write(struct.pack("<I", zlib.crc32(payload, zlib.crc32(header))))
+        file.write(payload)
+
+    os.replace(temporary, path)
+
+    return count
+
+
+def read_snapshot(path: str, source: int, max_age: float) -> List[Tuple[str, RedirectEntry, float]]:
+    """
+    Read redirect entries from a snapshot file through a memory map.
+
+    Snapshots of another format version or database, older than `max_age`
+    or failing their checksum are ignored, and so are entries whose cache
+    lifetime ran out since they were written.
+
+    Args:
+        path: Snapshot file
+        source: Fingerprint of the database the entries must come from
+        max_age: Maximum age of the snapshot in seconds
+
+    Returns:
+        Codes with their entries and remaining cache lifetimes in seconds, hottest first;
+        empty if the snapshot is missing or unusable
+
+    Raises:
+        OSError: If the file exists but cannot be read
+    """
+
+    try:
+        file = open(path, "rb")
+    except FileNotFoundError:
+        return []
+
+    with file:
+        if os.fstat(file.fileno()).st_size < HEADER.size:
+            return []
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            magic, version, _, written_by, written_at, count, checksum = HEADER.unpack_from(view)
+
+            now: float = time()
+
+            if magic != MAGIC or version != VERSION or written_by != source or now - written_at > max_age:
+                return []
+
+            with memoryview(view) as buffer:
+                if zlib.crc32(buffer[HEADER.size:], zlib.crc32(buffer[:HEADER.size - 4])) != checksum:
+                    return []
+
+            entries: List[Tuple[str, RedirectEntry, float]] = []
+            offset: int = HEADER.size
+
+            for _ in range(count):
+                (identifier, is_activated, code_length, url_length,
+                 expires_at, cached_until) = RECORD.unpack_from(view, offset)
+                offset += RECORD.size
+
+                code: str = view[offset:offset + code_length].decode()
+                offset += code_length
+                url: str = view[offset:offset + url_length].decode()
+                offset += url_length
+
+                if cached_until <= now:
+                    continue
+
+                entries.append((code, RedirectEntry(
+                    id=uuid.UUID(bytes=identifier),
+                    url=url,
+                    is_activated=bool(is_activated),
+                    expires_at=None if math.isnan(expires_at) else datetime.fromtimestamp(expires_at, tz=timezone.utc)
+                ), cached_until - now))
+
+            return entries
+
+
+def fingerprint(identity: str) -> int:
+    """
+    Derive the 64-bit fingerprint stored in snapshots from a database identity.
+
+    Args:
+        identity: Text identifying the database, e.g. its URL without credentials
+    """
+
+    return int.from_bytes(blake2b(identity.encode(), digest_size=8).digest(), "little")
+
+
+__all__ = ["write_snapshot", "read_snapshot", "fingerprint"]
@@ -1,3 +1,5 @@
 from .short import ShortRepository
+from .reservation import ReservationRepository
+from .click import ClickRepository
 
-__all__ = ["ShortRepository"]
+__all__ = ["ShortRepository", "ReservationRepository", "ClickRepository"]
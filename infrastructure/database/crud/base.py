@@ -1,9 +1,10 @@
-from typing import Any, Optional, Sequence
+from typing import Any, Optional, Sequence, Tuple
 
-from sqlalchemy import Result, Select
+from sqlalchemy import Column, Result, Select, delete, inspect, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
 
+from infrastructure.database.dialect import is_postgres
 from infrastructure.database.models import Base
 
 from .abc import AbstractRepository, T
@@ -92,6 +93,82 @@ class BaseRepository(AbstractRepository[T]):
 
         return instance
 
+    async def update_returning(
+            self, session: AsyncSession, target: InstrumentedAttribute[Any], value: Any,
+            previous: Optional[InstrumentedAttribute[Any]] = None, **update_data: Any
+    ) -> Optional[Tuple[T, Any]]:
+        """
+        Update the instance matching a specific attribute value in a single statement.
+
+        Issues one UPDATE ... RETURNING instead of loading the instance first,
+        flushing it and refreshing it afterwards. The pre-update value of
+        `previous` is read from a locked subquery of the same statement on
+        PostgreSQL.
+
+        Args:
+            session: Async database session
+            target: Model attribute to filter by
+            value: Value to match against the target attribute
+            previous: Model attribute to return the pre-update value of
+            **update_data: Field-value pairs to update
+
+        Returns:
+            The updated model instance and the pre-update value of `previous`
+            (None if not requested), or None if nothing matched
+        """
+
+        if not is_postgres:
+            return await self._update_returning_portable(session, target, value, previous, **update_data)
+
+        primary_key: Column = inspect(self.model).primary_key[0]
+        old = (
+            Select(primary_key, *([previous] if previous is not None else []))
+            .where(target == value)
+            .with_for_update()
+            .subquery()
+        )
+
+        result: Result = await session.execute(
+            update(self.model)
+            .where(primary_key == old.c[primary_key.name])
+            .values(**update_data)
+            .returning(self.model, *([old.c[previous.key]] if previous is not None else []))
+            .execution_options(synchronize_session=False)
+        )
+        row = result.one_or_none()
+
+        await session.commit()
+
+        if row is None:
+            return None
+
+        return row[0], (row[1] if previous is not None else None)
+
+    async def _update_returning_portable(
+            self, session: AsyncSession, target: InstrumentedAttribute[Any], value: Any,
+            previous: Optional[InstrumentedAttribute[Any]] = None, **update_data: Any
+    ) -> Optional[Tuple[T, Any]]:
+        # SQLite cannot return columns of other tables from UPDATE ... FROM,
+        # so the pre-update value is read by a separate statement first.
+
+        prior: Any = await session.scalar(Select(previous).where(target == value)) if previous is not None else None
+
+        result: Result = await session.execute(
+            update(self.model)
+            .where(target == value)
+            .values(**update_data)
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        instance: Optional[T] = result.scalar_one_or_none()
+
+        await session.commit()
+
+        if instance is None:
+            return None
+
+        return instance, prior
+
     async def delete(self, session: AsyncSession, target: T) -> T:
         """
         Delete a model instance from the database.
@@ -110,5 +187,51 @@ class BaseRepository(AbstractRepository[T]):
 
         return target
 
+    async def delete_all(self, session: AsyncSession) -> int:
+        """
+        Delete every instance of the model in a single statement.
+
+        Args:
+            session: Async database session
+
+        Returns:
+            Number of deleted rows
+        """
+
+        result: Result = await session.execute(delete(self.model))
+
+        await session.commit()
+
+        return result.rowcount
+
+    async def delete_chunk(self, session: AsyncSession, size: int) -> Sequence[T]:
+        """
+        Delete up to `size` instances of the model in a single statement.
+
+        Each chunk is committed on its own, so repeated calls wipe a table of
+        any size without holding it in memory or in one long transaction.
+
+        Args:
+            session: Async database session
+            size: Maximum number of rows to delete
+
+        Returns:
+            The deleted model instances (empty once the table is empty)
+        """
+
+        primary_key: Column = inspect(self.model).primary_key[0]
+
+        result: Result = await session.execute(
+            delete(self.model)
+            .where(primary_key.in_(Select(primary_key).limit(size)))
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        deleted: Sequence[T] = result.scalars().all()
+
+        await session.commit()
+
+        return deleted
+
 
 __all__ = ["BaseRepository"]
@@ -0,0 +1,167 @@
+import uuid
+
+from datetime import datetime
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Union
+
+from sqlalchemy import CTE, BigInteger, Result, Select, UUID, column, delete, func, select, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database.dialect import insert
+from infrastructure.database.models import ShortClick, ShortClickHourly, ShortClickDaily, Short
+from infrastructure.database.types import UTCDateTime
+
+from .base import BaseRepository
+
+Rollup = Union[Type[ShortClickHourly], Type[ShortClickDaily]]
+
+
+class ClickRepository(BaseRepository[ShortClick]):
+    model = ShortClick
+
+    @staticmethod
+    def _buffered(rows: List[Tuple[Any, ...]], bucketed: bool) -> CTE:
+        columns = [column("short_id", UUID(as_uuid=True))]
+
+        if bucketed:
+            columns.append(column("bucket", UTCDateTime()))
+
+        columns.append(column("hits", BigInteger))
+
+        return values(*columns, name="buffered").data(rows).cte("buffered")
+
+    @staticmethod
+    async def _add_totals(session: AsyncSession, totals: Mapping[uuid.UUID, int]) -> None:
+        buffered: CTE = ClickRepository._buffered(sorted(totals.items()), bucketed=False)
+
+        statement = insert(ShortClick).from_select(
+            ["short_id", "hits", "last_clicked_at"],
+            select(buffered.c.short_id, buffered.c.hits, func.now())
+            .join(Short, Short.id == buffered.c.short_id)
+            .order_by(buffered.c.short_id)
+        )
+
+        await session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[ShortClick.short_id],
+                set_={
+                    "hits": ShortClick.hits + statement.excluded.hits,
+                    "last_clicked_at": statement.excluded.last_clicked_at,
+                }
+            )
+        )
+
+    @staticmethod
+    async def _add_buckets(
+            session: AsyncSession, model: Rollup, buckets: Mapping[Tuple[uuid.UUID, datetime], int]
+    ) -> None:
+        buffered: CTE = ClickRepository._buffered(
+            [(short_id, bucket, hits) for (short_id, bucket), hits in sorted(buckets.items())],
+            bucketed=True
+        )
+
+        statement = insert(model).from_select(
+            ["short_id", "bucket", "hits"],
+            select(buffered.c.short_id, buffered.c.bucket, buffered.c.hits)
+            .join(Short, Short.id == buffered.c.short_id)
+            .order_by(buffered.c.short_id, buffered.c.bucket)
+        )
+
+        await session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[model.short_id, model.bucket],
+                set_={"hits": model.hits + statement.excluded.hits}
+            )
+        )
+
+    async def add_hits(self, session: AsyncSession, hits: Mapping[Tuple[uuid.UUID, datetime], int]) -> None:
+        """
+        Add buffered hits to the counters and rollups of many short URLs and commit.
+
+        Totals, hourly and daily rollups are each updated with a single
+        upsert statement. Rows are upserted in (short URL, bucket) order so
+        concurrent flushes from several workers lock them in the same order
+        instead of deadlocking. Hits of short URLs deleted in the meantime are dropped.
+
+        Args:
+            session: Async database session
+            hits: Number of new hits per short URL identifier and hour bucket (UTC)
+        """
+
+        totals: Dict[uuid.UUID, int] = {}
+        daily: Dict[Tuple[uuid.UUID, datetime], int] = {}
+
+        for (short_id, hour), amount in hits.items():
+            day: datetime = hour.replace(hour=0)
+
+            totals[short_id] = totals.get(short_id, 0) + amount
+            daily[(short_id, day)] = daily.get((short_id, day), 0) + amount
+
+        await self._add_totals(session=session, totals=totals)
+        await self._add_buckets(session=session, model=ShortClickHourly, buckets=hits)
+        await self._add_buckets(session=session, model=ShortClickDaily, buckets=daily)
+
+        await session.commit()
+
+    async def get_buckets(
+            self,
+            session: AsyncSession,
+            model: Rollup,
+            short_id: uuid.UUID,
+            start: Optional[datetime] = None,
+            end: Optional[datetime] = None
+    ) -> Sequence[Tuple[datetime, int]]:
+        """
+        Retrieve rollup buckets of a short URL within a time range.
+
+        Args:
+            session: Async database session
+            model: Hourly or daily rollup model
+            short_id: Short URL identifier
+            start: Include buckets starting at or after this moment
+            end: Include buckets starting before this moment
+
+        Returns:
+            (bucket, hits) pairs ordered by bucket
+        """
+
+        statement: Select = (
+            select(model.bucket, model.hits)
+            .where(model.short_id == short_id)
+            .order_by(model.bucket)
+        )
+
+        if start is not None:
+            statement = statement.where(model.bucket >= start)
+
+        if end is not None:
+            statement = statement.where(model.bucket < end)
+
+        result: Result = await session.execute(statement)
+
+        return result.tuples().all()
+
+    async def prune_hourly(self, session: AsyncSession, before: datetime) -> int:
+        """
+        Delete hourly buckets older than a moment and commit.
+
+        Their hits are already accounted for in the daily rollups.
+
+        Args:
+            session: Async database session
+            before: Delete buckets starting before this moment
+
+        Returns:
+            Number of deleted buckets
+        """
+
+        result: Result = await session.execute(
+            delete(ShortClickHourly).where(ShortClickHourly.bucket < before)
+        )
+
+        await session.commit()
+
+        return result.rowcount
+
+
+__all__ = ["ClickRepository"]
@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+from typing import Collection, Sequence
+
+from sqlalchemy import Result, String, column, delete, exists, func, literal, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database.models import CodeReservation, Short
+
+from .base import BaseRepository
+
+
+class ReservationRepository(BaseRepository[CodeReservation]):
+    model = CodeReservation
+
+    async def reserve(
+            self, session: AsyncSession, codes: Collection[str], owner: str, lease: timedelta
+    ) -> Sequence[str]:
+        """
+        Reserve candidate codes that are neither used nor reserved, in one statement.
+
+        Args:
+            session: Async database session
+            codes: Candidate codes
+            owner: Identifier of the reserving worker
+            lease: Reservation lifetime unless renewed
+
+        Returns:
+            Candidate codes that were reserved
+        """
+
+        candidates = values(column("code", String), name="candidates").data([(code,) for code in codes])
+
+        result: Result = await session.execute(
+            insert(CodeReservation)
+            .from_select(
+                ["code", "owner", "leased_until"],
+                select(candidates.c.code, literal(owner), func.now() + lease)
+                .where(~exists().where(Short.code == candidates.c.code))
+            )
+            .on_conflict_do_nothing(index_elements=[CodeReservation.code])
+            .returning(CodeReservation.code)
+        )
+        reserved: Sequence[str] = result.scalars().all()
+
+        await session.commit()
+
+        return reserved
+
+    async def renew(
+            self, session: AsyncSession, codes: Collection[str], owner: str, lease: timedelta
+    ) -> None:
+        """
+        Extend the lease of codes still held by a worker.
+
+        Args:
+            session: Async database session
+            codes: Codes still held unused by the worker
+            owner: Identifier of the worker
+            lease: New reservation lifetime
+        """
+
+        await session.execute(
+            update(CodeReservation)
+            .where(CodeReservation.owner == owner, CodeReservation.code.in_(codes))
+            .values(leased_until=func.now() + lease)
+        )
+
+        await session.commit()
+
+    async def reclaim(self, session: AsyncSession) -> int:
+        """
+        Delete reservations whose lease has expired.
+
+        Covers codes that were used and codes leaked by workers that
+        stopped without releasing them.
+
+        Args:
+            session: Async database session
+
+        Returns:
+            Number of deleted reservations
+        """
+
+        result: Result = await session.execute(
+            delete(CodeReservation).where(CodeReservation.leased_until < func.now())
+        )
+
+        await session.commit()
+
+        return result.rowcount
+
+    async def release(self, session: AsyncSession, owner: str) -> None:
+        """
+        Delete every reservation held by a worker.
+
+        Args:
+            session: Async database session
+            owner: Identifier of the worker
+        """
+
+        await session.execute(
+            delete(CodeReservation).where(CodeReservation.owner == owner)
+        )
+
+        await session.commit()
+
+
+__all__ = ["ReservationRepository"]
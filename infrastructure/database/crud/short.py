@@ -1,10 +1,345 @@
-from infrastructure.database.models import Short
+import uuid
+
+from datetime import datetime, timezone
+
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (Boolean, Column, MetaData, Result, Row, Select, String, Table,
+                        bindparam, delete, func, or_, select, tuple_, update)
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from infrastructure.database.dialect import insert, is_postgres
+from infrastructure.database.models import Short, ShortClickHourly
+from infrastructure.database.types import UTCDateTime
 
 from .base import BaseRepository
 
 
+STAGING_COLUMNS: List[str] = ["code", "url", "is_activated", "expires_at"]
+
+staging: Table = Table(
+    "shorts_import",
+    MetaData(),
+    Column("code", String(6)),
+    Column("url", String),
+    Column("is_activated", Boolean),
+    Column("expires_at", UTCDateTime()),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP"
+)
+
+redirect_lookup: Select = select(
+    Short.__table__.c.id,
+    Short.__table__.c.url,
+    Short.__table__.c.is_activated,
+    Short.__table__.c.expires_at,
+    Short.__table__.c.last_updated_at
+).where(Short.__table__.c.code == bindparam("code"))
+
+
 class ShortRepository(BaseRepository[Short]):
     model = Short
 
+    async def get_redirect(
+            self, session: AsyncSession, code: str
+    ) -> Optional[Row[Tuple[uuid.UUID, str, bool, Optional[datetime], datetime]]]:
+        """
+        Resolve a code to the columns a redirect needs as a plain row.
+
+        Selects table columns rather than the entity, so no ORM instance is
+        hydrated or tracked. The statement is built once at import time, so
+        every call hits the compiled cache with only the code bound.
+
+        Args:
+            session: Async database session
+            code: Short code to resolve
+
+        Returns:
+            (id, url, is_activated, expires_at, last_updated_at) row, or None if the code does not exist
+        """
+
+        result: Result = await session.execute(redirect_lookup, {"code": code})
+
+        return result.one_or_none()
+
+    async def add_unique(self, session: AsyncSession, target: Dict[str, Any]) -> Optional[Short]:
+        """
+        Insert a short URL in a single statement unless its code is taken.
+
+        The conflict is resolved by the database, so concurrent inserts of
+        the same code never surface as an IntegrityError.
+
+        Args:
+            session: Async database session
+            target: Column values of the row to insert
+
+        Returns:
+            The inserted instance, or None if the code was already taken
+        """
+
+        short: Optional[Short] = await session.scalar(
+            insert(Short)
+            .values(target)
+            .on_conflict_do_nothing(index_elements=[Short.code])
+            .returning(Short)
+        )
+
+        await session.commit()
+
+        return short
+
+    async def add_many(
+            self, session: AsyncSession, targets: List[Dict[str, Any]], commit: bool = True
+    ) -> Sequence[Short]:
+        """
+        Insert many short URLs in one multi-row statement, skipping busy codes.
+
+        Args:
+            session: Async database session
+            targets: Column values of the rows to insert
+            commit: Commit the transaction after inserting
+
+        Returns:
+            Inserted instances; rows whose code was already taken are absent
+        """
+
+        result = await session.scalars(
+            insert(Short)
+            .values(targets)
+            .on_conflict_do_nothing(index_elements=[Short.code])
+            .returning(Short)
+        )
+        shorts: Sequence[Short] = result.all()
+
+        if commit:
+            await session.commit()
+
+        return shorts
+
+    async def get_page(
+            self, session: AsyncSession, limit: int, after: Optional[Tuple[datetime, uuid.UUID]] = None
+    ) -> Sequence[Short]:
+        """
+        Retrieve one page of short URLs ordered by creation time using keyset pagination.
+
+        Served by the (created_at, id) index, so every page costs the same
+        regardless of how deep it is.
+
+        Args:
+            session: Async database session
+            limit: Maximum number of records to return
+            after: (created_at, id) of the last record of the previous page
+
+        Returns:
+            Sequence of model instances following `after`
+        """
+
+        statement: Select = select(Short).order_by(Short.created_at, Short.id).limit(limit)
+
+        if after is not None:
+            statement = statement.where(tuple_(Short.created_at, Short.id) > tuple_(*after))
+
+        result = await session.scalars(statement)
+
+        return result.all()
+
+    async def create_staging(self, session: AsyncSession) -> None:
+        """
+        Create the temporary import staging table for the current transaction.
+
+        The table is dropped automatically when the transaction ends, or
+        explicitly once merged on backends without ON COMMIT DROP.
+
+        Args:
+            session: Async database session
+        """
+
+        connection: AsyncConnection = await session.connection()
+
+        await connection.run_sync(staging.create)
+
+    async def copy_to_staging(self, session: AsyncSession, records: List[Tuple[Any, ...]]) -> None:
+        """
+        Load records into the staging table with PostgreSQL COPY.
+
+        Other backends fall back to a batched INSERT.
+
+        Args:
+            session: Async database session
+            records: Rows ordered as `STAGING_COLUMNS`
+        """
+
+        if not is_postgres:
+            await session.execute(staging.insert(), [dict(zip(STAGING_COLUMNS, record)) for record in records])
+            return
+
+        connection: AsyncConnection = await session.connection()
+        raw = await connection.get_raw_connection()
+
+        await raw.driver_connection.copy_records_to_table(
+            staging.name,
+            records=records,
+            columns=STAGING_COLUMNS
+        )
+
+    async def merge_staging(self, session: AsyncSession) -> Sequence[str]:
+        """
+        Move staged records into the short URLs table in one statement and commit.
+
+        Records whose code is already taken, or repeated within the staging
+        table, are skipped.
+
+        Args:
+            session: Async database session
+
+        Returns:
+            Codes of inserted short URLs
+        """
+
+        staged: Select = select(*(staging.c[name] for name in STAGING_COLUMNS))
+
+        if is_postgres:
+            staged = staged.distinct(staging.c.code).order_by(staging.c.code)
+        else:
+            staged = staged.group_by(staging.c.code)
+
+        result: Result = await session.execute(
+            insert(Short)
+            .from_select(STAGING_COLUMNS, staged)
+            .on_conflict_do_nothing(index_elements=[Short.code])
+            .returning(Short.code)
+        )
+        codes: Sequence[str] = result.scalars().all()
+
+        if not is_postgres:
+            connection: AsyncConnection = await session.connection()
+
+            await connection.run_sync(staging.drop)
+
+        await session.commit()
+
+        return codes
+
+    async def sweep_expired(self, session: AsyncSession, limit: int, deactivate: bool = False) -> Sequence[str]:
+        """
+        Delete or deactivate up to `limit` expired short URLs in one statement and commit.
+
+        Served by the partial index on expires_at; rows locked by a
+        concurrent sweep are skipped.
+
+        Args:
+            session: Async database session
+            limit: Maximum number of rows to handle
+            deactivate: Keep rows and mark them inactive instead of deleting them
+
+        Returns:
+            Codes of the handled short URLs
+        """
+
+        expired: Select = (
+            select(Short.id)
+            .where(Short.expires_at.is_not(None), Short.expires_at <= func.now())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        if deactivate:
+            statement = (
+                update(Short)
+                .where(Short.id.in_(expired.where(Short.is_activated)))
+                .values(is_activated=False)
+            )
+        else:
+            statement = delete(Short).where(Short.id.in_(expired))
+
+        result: Result = await session.execute(
+            statement.returning(Short.code).execution_options(synchronize_session=False)
+        )
+        codes: Sequence[str] = result.scalars().all()
+
+        await session.commit()
+
+        return codes
+
+    async def get_hottest(
+            self, session: AsyncSession, since: datetime, limit: int
+    ) -> Sequence[Row[Tuple[str, uuid.UUID, str, bool, Optional[datetime]]]]:
+        """
+        Get the redirect columns of the most clicked active short URLs.
+
+        Args:
+            session: Async database session
+            since: Only clicks in hourly buckets starting at or after this moment count
+            limit: Maximum number of short URLs
+
+        Returns:
+            (code, id, url, is_activated, expires_at) rows, most clicked first
+        """
+
+        now: datetime = datetime.now(tz=timezone.utc)
+        hits = func.sum(ShortClickHourly.hits)
+
+        result: Result = await session.execute(
+            select(Short.code, Short.id, Short.url, Short.is_activated, Short.expires_at)
+            .join(ShortClickHourly, ShortClickHourly.short_id == Short.id)
+            .where(
+                ShortClickHourly.bucket >= since,
+                Short.is_activated.is_(True),
+                or_(Short.expires_at.is_(None), Short.expires_at > now)
+            )
+            .group_by(Short.id)
+            .order_by(hits.desc())
+            .limit(limit)
+        )
+
+        return result.all()
+
+    async def stream(self, session: AsyncSession, fetch_size: int = 1000) -> AsyncIterator[Short]:
+        """
+        Stream every short URL through a server-side cursor.
+
+        Rows are fetched `fetch_size` at a time, so memory stays flat
+        regardless of table size.
+
+        Args:
+            session: Async database session
+            fetch_size: Number of rows fetched per round trip
+
+        Yields:
+            Model instances ordered by creation time
+        """
+
+        statement: Select = (
+            select(Short)
+            .order_by(Short.created_at, Short.id)
+            .execution_options(yield_per=fetch_size)
+        )
+
+        async for short in await session.stream_scalars(statement):
+            yield short
+
+    async def stream_codes(
+            self, session: AsyncSession, since: Optional[datetime] = None, fetch_size: int = 10_000
+    ) -> AsyncIterator[str]:
+        """
+        Stream short codes without loading the whole table into memory.
+
+        Args:
+            session: Async database session
+            since: Only stream codes created or updated at or after this moment
+            fetch_size: Number of rows fetched per round trip
+
+        Yields:
+            Short codes
+        """
+
+        statement: Select = select(Short.code).execution_options(yield_per=fetch_size)
+
+        if since is not None:
+            statement = statement.where(Short.last_updated_at >= since)
+
+        async for code in await session.stream_scalars(statement):
+            yield code
+
 
-__all__ = ["ShortRepository"]
\ No newline at end of file
+__all__ = ["ShortRepository", "STAGING_COLUMNS"]
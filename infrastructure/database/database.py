@@ -1,23 +1,42 @@
-from typing import AsyncGenerator
+import asyncio
 
-from sqlalchemy.ext.asyncio import (AsyncEngine,
+from contextlib import asynccontextmanager
+from itertools import count
+
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Dict, Iterator, List, Literal, Sequence, Tuple, Type
+
+from sqlalchemy import Executable, MetaData
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+from sqlalchemy.ext.asyncio import (AsyncConnection,
+                                    AsyncEngine,
                                     create_async_engine,
                                     async_sessionmaker,
                                     AsyncSession)
 
 from src.config import config
 
+from infrastructure.metrics import instrument_engine, request_sessions
+
 from .base import BaseRepository
+from .pool import InstrumentedQueuePool
+from .session import LazySession
 
 
 class DatabaseRepository(BaseRepository):
     """Async database connection handler with session management.
 
+    Writes and reads that must see them go to the primary through
+    `session_factory`; other reads may be routed to read replicas, each of
+    which has its own engine and pool, through `read_session_factory`.
+
     Args:
         echo: Log SQL queries (default: False)
         echo_pool: Log connection pool activity (default: False)
         pool_size: Connection pool size (default: 5)
         max_overflow: Additional allowed connections (default: 10)
+        replica_urls: Read replica connection URLs (default: none)
+        replica_selection: How a replica is picked for a read (default: "round_robin")
+        instrument: Record statement, pool and checkout wait metrics (default: False)
     """
 
     def __init__(
@@ -26,18 +45,40 @@ class DatabaseRepository(BaseRepository):
             echo_pool: bool = False,
             pool_size: int = 5,
             max_overflow: int = 10,
-            /,
+            replica_urls: Sequence[str] = (),
+            replica_selection: Literal["round_robin", "least_busy"] = "round_robin",
+            instrument: bool = False,
             **kwargs
     ) -> None:
         super().__init__(**kwargs)
 
-        self.engine: AsyncEngine = create_async_engine(
-            url=self.url,
-            echo=echo,
-            echo_pool=echo_pool,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
-        )
+        def create(url: str, name: str) -> AsyncEngine:
+            # Set explicitly: for in-memory SQLite, SQLAlchemy would otherwise
+            # pick StaticPool, which rejects the sizing arguments
+            poolclass: Type[Pool] = InstrumentedQueuePool.labelled(name) if instrument else AsyncAdaptedQueuePool
+
+            engine: AsyncEngine = create_async_engine(
+                url=url,
+                echo=echo,
+                echo_pool=echo_pool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                poolclass=poolclass
+            )
+
+            if instrument:
+                instrument_engine(engine, name)
+
+            return engine
+
+        self.engine: AsyncEngine = create(self.url, "primary")
+        self.replicas: List[AsyncEngine] = [
+            create(url, f"replica{index}") for index, url in enumerate(replica_urls)
+        ]
+
+        self._replica_selection: str = replica_selection
+        self._instrument: bool = instrument
+        self._turns: Iterator[int] = count()
 
         self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
             bind=self.engine,
@@ -46,22 +87,168 @@ class DatabaseRepository(BaseRepository):
             expire_on_commit=False,
         )
 
+    def reader(self) -> AsyncEngine:
+        """
+        Pick the engine to serve a read from.
+
+        Returns:
+            A replica engine, or the primary engine if there are no replicas
+        """
+
+        if not self.replicas:
+            return self.engine
+
+        if self._replica_selection == "least_busy":
+            return min(self.replicas, key=lambda engine: engine.pool.checkedout())
+
+        return self.replicas[next(self._turns) % len(self.replicas)]
+
+    def read_session_factory(self) -> AsyncSession:
+        """
+        Create a session bound to a replica picked for a read.
+
+        Replicas lag behind the primary, so rows written moments ago may be
+        missing; callers that must see them use `session_factory`.
+
+        Returns:
+            New database session
+        """
+
+        return self.session_factory(bind=self.reader())
+
+    async def create_all(self, metadata: MetaData) -> None:
+        """
+        Create missing tables and indexes on the primary.
+
+        Used by backends whose schema is not managed by migrations.
+
+        Args:
+            metadata: Metadata of the models to create
+        """
+
+        async with self.engine.begin() as connection:
+            await connection.run_sync(metadata.create_all)
+
+    async def warm_up(self, statements: Sequence[Tuple[Executable, Dict[str, Any]]] = ()) -> None:
+        """
+        Open `pool_size` connections on the primary and every replica.
+
+        The connections are checked out together, so each one is a distinct
+        pooled connection, and go back to the pool open. Statements run on
+        every one of them, leaving their prepared forms in the per-connection
+        statement cache and their compiled forms in the engine's cache.
+
+        Args:
+            statements: Statements with parameters to prepare on each connection
+        """
+
+        for engine in (self.engine, *self.replicas):
+            opened: List[AsyncConnection | BaseException] = await asyncio.gather(
+                *(engine.connect() for _ in range(engine.pool.size())),
+                return_exceptions=True
+            )
+            connections: List[AsyncConnection] = [item for item in opened if isinstance(item, AsyncConnection)]
+
+            try:
+                for item in opened:
+                    if isinstance(item, BaseException):
+                        raise item
+
+                for connection in connections:
+                    for statement, parameters in statements:
+                        await connection.execute(statement, parameters)
+
+                    await connection.rollback()
+            finally:
+                await asyncio.gather(*(connection.close() for connection in connections))
+
     async def dispose(self) -> None:
         await self.engine.dispose()
 
-    async def session(self) -> AsyncGenerator[AsyncSession, None]:
-        async with self.session_factory() as session:
+        for replica in self.replicas:
+            await replica.dispose()
+
+    def count_request(self, used: bool) -> None:
+        """
+        Record whether a request needed a database session.
+
+        Args:
+            used: Whether a session was created and so may have touched the pool
+        """
+
+        if self._instrument:
+            request_sessions.labels(used=str(used).lower()).inc()
+
+    @asynccontextmanager
+    async def _lazy(self, factory: Callable[[], AsyncSession]) -> AsyncIterator[LazySession]:
+        session: LazySession = LazySession(factory)
+
+        try:
             yield session
+        finally:
+            await session.close()
+
+            self.count_request(used=session.acquired)
 
+    async def session(self) -> AsyncGenerator[LazySession, None]:
+        """
+        Request dependency providing a primary session created on first use.
+        """
+
+        async with self._lazy(self.session_factory) as session:
+            yield session
 
-database: DatabaseRepository = DatabaseRepository(
-    echo=config.database.echo,
-    echo_pool=config.database.echo_pool,
-    pool_size=config.database.pool_size,
-    max_overflow=config.database.max_overflow,
-    url=config.database.build_url(
-        host=config.database.host
+    async def read_session(self) -> AsyncGenerator[LazySession, None]:
+        """
+        Request dependency providing a read session created on first use.
+
+        The replica is picked when the session is first used, so
+        least-busy selection sees the pools as they are at query time.
+        """
+
+        async with self._lazy(self.read_session_factory) as session:
+            yield session
+
+
+def replica_url(replica: str) -> str:
+    """
+    Build the connection URL of a read replica.
+
+    Args:
+        replica: Replica as "host" or "host:port"
+
+    Returns:
+        Complete connection string (includes password)
+    """
+
+    host, _, port = replica.partition(":")
+
+    return config.database.build_url(host=host, port=int(port) if port else None)
+
+
+if config.database.backend == "postgres":
+    database: DatabaseRepository = DatabaseRepository(
+        echo=config.database.echo,
+        echo_pool=config.database.echo_pool,
+        pool_size=config.database.pool_size,
+        max_overflow=config.database.max_overflow,
+        replica_urls=[replica_url(replica) for replica in config.database.replicas],
+        replica_selection=config.database.replica_selection,
+        instrument=config.metrics.enabled,
+        url=config.database.build_url(
+            host=config.database.host
+        )
+    )
+else:
+    # An in-memory database lives and dies with its connection, so the pool
+    # keeps exactly one open for the lifetime of the process.
+    database: DatabaseRepository = DatabaseRepository(
+        echo=config.database.echo,
+        echo_pool=config.database.echo_pool,
+        pool_size=1 if config.database.backend == "memory" else config.database.pool_size,
+        max_overflow=0 if config.database.backend == "memory" else config.database.max_overflow,
+        instrument=config.metrics.enabled,
+        url=config.database.build_local_url()
     )
-)
 
 __all__ = ["database"]
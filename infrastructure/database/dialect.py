@@ -0,0 +1,9 @@
+from sqlalchemy.dialects import postgresql, sqlite
+
+from src.config import config
+
+is_postgres: bool = config.database.backend == "postgres"
+
+insert = postgresql.insert if is_postgres else sqlite.insert
+
+__all__ = ["is_postgres", "insert"]
@@ -0,0 +1,28 @@
+"""short code sequence
+
+Revision ID: f480a173b0ef
+Revises: 273eeb780890
+Create Date: 2026-10-16 22:39:57.529789
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f480a173b0ef'
+down_revision: Union[str, Sequence[str], None] = '273eeb780890'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence('shorts_code_seq')))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(sa.schema.DropSequence(sa.Sequence('shorts_code_seq')))
@@ -1,9 +1,11 @@
 import uuid
 
-from sqlalchemy import DateTime, func, UUID, text
+from sqlalchemy import DateTime, func, UUID
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 
+from .types import UTCDateTime, random_uuid
+
 
 class IdPkMixin:
     """
@@ -16,7 +18,7 @@ class IdPkMixin:
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        server_default=text("gen_random_uuid()")
+        server_default=random_uuid()
     )
 
 
@@ -29,7 +31,7 @@ class CreatedAtMixin:
     """
 
     created_at: Mapped[DateTime] = mapped_column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         server_default=func.now(),
         nullable=False
     )
@@ -43,7 +45,7 @@ class LastUpdatedAtMixin:
     """
 
     last_updated_at: Mapped[DateTime] = mapped_column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         server_default=func.now(),
         onupdate=func.now(),
         nullable=False
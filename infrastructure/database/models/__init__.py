@@ -1,4 +1,14 @@
 from .base import Base
-from .short import Short
+from .short import Short, short_code_sequence
+from .reservation import CodeReservation
+from .click import ShortClick, ShortClickHourly, ShortClickDaily
 
-__all__ = ["Base", "Short"]
+__all__ = [
+    "Base",
+    "Short",
+    "short_code_sequence",
+    "CodeReservation",
+    "ShortClick",
+    "ShortClickHourly",
+    "ShortClickDaily",
+]
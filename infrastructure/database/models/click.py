@@ -0,0 +1,84 @@
+import uuid
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.database.types import UTCDateTime
+
+from .base import Base
+
+
+class ShortClick(Base):
+    """
+    Database model representing the hit counter of a short URL.
+
+    Attributes:
+        short_id: Identifier of the counted short URL
+        hits: Total number of redirects served
+        last_clicked_at: Moment of the most recent flushed redirect
+    """
+
+    __tablename__ = "short_clicks"
+
+    short_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("shorts.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    hits: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False
+    )
+    last_clicked_at: Mapped[DateTime] = mapped_column(
+        UTCDateTime(),
+        nullable=False
+    )
+
+
+class ClickRollupMixin:
+    """
+    Mixin that adds rollup bucket columns to click models.
+
+    Provides:
+        short_id: Identifier of the counted short URL
+        bucket: Start of the time bucket (UTC)
+        hits: Number of redirects served within the bucket
+    """
+
+    short_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("shorts.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    bucket: Mapped[DateTime] = mapped_column(
+        UTCDateTime(),
+        primary_key=True
+    )
+    hits: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False
+    )
+
+
+class ShortClickHourly(Base, ClickRollupMixin):
+    """
+    Database model representing hits of a short URL per hour.
+
+    Buckets older than the retention period are pruned by compaction.
+    """
+
+    __tablename__ = "short_clicks_hourly"
+    __table_args__ = (
+        Index("ix_short_clicks_hourly_bucket", "bucket"),
+    )
+
+
+class ShortClickDaily(Base, ClickRollupMixin):
+    """
+    Database model representing hits of a short URL per day.
+    """
+
+    __tablename__ = "short_clicks_daily"
+
+
+__all__ = ["ShortClick", "ShortClickHourly", "ShortClickDaily"]
@@ -0,0 +1,36 @@
+from sqlalchemy import String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.database.types import UTCDateTime
+
+from .base import Base
+
+
+class CodeReservation(Base):
+    """
+    Database model representing a short code reserved by a worker.
+
+    Attributes:
+        code: Reserved short code
+        owner: Identifier of the worker holding the reservation
+        leased_until: Moment after which an unrenewed reservation may be reclaimed
+    """
+
+    __tablename__ = "code_reservations"
+
+    code: Mapped[str] = mapped_column(
+        String(6),
+        primary_key=True
+    )
+    owner: Mapped[str] = mapped_column(
+        String,
+        nullable=False
+    )
+    leased_until: Mapped[DateTime] = mapped_column(
+        UTCDateTime(),
+        nullable=False,
+        index=True
+    )
+
+
+__all__ = ["CodeReservation"]
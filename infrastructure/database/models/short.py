@@ -1,9 +1,10 @@
-from sqlalchemy import String, Boolean, DateTime
+from sqlalchemy import String, Boolean, DateTime, Sequence, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import expression
 
 from typing import Optional
 
+from infrastructure.database.types import UTCDateTime
 from infrastructure.database.mixins import (
     IdPkMixin,
     CreatedAtMixin,
@@ -25,6 +26,11 @@ class Short(Base, CreatedAtMixin, LastUpdatedAtMixin, IdPkMixin):
     """
 
     __tablename__ = "shorts"
+    __table_args__ = (
+        Index("ix_shorts_created_at_id", "created_at", "id"),
+        Index("ix_shorts_expires_at", "expires_at", postgresql_where=text("expires_at IS NOT NULL")),
+        Index("ix_shorts_last_updated_at", "last_updated_at"),
+    )
 
     is_activated: Mapped[bool] = mapped_column(
         Boolean,
@@ -41,9 +47,15 @@ class Short(Base, CreatedAtMixin, LastUpdatedAtMixin, IdPkMixin):
         nullable=False
     )
     expires_at: Mapped[Optional[DateTime]] = mapped_column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         nullable=True
     )
 
 
-__all__ = ["Short"]
+short_code_sequence: Sequence = Sequence(
+    "shorts_code_seq",
+    metadata=Base.metadata
+)
+"""Sequence feeding the collision-free code generator"""
+
+__all__ = ["Short", "short_code_sequence"]
@@ -0,0 +1,43 @@
+from time import perf_counter
+
+from typing import Type
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from infrastructure.metrics import pool_wait
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection.
+
+    The database label is a class attribute rather than a constructor
+    argument because the engine recreates its pool from the class on
+    dispose; `labelled` derives a subclass per database.
+    """
+
+    database: str = "primary"
+
+    @classmethod
+    def labelled(cls, database: str) -> Type["InstrumentedQueuePool"]:
+        """
+        Derive a pool class reporting under a database label.
+
+        Args:
+            database: Label of the database, e.g. "primary" or "replica0"
+
+        Returns:
+            Pool class to pass as `poolclass`
+        """
+
+        return type(cls.__name__, (cls,), {"database": database})
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started: float = perf_counter()
+
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait.labels(database=self.database).observe(perf_counter() - started)
+
+
+__all__ = ["InstrumentedQueuePool"]
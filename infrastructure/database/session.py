@@ -0,0 +1,46 @@
+from typing import Any, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class LazySession:
+    """
+    Stand-in for an AsyncSession that only creates it on first use.
+
+    Request handlers receive one for every request, but many answer from
+    memory or fail validation before querying; those never build a session
+    and never check out a pool connection. Any attribute access (execute,
+    commit, begin, ...) creates the session from the factory and forwards
+    to it, so repositories use the handle as they would the session.
+
+    Args:
+        factory: Creates the session, e.g. `async_sessionmaker` or a
+                 function picking a read replica at the time of first use
+    """
+
+    def __init__(self, factory: Callable[[], AsyncSession]) -> None:
+        self._factory: Callable[[], AsyncSession] = factory
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def acquired(self) -> bool:
+        """Whether the session was used and so may have touched the pool."""
+
+        return self._session is not None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._session is None:
+            self._session = self._factory()
+
+        return getattr(self._session, name)
+
+    async def close(self) -> None:
+        """
+        Close the session if it was created, returning its connection to the pool.
+        """
+
+        if self._session is not None:
+            await self._session.close()
+
+
+__all__ = ["LazySession"]
@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+
+from typing import Any, Optional
+
+from sqlalchemy import DateTime, UUID
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement, now
+from sqlalchemy.types import TypeDecorator
+
+
+class UTCDateTime(TypeDecorator):
+    """Timezone-aware datetime stored in UTC on every backend.
+
+    PostgreSQL keeps the offset itself; SQLite stores naive values, so
+    aware values are converted to UTC on the way in and marked as UTC on
+    the way out.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[datetime], dialect: Dialect) -> Optional[datetime]:
+        if value is not None and value.tzinfo is not None and dialect.name != "postgresql":
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+        return value
+
+    def process_result_value(self, value: Optional[datetime], dialect: Dialect) -> Optional[datetime]:
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+
+        return value
+
+
+class random_uuid(FunctionElement):
+    """Server-side random UUID, rendered for the backend in use."""
+
+    type = UUID(as_uuid=True)
+    inherit_cache = True
+
+
+@compiles(random_uuid)
+def compile_random_uuid(element: random_uuid, compiler: SQLCompiler, **kwargs: Any) -> str:
+    return "gen_random_uuid()"
+
+
+@compiles(random_uuid, "sqlite")
+def compile_random_uuid_sqlite(element: random_uuid, compiler: SQLCompiler, **kwargs: Any) -> str:
+    return "(lower(hex(randomblob(16))))"
+
+
+@compiles(now, "sqlite")
+def compile_now_sqlite(element: now, compiler: SQLCompiler, **kwargs: Any) -> str:
+    # CURRENT_TIMESTAMP has second precision; match the microsecond text
+    # format SQLAlchemy binds datetimes with, so stored values compare correctly.
+    return "(strftime('%Y-%m-%d %H:%M:%f', 'now') || '000')"
+
+
+__all__ = ["UTCDateTime", "random_uuid"]
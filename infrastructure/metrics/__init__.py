@@ -0,0 +1,20 @@
+from .metrics import (CONTENT_TYPE_LATEST, request_count, request_latency, statement_latency, pool_checked_out,
+                      pool_overflow, pool_wait, request_sessions,
+                      clicks_dropped, cache_hits, cache_misses, instrument_engine, render, release)
+
+__all__ = [
+    "CONTENT_TYPE_LATEST",
+    "request_count",
+    "request_latency",
+    "statement_latency",
+    "pool_checked_out",
+    "pool_overflow",
+    "pool_wait",
+    "request_sessions",
+    "clicks_dropped",
+    "cache_hits",
+    "cache_misses",
+    "instrument_engine",
+    "render",
+    "release",
+]
@@ -0,0 +1,146 @@
+import os
+
+from time import perf_counter
+
+from typing import Any, List
+
+from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+                               generate_latest)
+from prometheus_client.multiprocess import MultiProcessCollector, mark_process_dead
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+OPERATIONS: frozenset = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "COPY"})
+
+STATEMENT_BUCKETS: List[float] = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5]
+
+request_count: Counter = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code",
+    ["method", "route", "status"]
+)
+request_latency: Histogram = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route"]
+)
+statement_latency: Histogram = Histogram(
+    "db_statement_duration_seconds",
+    "Database statement latency by database and operation",
+    ["database", "operation"],
+    buckets=STATEMENT_BUCKETS
+)
+pool_checked_out: Gauge = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool",
+    ["database"],
+    multiprocess_mode="livesum"
+)
+pool_overflow: Gauge = Gauge(
+    "db_pool_overflow_connections",
+    "Connections currently open beyond the pool size",
+    ["database"],
+    multiprocess_mode="livesum"
+)
+pool_wait: Histogram = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent obtaining a connection from the pool, including connecting",
+    ["database"],
+    buckets=STATEMENT_BUCKETS
+)
+request_sessions: Counter = Counter(
+    "db_request_sessions_total",
+    "Requests and redirect lookups that could use a database session, by whether they did",
+    ["used"]
+)
+clicks_dropped: Counter = Counter(
+    "clicks_dropped_total",
+    "Redirect hits dropped because the click buffer was at its limit, e.g. during a database outage"
+)
+cache_hits: Counter = Counter(
+    "cache_hits_total",
+    "Lookups answered by a lookup layer without reaching the database",
+    ["cache"]
+)
+cache_misses: Counter = Counter(
+    "cache_misses_total",
+    "Lookups a lookup layer passed on to the database",
+    ["cache"]
+)
+
+
+def instrument_engine(engine: AsyncEngine, database: str) -> None:
+    """
+    Record the latency of every statement executed through an engine.
+
+    Args:
+        engine: Engine to instrument
+        database: Label of the engine, e.g. "primary" or "replica"
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def started(connection: Connection, *args: Any) -> None:
+        connection.info.setdefault("statement_started", []).append(perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def finished(connection: Connection, cursor: Any, statement: str, *args: Any) -> None:
+        operation: str = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+
+        statement_latency.labels(
+            database=database,
+            operation=operation if operation in OPERATIONS else "OTHER"
+        ).observe(perf_counter() - connection.info["statement_started"].pop())
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def failed(context: ExceptionContext) -> None:
+        if context.connection is not None and context.connection.info.get("statement_started"):
+            context.connection.info["statement_started"].pop()
+
+
+def render() -> bytes:
+    """
+    Render all metrics in the Prometheus text format.
+
+    When PROMETHEUS_MULTIPROC_DIR is set, samples written by every worker
+    to that directory are aggregated, so any worker can answer a scrape.
+
+    Returns:
+        Exposition document
+    """
+
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return generate_latest(REGISTRY)
+
+    registry: CollectorRegistry = CollectorRegistry()
+    MultiProcessCollector(registry)
+
+    return generate_latest(registry)
+
+
+def release() -> None:
+    """
+    Drop the live gauges of this worker from the aggregate on shutdown.
+    """
+
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        mark_process_dead(os.getpid())
+
+
+__all__ = [
+    "CONTENT_TYPE_LATEST",
+    "request_count",
+    "request_latency",
+    "statement_latency",
+    "pool_checked_out",
+    "pool_overflow",
+    "pool_wait",
+    "request_sessions",
+    "clicks_dropped",
+    "cache_hits",
+    "cache_misses",
+    "instrument_engine",
+    "render",
+    "release",
+]
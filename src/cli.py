@@ -0,0 +1,70 @@
+import argparse
+import asyncio
+
+from pathlib import Path
+
+from typing import AsyncIterator
+
+from infrastructure.database import database
+
+from .config import config
+from .routers.short.schemas import ImportResult
+from .routers.short.service import Format, Importer, read_lines
+
+
+async def import_shorts(path: Path, fmt: Format) -> ImportResult:
+    """
+    Import short URLs from a local NDJSON or CSV file.
+
+    Args:
+        path: Path to the document
+        fmt: Document format
+
+    Returns:
+        Numbers of inserted, conflicting and invalid records
+    """
+
+    with path.open("rb") as file:
+        async def read(size: int) -> bytes:
+            return file.read(size)
+
+        lines: AsyncIterator[str] = read_lines(read)
+
+        async with database.session_factory() as session:
+            result: ImportResult = await Importer(batch_size=config.short.import_batch_size).run(
+                session=session,
+                lines=lines,
+                fmt=fmt
+            )
+
+    await database.dispose()
+
+    return result
+
+
+def main() -> None:
+    """
+    Command line entry point.
+
+    Usage:
+        python -m src.cli import <path> [--format ndjson|csv]
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog="python -m src.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser: argparse.ArgumentParser = commands.add_parser("import", help="Import short URLs from a file")
+    import_parser.add_argument("path", type=Path, help="NDJSON or CSV document")
+    import_parser.add_argument("--format", choices=["ndjson", "csv"], help="Document format (default: by extension)")
+
+    arguments: argparse.Namespace = parser.parse_args()
+
+    if arguments.command == "import":
+        fmt: Format = arguments.format or ("csv" if arguments.path.suffix.lower() == ".csv" else "ndjson")
+        result: ImportResult = asyncio.run(import_shorts(path=arguments.path, fmt=fmt))
+
+        print(result.model_dump_json())
+
+
+if __name__ == "__main__":
+    main()
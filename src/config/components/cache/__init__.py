@@ -0,0 +1,3 @@
+from .cache import CacheConfig
+
+__all__ = ["CacheConfig"]
@@ -0,0 +1,37 @@
+from pydantic import Field, BaseModel
+
+
+class CacheConfig(BaseModel):
+    """
+    Configuration model for the in-process redirect cache.
+
+    Every worker keeps its own cache, so a change made through another
+    worker becomes visible here after at most `ttl` seconds. With `shared`,
+    the workers of a node share one memory-mapped table instead, so an
+    entry cached or invalidated by one worker is seen by all of them; the
+    memory backend, whose data is private to each worker, keeps per-worker
+    caches.
+
+    Attributes:
+        enabled: Cache redirect lookups in memory (default: True)
+        max_size: Maximum number of cached codes before LRU eviction (default: 100000)
+        ttl: Lifetime of a cached entry in seconds (default: 60)
+        preload: Most clicked codes loaded into the cache at startup, 0 disables (default: 1000)
+        preload_window: Hours of click history that decide which codes are hottest (default: 24)
+        shared: Share one cache between the workers of a node (default: False)
+        shared_path: Prefix of the file backing the shared cache, which gets its sizes appended;
+                     best on a memory filesystem (default: /dev/shm/shorter/redirects)
+        shared_heap_size: Bytes of the shared cache reserved for URLs (default: 16 MiB)
+    """
+
+    enabled: bool = Field(default=True)
+    max_size: int = Field(default=100_000, ge=0)
+    ttl: float = Field(default=60, gt=0)
+    preload: int = Field(default=1000, ge=0)
+    preload_window: float = Field(default=24, gt=0)
+    shared: bool = Field(default=False)
+    shared_path: str = Field(default="/dev/shm/shorter/redirects")
+    shared_heap_size: int = Field(default=16 * 1024 * 1024, gt=0, lt=2 ** 32)
+
+
+__all__ = ["CacheConfig"]
@@ -0,0 +1,3 @@
+from .clicks import ClicksConfig
+
+__all__ = ["ClicksConfig"]
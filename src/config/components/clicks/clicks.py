@@ -0,0 +1,29 @@
+from pydantic import Field, BaseModel
+
+
+class ClicksConfig(BaseModel):
+    """
+    Configuration model for buffered click counting.
+
+    Attributes:
+        enabled: Count redirects served per short URL (default: True)
+        flush_interval: Seconds between buffer flushes (default: 5)
+        max_buffer: Number of buffered short URLs that triggers an early flush (default: 10000)
+        buffer_limit: Number of buffered short URLs beyond which hits of further ones are dropped (default: 100000)
+        retry_max_interval: Longest wait in seconds between flush retries while the database fails (default: 60)
+        drain_on_shutdown: Flush buffered hits when the application stops (default: True)
+        hourly_retention_days: Days hourly rollups are kept before compaction (default: 30)
+        compaction_interval: Seconds between compaction passes (default: 3600)
+    """
+
+    enabled: bool = Field(default=True)
+    flush_interval: float = Field(default=5, gt=0)
+    max_buffer: int = Field(default=10_000, gt=0)
+    buffer_limit: int = Field(default=100_000, gt=0)
+    retry_max_interval: float = Field(default=60, gt=0)
+    drain_on_shutdown: bool = Field(default=True)
+    hourly_retention_days: int = Field(default=30, gt=0)
+    compaction_interval: float = Field(default=3600, gt=0)
+
+
+__all__ = ["ClicksConfig"]
@@ -0,0 +1,3 @@
+from .code import CodeConfig
+
+__all__ = ["CodeConfig"]
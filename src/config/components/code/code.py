@@ -0,0 +1,38 @@
+from typing import Literal
+
+from pydantic import Field, SecretStr, BaseModel
+
+
+class CodeConfig(BaseModel):
+    """
+    Configuration model for short code generation.
+
+    Attributes:
+        strategy: Code generation strategy (default: "random")
+                  - random: random codes probed against the database
+                  - sequence: database sequence values through a keyed permutation
+                  - reservoir: codes reserved in bulk ahead of time by a background task
+        length: Length of generated codes (default: 6)
+        secret: Permutation key for the sequence strategy (secured).
+                Must stay the same across workers and never change once
+                codes have been generated, otherwise codes may collide
+        block_size: Sequence values leased per database round trip (default: 100)
+        low_watermark: Reservoir size that triggers a refill (default: 200)
+        high_watermark: Reservoir size a refill stops at (default: 1000)
+        refill_batch_size: Candidate codes per reservation query (default: 500)
+        lease_ttl: Seconds an unrenewed reservation survives before being reclaimed (default: 600)
+        lease_renew_interval: Seconds between lease renewals and reclaim passes (default: 60)
+    """
+
+    strategy: Literal["random", "sequence", "reservoir"] = Field(default="random")
+    length: int = Field(default=6, ge=1, le=6)
+    secret: SecretStr = Field(default=SecretStr("shorter"))
+    block_size: int = Field(default=100, gt=0)
+    low_watermark: int = Field(default=200, ge=0)
+    high_watermark: int = Field(default=1000, gt=0)
+    refill_batch_size: int = Field(default=500, gt=0)
+    lease_ttl: float = Field(default=600, gt=0)
+    lease_renew_interval: float = Field(default=60, gt=0)
+
+
+__all__ = ["CodeConfig"]
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List, Literal, Optional
 
 from pydantic import Field, SecretStr, BaseModel
 
@@ -10,6 +10,11 @@ class DatabaseConfig(BaseModel):
     Database connection settings and SQLAlchemy configuration.
 
     Attributes:
+        backend: Storage backend
+                 - postgres: PostgreSQL server, schema managed by migrations
+                 - sqlite: SQLite file at `path`, schema created on startup
+                 - memory: In-memory SQLite, schema created on startup and lost on shutdown
+        path: SQLite database file for the sqlite backend
         driver: Database driver (e.g., 'postgresql+asyncpg')
         database: Database name
         user: Database username
@@ -17,14 +22,25 @@ class DatabaseConfig(BaseModel):
         host: Database server host
         host_alembic: Database host for migrations
         port: Database server port
+        replicas: Read replica hosts, as "host" or "host:port"
+        replica_selection: How a replica is picked for a read
+                           - round_robin: replicas take turns
+                           - least_busy: replica with the fewest checked out connections
+        replica_lag: Seconds replicas may trail the primary; rows changed more recently
+                     are read from the primary, and cache invalidations are repeated
+                     after this delay
         echo: Log SQL queries (debug)
         echo_pool: Log connection pool activity
         pool_size: Connection pool size
         max_overflow: Additional allowed connections
+        warm_up: Open `pool_size` connections of every engine at startup and
+                 prepare the redirect lookup on each of them
         naming_convention: SQLAlchemy constraint naming rules
     """
 
 
+    backend: Literal["postgres", "sqlite", "memory"] = Field(default="postgres")
+    path: str = Field(default="shorter.db")
     driver: str = Field(default="postgresql+asyncpg")
     database: str = Field(default="database")
     user: str = Field(default="user")
@@ -32,11 +48,15 @@ class DatabaseConfig(BaseModel):
     host: str = Field(default="postgres")
     host_alembic: str = Field(default="postgres")
     port: int = Field(default=5432)
+    replicas: List[str] = Field(default=[])
+    replica_selection: Literal["round_robin", "least_busy"] = Field(default="round_robin")
+    replica_lag: float = Field(default=5, ge=0)
 
     echo: bool = Field(default=False)
     echo_pool: bool = Field(default=False)
     pool_size: int = Field(default=5)
     max_overflow: int = Field(default=10)
+    warm_up: bool = Field(default=True)
 
     naming_convention: Dict[str, str] = Field(
         default={
@@ -50,13 +70,15 @@ class DatabaseConfig(BaseModel):
 
     def build_url(
             self,
-            host: str
+            host: str,
+            port: Optional[int] = None
     ) -> str:
         """
         Generate SQLAlchemy connection URL for given host.
 
         Args:
             host: Target database hostname
+            port: Target database port (default: configured port)
 
         Returns:
             Complete connection string (includes password)
@@ -67,7 +89,7 @@ class DatabaseConfig(BaseModel):
             username=self.user,
             password=self.password.get_secret_value(),
             host=host,
-            port=self.port,
+            port=self.port if port is None else port,
             database=self.database
         ).render_as_string(
             hide_password=False
@@ -75,5 +97,18 @@ class DatabaseConfig(BaseModel):
 
         return url
 
+    def build_local_url(self) -> str:
+        """
+        Generate SQLAlchemy connection URL for the sqlite and memory backends.
+
+        Returns:
+            SQLite connection string
+        """
+
+        if self.backend == "memory":
+            return "sqlite+aiosqlite:///:memory:"
+
+        return f"sqlite+aiosqlite:///{self.path}"
+
 
 __all__ = ["DatabaseConfig"]
@@ -0,0 +1,3 @@
+from .expiry import ExpiryConfig
+
+__all__ = ["ExpiryConfig"]
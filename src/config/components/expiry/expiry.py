@@ -0,0 +1,25 @@
+from typing import Literal
+
+from pydantic import Field, BaseModel
+
+
+class ExpiryConfig(BaseModel):
+    """
+    Configuration model for the background sweeper of expired short URLs.
+
+    Attributes:
+        enabled: Sweep expired short URLs in the background (default: True)
+        mode: What happens to expired short URLs (default: "delete")
+              - delete: rows are deleted
+              - deactivate: rows are kept with is_activated set to False
+        interval: Seconds between sweeps (default: 60)
+        batch_size: Rows handled per statement (default: 1000)
+    """
+
+    enabled: bool = Field(default=True)
+    mode: Literal["delete", "deactivate"] = Field(default="delete")
+    interval: float = Field(default=60, gt=0)
+    batch_size: int = Field(default=1000, gt=0)
+
+
+__all__ = ["ExpiryConfig"]
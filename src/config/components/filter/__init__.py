@@ -0,0 +1,3 @@
+from .filter import FilterConfig
+
+__all__ = ["FilterConfig"]
@@ -0,0 +1,33 @@
+from pydantic import Field, BaseModel
+
+
+class FilterConfig(BaseModel):
+    """
+    Configuration model for the negative-lookup filter over existing codes.
+
+    The filter is kept per worker: codes created through another worker are
+    picked up by the periodic refresh, so with several workers a fresh link
+    may answer 404 on other workers for up to `refresh_interval` seconds.
+    Deleted codes are only dropped by the full rebuild, so until then their
+    lookups still reach the database.
+
+    Attributes:
+        enabled: Answer definite misses without a database query (default: False)
+        capacity: Expected number of codes the filter is sized for (default: 1000000)
+        error_rate: Target false-positive rate at full capacity (default: 0.01)
+        fetch_size: Rows fetched per round trip while streaming codes (default: 10000)
+        refresh_interval: Seconds between incremental refreshes (default: 5)
+        refresh_overlap: Seconds re-read before the last refresh to catch late commits (default: 30)
+        rebuild_interval: Seconds between full rebuilds dropping deleted codes (default: 3600)
+    """
+
+    enabled: bool = Field(default=False)
+    capacity: int = Field(default=1_000_000, gt=0)
+    error_rate: float = Field(default=0.01, gt=0, lt=1)
+    fetch_size: int = Field(default=10_000, gt=0)
+    refresh_interval: float = Field(default=5, gt=0)
+    refresh_overlap: float = Field(default=30, ge=0)
+    rebuild_interval: float = Field(default=3600, gt=0)
+
+
+__all__ = ["FilterConfig"]
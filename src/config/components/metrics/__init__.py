@@ -0,0 +1,3 @@
+from .metrics import MetricsConfig
+
+__all__ = ["MetricsConfig"]
@@ -0,0 +1,20 @@
+from pydantic import Field, BaseModel
+
+
+class MetricsConfig(BaseModel):
+    """
+    Configuration model for Prometheus metrics.
+
+    With several workers, set the PROMETHEUS_MULTIPROC_DIR environment
+    variable to an empty directory so that /metrics aggregates all of them.
+
+    Attributes:
+        enabled: Collect metrics and expose /metrics (default: True)
+        sync_interval: Seconds between samples of pool and cache statistics (default: 5)
+    """
+
+    enabled: bool = Field(default=True)
+    sync_interval: float = Field(default=5, gt=0)
+
+
+__all__ = ["MetricsConfig"]
@@ -0,0 +1,3 @@
+from .redirect import RedirectConfig
+
+__all__ = ["RedirectConfig"]
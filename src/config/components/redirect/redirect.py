@@ -0,0 +1,17 @@
+from pydantic import Field, BaseModel
+
+
+class RedirectConfig(BaseModel):
+    """
+    Configuration model for redirect serving.
+
+    Attributes:
+        fast_path: Answer plain redirects in a raw ASGI layer ahead of CORS and
+                   routing; JSON negotiation, cross-origin requests and errors
+                   still reach the full application (default: True)
+    """
+
+    fast_path: bool = Field(default=True)
+
+
+__all__ = ["RedirectConfig"]
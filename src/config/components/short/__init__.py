@@ -0,0 +1,3 @@
+from .short import ShortConfig
+
+__all__ = ["ShortConfig"]
@@ -0,0 +1,25 @@
+from pydantic import Field, BaseModel
+
+
+class ShortConfig(BaseModel):
+    """
+    Configuration model for short URL endpoints.
+
+    Attributes:
+        batch_max_size: Maximum number of items accepted by batch creation (default: 1000)
+        delete_chunk_size: Rows deleted per statement when deleting all short URLs (default: 1000)
+        page_size: Default number of short URLs per page (default: 100)
+        page_max_size: Maximum number of short URLs per page (default: 1000)
+        export_fetch_size: Rows fetched per round trip while exporting (default: 1000)
+        import_batch_size: Validated rows copied to the staging table at once (default: 10000)
+    """
+
+    batch_max_size: int = Field(default=1000, gt=0)
+    delete_chunk_size: int = Field(default=1000, gt=0)
+    page_size: int = Field(default=100, gt=0)
+    page_max_size: int = Field(default=1000, gt=0)
+    export_fetch_size: int = Field(default=1000, gt=0)
+    import_batch_size: int = Field(default=10_000, gt=0)
+
+
+__all__ = ["ShortConfig"]
@@ -0,0 +1,3 @@
+from .snapshot import SnapshotConfig
+
+__all__ = ["SnapshotConfig"]
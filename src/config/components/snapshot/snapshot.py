@@ -0,0 +1,29 @@
+from pydantic import Field, BaseModel
+
+
+class SnapshotConfig(BaseModel):
+    """
+    Configuration model for the hot-set snapshot of the redirect cache.
+
+    Workers periodically write their most recently used redirect entries
+    to a file on local disk and load it on startup, so a restarted worker
+    starts with a warm cache. Entries loaded from a snapshot may be up to
+    `max_age` seconds older than the cache TTL allows for. Snapshots are
+    not used with the memory backend.
+
+    Attributes:
+        enabled: Write and load snapshots (default: True)
+        path: Snapshot file, shared by the workers of a node (default: "/tmp/shorter/hot.snapshot")
+        size: Maximum number of entries in a snapshot (default: 10000)
+        interval: Seconds between snapshots (default: 30)
+        max_age: Seconds after which a snapshot is ignored on startup (default: 300)
+    """
+
+    enabled: bool = Field(default=True)
+    path: str = Field(default="/tmp/shorter/hot.snapshot")
+    size: int = Field(default=10_000, gt=0)
+    interval: float = Field(default=30, gt=0)
+    max_age: float = Field(default=300, gt=0)
+
+
+__all__ = ["SnapshotConfig"]
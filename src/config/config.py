@@ -1,10 +1,19 @@
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings
 
 from .constants import ENV_FILE_PATH
 
 from .components.database import DatabaseConfig
 from .components.cors import CORSConfig
+from .components.cache import CacheConfig
+from .components.filter import FilterConfig
+from .components.code import CodeConfig
+from .components.short import ShortConfig
+from .components.clicks import ClicksConfig
+from .components.expiry import ExpiryConfig
+from .components.metrics import MetricsConfig
+from .components.redirect import RedirectConfig
+from .components.snapshot import SnapshotConfig
 
 
 class ApplicationConfig(BaseSettings):
@@ -18,8 +27,19 @@ class ApplicationConfig(BaseSettings):
                     (default: "An API for creating and interacting with short URLs")
         redoc_url: Path for ReDoc documentation (default: "/redoc")
         docs_url: Path for Swagger docs (default: "/")
+        drain_timeout: Seconds shutdown waits for in-flight requests before
+                       stopping background tasks and closing connections (default: 30)
         database: Database connection configuration
         cors: CORS configuration
+        cache: Redirect cache configuration
+        filter: Negative-lookup filter configuration
+        code: Short code generation configuration
+        short: Short URL endpoints configuration
+        clicks: Click counting configuration
+        expiry: Expired short URL sweeper configuration
+        metrics: Prometheus metrics configuration
+        redirect: Redirect serving configuration
+        snapshot: Redirect cache snapshot configuration
 
     All fields can be overridden via environment variables using:
     - CONFIG__ prefix
@@ -32,9 +52,33 @@ class ApplicationConfig(BaseSettings):
     description: str = Field(default="An API for creating and interacting with short URLs")
     redoc_url: str = Field(default="/redoc")
     docs_url: str = Field(default="/")
+    drain_timeout: float = Field(default=30, ge=0)
 
     database: DatabaseConfig = DatabaseConfig()
     cors: CORSConfig = CORSConfig()
+    cache: CacheConfig = CacheConfig()
+    filter: FilterConfig = FilterConfig()
+    code: CodeConfig = CodeConfig()
+    short: ShortConfig = ShortConfig()
+    clicks: ClicksConfig = ClicksConfig()
+    expiry: ExpiryConfig = ExpiryConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    redirect: RedirectConfig = RedirectConfig()
+    snapshot: SnapshotConfig = SnapshotConfig()
+
+    @model_validator(mode="after")
+    def check_backend(self) -> "ApplicationConfig":
+        """
+        Reject code generation strategies the storage backend cannot serve.
+
+        The sequence and reservoir strategies rely on PostgreSQL sequences,
+        VALUES lists and interval arithmetic.
+        """
+
+        if self.database.backend != "postgres" and self.code.strategy != "random":
+            raise ValueError(f"Code strategy '{self.code.strategy}' requires the postgres backend")
+
+        return self
 
     class Config:
         """
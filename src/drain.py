@@ -0,0 +1,63 @@
+import asyncio
+
+from time import monotonic
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+POLL_INTERVAL: float = 0.05
+
+
+class InFlightRequests:
+    """
+    Counter of HTTP requests being served, for draining them on shutdown.
+    """
+
+    def __init__(self) -> None:
+        self.count: int = 0
+
+    async def drain(self, timeout: float) -> int:
+        """
+        Wait until no request is in flight or the timeout passes.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Number of requests still in flight
+        """
+
+        deadline: float = monotonic() + timeout
+
+        while self.count and monotonic() < deadline:
+            await asyncio.sleep(POLL_INTERVAL)
+
+        return self.count
+
+
+in_flight: InFlightRequests = InFlightRequests()
+
+
+class DrainMiddleware:
+    """ASGI middleware counting in-flight HTTP requests in `in_flight`.
+
+    Args:
+        app: Wrapped application
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        in_flight.count += 1
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            in_flight.count -= 1
+
+
+__all__ = ["DrainMiddleware", "in_flight"]
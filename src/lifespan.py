@@ -0,0 +1,117 @@
+import asyncio
+import logging
+
+from contextlib import asynccontextmanager
+
+from typing import AsyncIterator, List, Set
+
+from fastapi import FastAPI
+
+from infrastructure.database import database
+from infrastructure.database.models import Base
+from infrastructure.metrics import release
+
+from .config import config
+from .drain import in_flight
+from .tasks import (run_code_filter, run_code_reservoir, run_click_flush, run_click_compaction, run_expiry_sweep,
+                    run_metrics_sync, warm_up_pools, preload_cache, load_snapshot, run_cache_snapshot, purges)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+RECANCEL_INTERVAL: float = 5
+
+
+async def stop(tasks: List[asyncio.Task]) -> None:
+    """
+    Cancel background tasks and wait for them to finish.
+
+    A cancellation that arrives just as a pool checkout completes can be
+    lost inside `asyncio.wait_for`, leaving the task running; tasks still
+    alive after `RECANCEL_INTERVAL` seconds are cancelled again.
+
+    Args:
+        tasks: Tasks to stop
+    """
+
+    pending: Set[asyncio.Task] = set(tasks)
+
+    while pending:
+        for task in pending:
+            task.cancel()
+
+        _, pending = await asyncio.wait(pending, timeout=RECANCEL_INTERVAL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Prepare the worker and start background tasks on startup; drain and stop it on shutdown.
+
+    Backends without migrations get their schema created first. Then the
+    connection pools are filled and the redirect cache is loaded from the
+    node's hot-set snapshot and with the most clicked codes, so the first
+    requests after a restart neither wait for connections nor all miss the
+    cache. On shutdown, in-flight requests and running deletions of all
+    short URLs get up to `drain_timeout` seconds to finish before background tasks stop
+    (flushing what they buffered) and the pools are disposed.
+
+    Args:
+        app: Application instance
+    """
+
+    tasks: List[asyncio.Task] = []
+
+    if config.database.backend != "postgres":
+        await database.create_all(Base.metadata)
+
+    if config.database.warm_up:
+        await warm_up_pools()
+
+    snapshot: bool = config.cache.enabled and config.snapshot.enabled and config.database.backend != "memory"
+
+    if snapshot:
+        load_snapshot()
+
+    if config.cache.enabled and config.cache.preload:
+        await preload_cache()
+
+    if config.filter.enabled:
+        tasks.append(asyncio.create_task(run_code_filter()))
+
+    if config.code.strategy == "reservoir":
+        tasks.append(asyncio.create_task(run_code_reservoir()))
+
+    if config.clicks.enabled:
+        tasks.append(asyncio.create_task(run_click_flush()))
+        tasks.append(asyncio.create_task(run_click_compaction()))
+
+    if config.expiry.enabled:
+        tasks.append(asyncio.create_task(run_expiry_sweep()))
+
+    if config.metrics.enabled:
+        tasks.append(asyncio.create_task(run_metrics_sync()))
+
+    if snapshot:
+        tasks.append(asyncio.create_task(run_cache_snapshot()))
+
+    yield
+
+    if remaining := await in_flight.drain(timeout=config.drain_timeout):
+        logger.warning("Shutting down with %d requests still in flight", remaining)
+
+    if purges:
+        _, unfinished = await asyncio.wait(set(purges), timeout=config.drain_timeout)
+
+        if unfinished:
+            logger.warning("Shutting down with %d deletions of all short URLs unfinished", len(unfinished))
+            await stop(list(unfinished))
+
+    await stop(tasks)
+
+    if config.metrics.enabled:
+        release()
+
+    await database.dispose()
+
+
+__all__ = ["lifespan"]
@@ -4,7 +4,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import JSONResponse
 
 from .config import config
+from .drain import DrainMiddleware
+from .lifespan import lifespan
 from .routers import router
+from .routers.metrics import MetricsMiddleware
+from .routers.redirect import RedirectMiddleware
 
 app: FastAPI = FastAPI(
     debug=config.debug,
@@ -12,7 +16,8 @@ app: FastAPI = FastAPI(
     description=config.description,
     default_response_class=JSONResponse,
     docs_url=config.docs_url,
-    redoc_url=config.redoc_url
+    redoc_url=config.redoc_url,
+    lifespan=lifespan
 )
 app.add_middleware(
     CORSMiddleware,
@@ -24,4 +29,12 @@ app.add_middleware(
 )
 app.include_router(router)
 
+if config.redirect.fast_path:
+    app.add_middleware(RedirectMiddleware)
+
+if config.metrics.enabled:
+    app.add_middleware(MetricsMiddleware)
+
+app.add_middleware(DrainMiddleware)
+
 __all__ = ["app"]
@@ -0,0 +1,4 @@
+from .views import router
+from .middleware import MetricsMiddleware
+
+__all__ = ["router", "MetricsMiddleware"]
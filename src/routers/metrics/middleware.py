@@ -0,0 +1,49 @@
+from time import perf_counter
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.metrics import request_count, request_latency
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request counts and latencies per route.
+
+    Requests are labelled with the template of the matched route, e.g.
+    /redirects/{code}, so label cardinality stays bounded; requests that
+    match no route share the "unmatched" label.
+
+    Args:
+        app: Wrapped application
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started: float = perf_counter()
+        status: int = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route: BaseRoute | None = scope.get("route")
+            template: str = getattr(route, "path_format", None) or getattr(route, "path", None) or "unmatched"
+
+            request_latency.labels(method=scope["method"], route=template).observe(perf_counter() - started)
+            request_count.labels(method=scope["method"], route=template, status=status).inc()
+
+
+__all__ = ["MetricsMiddleware"]
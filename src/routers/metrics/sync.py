@@ -0,0 +1,58 @@
+from typing import Dict, Tuple
+
+from prometheus_client import Counter
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from infrastructure.analytics import click_buffer
+from infrastructure.cache import redirect_cache, code_filter
+from infrastructure.database import database
+from infrastructure.metrics import pool_checked_out, pool_overflow, clicks_dropped, cache_hits, cache_misses
+
+seen: Dict[Tuple[str, str], int] = {}
+
+
+def advance(counter: Counter, source: str, kind: str, value: int, labelled: bool = True) -> None:
+    """
+    Increment a counter by how much a cumulative statistic grew since the last sync.
+
+    Args:
+        counter: Counter to increment
+        source: Component keeping the statistic, also the counter's cache label if `labelled`
+        kind: Name of the statistic
+        value: Current value of the statistic
+        labelled: Whether the counter has a cache label (default: True)
+    """
+
+    delta: int = value - seen.get((source, kind), 0)
+
+    if delta > 0:
+        (counter.labels(cache=source) if labelled else counter).inc(delta)
+
+    seen[(source, kind)] = value
+
+
+def sync_metrics() -> None:
+    """
+    Copy pool, lookup layer and click buffer statistics of this worker into metrics.
+
+    Lookup layers keep plain integer counters on the hot path; they are
+    turned into Prometheus counter increments here, so redirects pay
+    nothing for instrumentation.
+    """
+
+    engines: Dict[str, AsyncEngine] = {"primary": database.engine}
+    engines.update((f"replica{index}", engine) for index, engine in enumerate(database.replicas))
+
+    for name, engine in engines.items():
+        pool_checked_out.labels(database=name).set(engine.pool.checkedout())
+        pool_overflow.labels(database=name).set(max(0, engine.pool.overflow()))
+
+    advance(cache_hits, "redirect_cache", "hits", redirect_cache.hits)
+    advance(cache_misses, "redirect_cache", "misses", redirect_cache.misses)
+    advance(cache_hits, "code_filter", "hits", code_filter.rejections)
+    advance(cache_misses, "code_filter", "misses", code_filter.passes)
+    advance(clicks_dropped, "click_buffer", "dropped", click_buffer.dropped, labelled=False)
+
+
+__all__ = ["sync_metrics"]
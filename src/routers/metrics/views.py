@@ -0,0 +1,45 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter
+
+from starlette.responses import Response
+
+from infrastructure.metrics import CONTENT_TYPE_LATEST, render
+
+from .sync import sync_metrics
+
+router: APIRouter = APIRouter(
+    prefix="/metrics",
+    tags=["metrics"]
+)
+
+
+@router.get(
+    path="",
+    response_class=Response,
+    status_code=HTTPStatus.OK,
+    summary="Get Prometheus metrics",
+    description="""Returns request, database, pool and lookup layer metrics in the Prometheus text format.
+
+    With PROMETHEUS_MULTIPROC_DIR set, samples of every worker are aggregated.
+    Lookup layer hit ratios are derived from cache_hits_total and cache_misses_total.
+    """,
+    response_description="Prometheus exposition document"
+)
+async def get_metrics() -> Response:
+    """
+    Endpoint for Prometheus scrapes.
+
+    Runs on the event loop rather than in the threadpool, as the metrics
+    sync task does, so the two never update the synced statistics at once.
+
+    Returns:
+        Response: Metrics in the Prometheus text format
+    """
+
+    sync_metrics()
+
+    return Response(content=render(), media_type=CONTENT_TYPE_LATEST)
+
+
+__all__ = ["router"]
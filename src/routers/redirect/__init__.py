@@ -1,3 +1,4 @@
 from .views import router
+from .middleware import RedirectMiddleware
 
-__all__ = ["router"]
\ No newline at end of file
+__all__ = ["router", "RedirectMiddleware"]
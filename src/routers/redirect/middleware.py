@@ -0,0 +1,109 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+from http import HTTPStatus
+from time import time
+from urllib.parse import quote
+
+from typing import List, Optional, Tuple
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.config import config
+
+from infrastructure.analytics import click_buffer
+from infrastructure.cache import RedirectEntry
+
+from .resolver import resolve, RESOLVED
+from .views import router, get_redirect
+
+PREFIX: str = "/redirects/"
+CODE_MAX_LENGTH: int = 6
+
+route: BaseRoute = next(route for route in router.routes if getattr(route, "endpoint", None) is get_redirect)
+
+
+@lru_cache(maxsize=config.cache.max_size)
+def redirect_headers(url: str) -> List[Tuple[bytes, bytes]]:
+    """
+    Build the raw headers of a redirect to a URL, as RedirectResponse behind
+    CORSMiddleware would for a request without an Origin header.
+    """
+
+    return [
+        (b"location", quote(url, safe=":/%#?=@[]!$&'()*+,;").encode("latin-1")),
+        (b"content-length", b"0"),
+        (b"vary", b"Origin"),
+    ]
+
+
+class RedirectMiddleware:
+    """ASGI fast path answering plain redirects ahead of CORS and routing.
+
+    Matches GET /redirects/{code} on the raw scope and resolves the code
+    through the redirect cache or repository, then sends the 307 with
+    headers built once per URL; no request, dependency or response objects
+    are created. Requests asking for JSON and cross-origin requests, which
+    need CORS headers, are passed on untouched. So are codes that resolve
+    to nothing, deactivated or expired short URLs; their entry travels in
+    the scope so the route answers the error without a second lookup.
+
+    The scope is labelled with the redirect route, so metrics count fast
+    path redirects under the same route as the rest.
+
+    Args:
+        app: Wrapped application
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app: ASGIApp = app
+
+    @staticmethod
+    def _plain(scope: Scope) -> bool:
+        """
+        Whether the request wants a plain redirect and needs no CORS headers.
+        """
+
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                return False
+
+            if name == b"accept" and value == b"application/json":
+                return False
+
+        return True
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path: str = scope.get("path", "")
+
+        if (scope["type"] != "http"
+                or scope["method"] != "GET"
+                or not path.startswith(PREFIX)
+                or not 0 < len(code := path[len(PREFIX):]) <= CODE_MAX_LENGTH
+                or "/" in code
+                or not self._plain(scope)):
+            await self.app(scope, receive, send)
+            return
+
+        scope["route"] = route
+        entry: Optional[RedirectEntry] = await resolve(code)
+
+        if (entry is None
+                or not entry.is_activated
+                or entry.expires_at is not None and entry.expires_at <= datetime.now(tz=timezone.utc)):
+            scope[RESOLVED] = entry
+            await self.app(scope, receive, send)
+            return
+
+        if config.clicks.enabled:
+            click_buffer.add((entry.id, int(time() // 3600)))
+
+        await send({
+            "type": "http.response.start",
+            "status": HTTPStatus.TEMPORARY_REDIRECT.value,
+            "headers": redirect_headers(entry.url),
+        })
+        await send({"type": "http.response.body", "body": b""})
+
+
+__all__ = ["RedirectMiddleware"]
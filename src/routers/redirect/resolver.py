@@ -0,0 +1,114 @@
+import asyncio
+
+from datetime import datetime, timedelta, timezone
+from functools import partial
+
+from typing import Callable, Optional
+
+from sqlalchemy import Row
+
+from src.config import config
+
+from infrastructure.cache import redirect_cache, code_filter, RedirectEntry
+from infrastructure.database import database
+from infrastructure.database.crud import ShortRepository
+
+RESOLVED: str = "redirect.entry"
+"""Scope key holding the entry a layer in front of the route already resolved."""
+
+
+async def resolve(code: str) -> Optional[RedirectEntry]:
+    """
+    Find the redirect entry of a short code.
+
+    Entries are served from the in-process redirect cache when possible,
+    so cache hits never open a database session. Codes the negative-lookup
+    filter knows to be absent are answered without a query. Misses select
+    only the columns a redirect needs from a read replica. Codes the
+    replica does not know, and rows changed within the replica lag, which
+    the replica may not have caught up with, are read from the primary.
+    Cached entries never outlive the expiry of the short URL they hold.
+    Every lookup is counted in the request session metric, as used only
+    when it reached the database.
+
+    Args:
+        code: Short code
+
+    Returns:
+        The entry, deactivated and expired ones included, or None if no short URL has the code
+    """
+
+    entry: Optional[RedirectEntry] = redirect_cache.get(code)
+
+    if entry is not None:
+        database.count_request(used=False)
+
+        return entry
+
+    if code not in code_filter:
+        database.count_request(used=False)
+
+        return None
+
+    database.count_request(used=True)
+
+    async with database.read_session_factory() as session:
+        row: Optional[Row] = await ShortRepository().get_redirect(session=session, code=code)
+
+    if database.replicas and (not row or row.last_updated_at > datetime.now(tz=timezone.utc) - timedelta(
+            seconds=config.database.replica_lag)):
+        async with database.session_factory() as session:
+            row = await ShortRepository().get_redirect(session=session, code=code)
+
+    if not row:
+        return None
+
+    entry = RedirectEntry(*row[:4])
+    remember(code, entry)
+
+    return entry
+
+
+def forget(code: Optional[str] = None) -> None:
+    """
+    Drop a code, or every code, from the redirect cache after a change.
+
+    With read replicas, the invalidation is repeated once the replica lag
+    has passed, so a lookup served by a replica that had not caught up
+    with the change in the meantime does not stay cached.
+
+    Args:
+        code: Short code, or None for all of them
+    """
+
+    invalidate: Callable[[], None] = redirect_cache.clear if code is None else partial(redirect_cache.delete, code)
+    invalidate()
+
+    if database.replicas:
+        asyncio.get_running_loop().call_later(config.database.replica_lag, invalidate)
+
+
+def remember(code: str, entry: RedirectEntry, ttl: Optional[float] = None) -> None:
+    """
+    Cache a redirect entry, for no longer than the short URL it holds lives.
+
+    Args:
+        code: Short code
+        entry: Redirect entry of the code
+        ttl: Shorter lifetime in seconds than the cache TTL, e.g. what is
+             left of it for an entry looked up earlier
+    """
+
+    if ttl is not None:
+        ttl = min(config.cache.ttl, ttl)
+
+    if entry.expires_at is not None:
+        remaining: float = (entry.expires_at - datetime.now(tz=timezone.utc)).total_seconds()
+
+        if remaining > 0:
+            ttl = min(config.cache.ttl if ttl is None else ttl, remaining)
+
+    redirect_cache.set(code, entry, ttl=ttl)
+
+
+__all__ = ["resolve", "forget", "remember", "RESOLVED"]
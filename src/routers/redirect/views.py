@@ -1,19 +1,20 @@
+from datetime import datetime, timezone
 from http import HTTPStatus
+from time import time
 
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, Path, Request, HTTPException
-
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Path, Request, HTTPException
 
 from starlette.responses import RedirectResponse
 
+from src.config import config
 from src.routers.schemas import ErrorResponse, Message, Response
 
-from infrastructure.database import database
-from infrastructure.database.models import Short
-from infrastructure.database.crud import ShortRepository
+from infrastructure.analytics import click_buffer
+from infrastructure.cache import RedirectEntry
 
+from .resolver import resolve, RESOLVED
 from .schemas import GetShortByCode, ResponseShort
 
 router: APIRouter = APIRouter(
@@ -44,26 +45,33 @@ router: APIRouter = APIRouter(
     - Performs 307 redirect to original URL by default
     """
 )
-async def get_redirect(session: Annotated[AsyncSession, Depends(database.session)],
-                       model: Annotated[GetShortByCode, Path()],
+async def get_redirect(model: Annotated[GetShortByCode, Path()],
                        request: Request) -> Response | RedirectResponse:
     """Handle short URL redirection with content negotiation.
 
     Args:
-        session: Database session
         code: Short code for the URL
         request: Original request for header inspection
 
+    Lookups go through `resolve`, so cache hits never touch the database
+    and a database session is only opened on a miss. Plain redirects are
+    usually answered by the fast path in front of the application; the
+    entries it resolved but could not serve arrive here in the scope and
+    are not looked up again. Redirects are counted in memory and flushed
+    to the database in the background.
+
     Returns:
         JSON response if client accepts JSON, otherwise performs redirect
 
     Raises:
-        HTTPException 404: If short code doesn't exist
+        HTTPException 404: If short code doesn't exist, is deactivated or has expired
     """
 
-    short: Optional[Short] = await ShortRepository().get(session=session, target=Short.code, value=model.code)
+    entry: Optional[RedirectEntry] = (
+        request.scope[RESOLVED] if RESOLVED in request.scope else await resolve(model.code)
+    )
 
-    if not short:
+    if entry is None:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail=ErrorResponse(
@@ -71,16 +79,33 @@ async def get_redirect(session: Annotated[AsyncSession, Depends(database.session
             ).model_dump()
         )
 
-    model: ResponseShort = ResponseShort.model_validate(short)
+    if not entry.is_activated:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=ErrorResponse(
+                detail=[Message(msg="Short link with such code is deactivated")]
+            ).model_dump()
+        )
+
+    if entry.expires_at is not None and entry.expires_at <= datetime.now(tz=timezone.utc):
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=ErrorResponse(
+                detail=[Message(msg="Short link with such code has expired")]
+            ).model_dump()
+        )
 
     if request.headers.get("accept") == "application/json":
         return Response(
             detail=[Message(msg="Original URL received")],
-            content=[model]
+            content=[ResponseShort.model_validate(entry)]
         )
 
+    if config.clicks.enabled:
+        click_buffer.add((entry.id, int(time() // 3600)))
+
     return RedirectResponse(
-        url=short.url,
+        url=entry.url,
         status_code=HTTPStatus.TEMPORARY_REDIRECT,
-        headers={"Location": model.url}
+        headers={"Location": entry.url}
     )
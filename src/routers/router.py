@@ -2,9 +2,13 @@ from http import HTTPStatus
 
 from fastapi import APIRouter
 
+from src.config import config
+
 from .health import router as health_router
 from .short import router as short_router
 from .redirect import router as redirect_router
+from .stats import router as stats_router
+from .metrics import router as metrics_router
 from .schemas import ErrorResponse
 
 router: APIRouter = APIRouter(
@@ -20,5 +24,9 @@ router: APIRouter = APIRouter(
 router.include_router(health_router)
 router.include_router(short_router)
 router.include_router(redirect_router)
+router.include_router(stats_router)
+
+if config.metrics.enabled:
+    router.include_router(metrics_router)
 
 __all__ = ["router"]
@@ -36,6 +36,17 @@ class Response(BaseResponse):
     success: bool = Field(default=True)
 
 
+class PageResponse(Response):
+    """
+    Standard success response structure for paginated content
+
+    Attributes:
+        next_cursor: Opaque cursor of the next page, None on the last page
+    """
+
+    next_cursor: Optional[str] = Field(default=None)
+
+
 class ErrorResponse(BaseResponse):
     """
     Standard error response structure
@@ -44,4 +55,4 @@ class ErrorResponse(BaseResponse):
     success: bool = Field(default=False)
 
 
-__all__ = ["Message", "Response", "ErrorResponse"]
\ No newline at end of file
+__all__ = ["Message", "Response", "PageResponse", "ErrorResponse"]
\ No newline at end of file
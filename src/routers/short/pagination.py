@@ -0,0 +1,51 @@
+import base64
+import binascii
+import json
+import uuid
+
+from datetime import datetime
+
+from typing import Tuple
+
+from infrastructure.database.models import Short
+
+
+def encode_cursor(short: Short) -> str:
+    """
+    Build an opaque page cursor pointing right after a short URL.
+
+    Args:
+        short: Last short URL of the current page
+
+    Returns:
+        URL-safe cursor token
+    """
+
+    payload: bytes = json.dumps([short.created_at.isoformat(), str(short.id)]).encode()
+
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Extract the keyset position from a page cursor.
+
+    Args:
+        cursor: Cursor token produced by `encode_cursor`
+
+    Returns:
+        (created_at, id) of the last short URL of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+
+    try:
+        created_at, id_ = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+
+        return datetime.fromisoformat(created_at), uuid.UUID(id_)
+    except (binascii.Error, TypeError, ValueError) as error:
+        raise ValueError("Malformed cursor") from error
+
+
+__all__ = ["encode_cursor", "decode_cursor"]
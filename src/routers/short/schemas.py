@@ -1,6 +1,6 @@
 import uuid
 
-from typing import Annotated, Optional
+from typing import Annotated, Optional, List, Literal
 from annotated_types import MinLen, MaxLen
 
 from datetime import datetime
@@ -89,4 +89,100 @@ class CreateShort(BaseModel):
     )
 
 
-__all__ = ["BaseShort", "UpdateShort", "GetShortByID", "CreateShort"]
+class ImportShort(CreateShort):
+    """Model for one short URL record of a bulk import"""
+
+    is_activated: bool = Field(
+        default=True,
+        description="Whether the short URL is active and can be used"
+    )
+
+class ImportResult(BaseModel):
+    """Model for the outcome of a bulk import"""
+
+    inserted: int = Field(
+        ...,
+        description="Number of created short URLs"
+    )
+    conflicting: int = Field(
+        ...,
+        description="Number of valid records skipped because their code was taken"
+    )
+    invalid: int = Field(
+        ...,
+        description="Number of records that failed validation"
+    )
+
+class ClickBucket(BaseModel):
+    """Model for hits of a short URL within one time bucket"""
+
+    bucket: datetime = Field(
+        ...,
+        description="Start of the time bucket (UTC)"
+    )
+    hits: int = Field(
+        ...,
+        description="Number of redirects served within the bucket"
+    )
+
+class ClickStats(BaseModel):
+    """Model for click statistics of a short URL over a time range"""
+
+    id: uuid.UUID = Field(
+        ...,
+        description="Unique identifier for the short URL"
+    )
+    granularity: Literal["hour", "day"] = Field(
+        ...,
+        description="Size of the time buckets"
+    )
+    total: int = Field(
+        ...,
+        description="Number of redirects served within the range"
+    )
+    buckets: List[ClickBucket] = Field(
+        ...,
+        description="Non-empty time buckets ordered by time"
+    )
+
+class BatchItem(BaseModel):
+    """Model for the outcome of one item of a batch creation"""
+
+    index: int = Field(
+        ...,
+        description="Position of the item in the request body"
+    )
+    success: bool = Field(
+        ...,
+        description="Whether the short URL was created"
+    )
+    msg: Optional[str] = Field(
+        default=None,
+        description="Reason the item was not created"
+    )
+    short: Optional[BaseShort] = Field(
+        default=None,
+        description="Created short URL"
+    )
+
+class DeletedShorts(BaseModel):
+    """Model for the number of deleted short URL objects"""
+
+    count: int = Field(
+        ...,
+        description="Number of deleted short URLs"
+    )
+
+
+__all__ = [
+    "BaseShort",
+    "UpdateShort",
+    "GetShortByID",
+    "CreateShort",
+    "ImportShort",
+    "ImportResult",
+    "BatchItem",
+    "DeletedShorts",
+    "ClickBucket",
+    "ClickStats",
+]
@@ -1,3 +1,4 @@
-from .service import Service
+from .service import Service, generators
+from .importer import Format, Importer, read_lines
 
-__all__ = ["Service"]
+__all__ = ["Service", "generators", "Format", "Importer", "read_lines"]
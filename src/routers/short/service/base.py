@@ -1,9 +1,27 @@
 from abc import ABC, abstractmethod
 
+from typing import List
+
+from .generators import BaseCodeGenerator
+
 
 class BaseService(ABC):
+    """
+    Abstract base class for short URL services.
+
+    Args:
+        generator: Code generation strategy used by `generate_code`
+    """
+
+    def __init__(self, generator: BaseCodeGenerator) -> None:
+        self.generator: BaseCodeGenerator = generator
+
     @abstractmethod
     async def generate_code(self, *args, **kwargs) -> str:
         raise NotImplementedError()
 
-__all__ = ["BaseService"]
\ No newline at end of file
+    @abstractmethod
+    async def generate_codes(self, *args, **kwargs) -> List[str]:
+        raise NotImplementedError()
+
+__all__ = ["BaseService"]
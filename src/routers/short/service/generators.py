@@ -0,0 +1,296 @@
+import asyncio
+import os
+import random
+import socket
+import uuid
+
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import timedelta
+
+from typing import Collection, Deque, List, Optional, Set
+
+from sqlalchemy import Sequence, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database import database
+from infrastructure.database.crud import ShortRepository, ReservationRepository
+from infrastructure.database.models import Short, short_code_sequence
+
+from .permutation import ALPHABET, encode_base62, FeistelPermutation
+
+REFILL_IDLE_ROUNDS: int = 3
+"""Consecutive reservation queries reserving nothing after which a refill gives up"""
+
+
+class BaseCodeGenerator(ABC):
+    """
+    Abstract base class for short code generation strategies.
+
+    Args:
+        length: Length of generated codes
+    """
+
+    def __init__(self, length: int) -> None:
+        self.length: int = length
+
+    @abstractmethod
+    async def generate(self, session: AsyncSession) -> str:
+        """
+        Generate a short code that is not used by any existing short URL.
+
+        Must be implemented by concrete subclasses.
+        """
+
+        raise NotImplementedError()
+
+    async def generate_many(self, session: AsyncSession, count: int) -> List[str]:
+        """
+        Generate several distinct codes.
+
+        Args:
+            session: Async database session
+            count: Number of codes to generate
+
+        Returns:
+            Generated codes
+        """
+
+        return [await self.generate(session=session) for _ in range(count)]
+
+
+def random_code(length: int) -> str:
+    """
+    Draw a random code from the short code alphabet.
+
+    Args:
+        length: Length of the code
+
+    Returns:
+        Random code
+    """
+
+    return "".join(random.choice(ALPHABET) for _ in range(length))
+
+
+class RandomCodeGenerator(BaseCodeGenerator):
+    """
+    Draws random codes and probes the database until a free one is found.
+
+    Costs one query per attempt; attempts grow as the keyspace fills up.
+    """
+
+    async def generate(self, session: AsyncSession) -> str:
+        while True:
+            code: str = random_code(self.length)
+
+            exist: Optional[Short] = await ShortRepository().get(
+                session=session,
+                target=Short.code,
+                value=code
+            )
+
+            if not exist:
+                return code
+
+    async def generate_many(self, session: AsyncSession, count: int) -> List[str]:
+        """
+        Draw distinct random codes without probing the database.
+
+        Callers must insert them with a conflict-aware statement and retry
+        the codes that turn out to be taken.
+        """
+
+        codes: Set[str] = set()
+
+        while len(codes) < count:
+            codes.add(random_code(self.length))
+
+        return list(codes)
+
+
+class SequenceCodeGenerator(BaseCodeGenerator):
+    """
+    Maps database sequence values through a keyed permutation of the keyspace.
+
+    Sequence values are leased in blocks, so most codes are produced without
+    any database work and none of them needs an existence probe. Generated
+    codes never collide with each other; they can only collide with custom
+    codes chosen by clients.
+
+    Args:
+        length: Length of generated codes
+        secret: Permutation key
+        block_size: Sequence values leased per database round trip
+        sequence: Database sequence to lease values from
+    """
+
+    def __init__(
+            self,
+            length: int,
+            secret: bytes,
+            block_size: int,
+            sequence: Sequence = short_code_sequence
+    ) -> None:
+        super().__init__(length=length)
+
+        self._domain: int = len(ALPHABET) ** length
+        self._permutation: FeistelPermutation = FeistelPermutation(domain=self._domain, key=secret)
+        self._block_size: int = block_size
+        self._sequence: Sequence = sequence
+        self._block: Deque[int] = deque()
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def _lease(self, session: AsyncSession) -> None:
+        result = await session.scalars(
+            select(self._sequence.next_value()).select_from(func.generate_series(1, self._block_size))
+        )
+
+        self._block.extend(sorted(result.all()))
+
+    async def generate(self, session: AsyncSession) -> str:
+        if not self._block:
+            async with self._lock:
+                if not self._block:
+                    await self._lease(session=session)
+
+        value: int = self._block.popleft() - 1
+
+        if value >= self._domain:
+            raise OverflowError("Short code keyspace is exhausted")
+
+        return encode_base62(self._permutation.permute(value), self.length)
+
+
+class ReservoirCodeGenerator(BaseCodeGenerator):
+    """
+    Pops codes from a per-worker reservoir of codes reserved ahead of time.
+
+    Codes are verified unique and reserved in bulk by `refill`, which a
+    background task runs whenever the reservoir drops below the low
+    watermark, so `generate` does no database work unless the reservoir
+    runs dry. Reservations are leased: the owner renews the codes it still
+    holds, and leases of used or leaked codes expire and are reclaimed.
+
+    Args:
+        length: Length of generated codes
+        low_watermark: Reservoir size that triggers a refill
+        high_watermark: Reservoir size a refill stops at
+        batch_size: Candidate codes per reservation query
+        lease: Reservation lifetime unless renewed
+    """
+
+    def __init__(
+            self,
+            length: int,
+            low_watermark: int,
+            high_watermark: int,
+            batch_size: int,
+            lease: timedelta
+    ) -> None:
+        super().__init__(length=length)
+
+        self.owner: str = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._low_watermark: int = low_watermark
+        self._high_watermark: int = high_watermark
+        self._batch_size: int = batch_size
+        self._lease: timedelta = lease
+        self._reservoir: Deque[str] = deque()
+        self._starving: asyncio.Event = asyncio.Event()
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._reservoir)
+
+    async def wait(self, timeout: float) -> None:
+        """
+        Wait until the reservoir needs a refill or the timeout elapses.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+        """
+
+        try:
+            await asyncio.wait_for(self._starving.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def refill(self) -> None:
+        """
+        Reserve codes in bulk until the reservoir reaches the high watermark.
+
+        Gives up after `REFILL_IDLE_ROUNDS` queries in a row reserve nothing,
+        e.g. once the keyspace of short codes is exhausted.
+
+        Raises:
+            OverflowError: If the reservoir is still empty when giving up
+        """
+
+        idle: int = 0
+
+        async with self._lock:
+            async with database.session_factory() as session:
+                while len(self._reservoir) < self._high_watermark and idle < REFILL_IDLE_ROUNDS:
+                    candidates: Set[str] = {
+                        random_code(self.length)
+                        for _ in range(min(self._batch_size, self._high_watermark - len(self._reservoir)))
+                    }
+
+                    reserved: Collection[str] = await ReservationRepository().reserve(
+                        session=session,
+                        codes=candidates,
+                        owner=self.owner,
+                        lease=self._lease
+                    )
+
+                    self._reservoir.extend(reserved)
+                    idle = 0 if reserved else idle + 1
+
+            self._starving.clear()
+
+        if not self._reservoir:
+            raise OverflowError("No free short code could be reserved")
+
+    async def renew(self) -> None:
+        """
+        Extend the lease of held codes and reclaim expired reservations.
+        """
+
+        async with database.session_factory() as session:
+            await ReservationRepository().renew(
+                session=session,
+                codes=list(self._reservoir),
+                owner=self.owner,
+                lease=self._lease
+            )
+            await ReservationRepository().reclaim(session=session)
+
+    async def release(self) -> None:
+        """
+        Drop the reservoir and release every reservation of this worker.
+        """
+
+        self._reservoir.clear()
+
+        async with database.session_factory() as session:
+            await ReservationRepository().release(session=session, owner=self.owner)
+
+    async def generate(self, session: AsyncSession) -> str:
+        if not self._reservoir:
+            await self.refill()
+
+        code: str = self._reservoir.popleft()
+
+        if len(self._reservoir) < self._low_watermark:
+            self._starving.set()
+
+        return code
+
+
+__all__ = [
+    "BaseCodeGenerator",
+    "RandomCodeGenerator",
+    "SequenceCodeGenerator",
+    "ReservoirCodeGenerator",
+]
@@ -0,0 +1,176 @@
+import codecs
+import csv
+import json
+
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, List, Literal, Optional, Sequence, Tuple
+
+from pydantic import ValidationError
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database.crud import ShortRepository
+
+from ..schemas import ImportShort, ImportResult
+from .service import Service
+
+Format = Literal["ndjson", "csv"]
+
+READ_SIZE: int = 1 << 16
+
+
+async def read_lines(read: Callable[[int], Awaitable[bytes]]) -> AsyncIterator[str]:
+    """
+    Split a UTF-8 byte stream into lines without reading it whole.
+
+    Args:
+        read: Coroutine function returning up to the requested number of bytes,
+              or empty bytes at the end of the stream
+
+    Yields:
+        Lines without trailing newline characters
+    """
+
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    tail: str = ""
+
+    while chunk := await read(READ_SIZE):
+        lines: List[str] = (tail + decoder.decode(chunk)).split("\n")
+        tail = lines.pop()
+
+        for line in lines:
+            yield line.rstrip("\r")
+
+    tail += decoder.decode(b"", final=True)
+
+    if tail:
+        yield tail.rstrip("\r")
+
+
+class Importer:
+    """
+    Streams short URL records into the database through a COPY staging table.
+
+    Records are validated one at a time, copied to a temporary table in
+    batches and merged into the short URLs table with a single
+    conflict-aware statement, all within one transaction. Records without a
+    code get one from the configured generation strategy; if such a code
+    turns out to be taken the record is counted as conflicting.
+
+    Args:
+        batch_size: Validated records copied to the staging table at once
+    """
+
+    def __init__(self, batch_size: int) -> None:
+        self._batch_size: int = batch_size
+
+    @staticmethod
+    async def _parse(lines: AsyncIterable[str], fmt: Format) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Turn document lines into raw records; unparseable lines become None and fail validation.
+
+        A CSV record continues over following lines while a quoted field is
+        open, so quoted values may contain line breaks.
+        """
+
+        header: List[str] = []
+        record: str = ""
+
+        async for line in lines:
+            if fmt == "ndjson":
+                if not line.strip():
+                    continue
+
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    yield None
+
+                continue
+
+            record += line
+
+            # Quotes inside quoted fields are doubled, so an odd count means the field is still open
+            if record.count('"') % 2:
+                record += "\n"
+                continue
+
+            text, record = record, ""
+
+            if not text.strip():
+                continue
+
+            row: List[str] = next(csv.reader([text]))
+
+            if not header:
+                header = row
+                continue
+
+            yield {key: value for key, value in zip(header, row) if value != ""}
+
+        if record:
+            yield None
+
+    async def _copy(self, session: AsyncSession, batch: List[ImportShort]) -> None:
+        codes: List[str] = await Service().generate_codes(
+            session=session,
+            count=sum(model.code is None for model in batch)
+        )
+        records: List[Tuple[Any, ...]] = [
+            (model.code or codes.pop(), str(model.url), model.is_activated, model.expires_at)
+            for model in batch
+        ]
+
+        await ShortRepository().copy_to_staging(session=session, records=records)
+
+    async def run(
+            self,
+            session: AsyncSession,
+            lines: AsyncIterable[str],
+            fmt: Format,
+            on_insert: Optional[Callable[[str], None]] = None
+    ) -> ImportResult:
+        """
+        Import short URL records.
+
+        Args:
+            session: Async database session
+            lines: Lines of the NDJSON or CSV document
+            fmt: Document format
+            on_insert: Called with the code of every inserted short URL
+
+        Returns:
+            Numbers of inserted, conflicting and invalid records
+        """
+
+        staged: int = 0
+        invalid: int = 0
+        batch: List[ImportShort] = []
+
+        await ShortRepository().create_staging(session=session)
+
+        async for record in self._parse(lines=lines, fmt=fmt):
+            try:
+                batch.append(ImportShort.model_validate(record))
+            except ValidationError:
+                invalid += 1
+                continue
+
+            if len(batch) >= self._batch_size:
+                await self._copy(session=session, batch=batch)
+                staged += len(batch)
+                batch = []
+
+        if batch:
+            await self._copy(session=session, batch=batch)
+            staged += len(batch)
+
+        inserted: Sequence[str] = await ShortRepository().merge_staging(session=session)
+
+        if on_insert is not None:
+            for code in inserted:
+                on_insert(code)
+
+        return ImportResult(inserted=len(inserted), conflicting=staged - len(inserted), invalid=invalid)
+
+
+__all__ = ["Importer", "Format", "read_lines"]
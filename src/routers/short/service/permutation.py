@@ -0,0 +1,96 @@
+import string
+
+from hashlib import blake2b
+
+from typing import List
+
+ALPHABET: str = string.ascii_letters + string.digits
+
+
+def encode_base62(value: int, length: int) -> str:
+    """
+    Encode a non-negative integer as a fixed-length base62 string.
+
+    Args:
+        value: Integer in range [0, 62 ** length)
+        length: Number of characters in the result
+
+    Returns:
+        Base62 representation left-padded with the first alphabet character
+    """
+
+    chars: List[str] = [ALPHABET[0]] * length
+
+    for position in range(length - 1, -1, -1):
+        value, remainder = divmod(value, len(ALPHABET))
+        chars[position] = ALPHABET[remainder]
+
+    return "".join(chars)
+
+
+class FeistelPermutation:
+    """
+    Keyed bijection over the integer range [0, domain).
+
+    A balanced Feistel network permutes the smallest even-width bit space
+    covering the domain; values falling outside the domain are fed through
+    the network again (cycle walking) until they land inside it.
+
+    Args:
+        domain: Size of the permuted range
+        key: Secret key selecting the permutation
+        rounds: Number of Feistel rounds (default: 4)
+    """
+
+    def __init__(self, domain: int, key: bytes, rounds: int = 4) -> None:
+        self._domain: int = domain
+        self._key: bytes = blake2b(key, digest_size=32).digest()
+        self._rounds: int = rounds
+        self._half_bits: int = max(1, ((domain - 1).bit_length() + 1) // 2)
+        self._half_mask: int = (1 << self._half_bits) - 1
+
+    def _round(self, round_index: int, value: int) -> int:
+        digest: bytes = blake2b(
+            value.to_bytes(8, "little"),
+            key=self._key,
+            digest_size=8,
+            person=round_index.to_bytes(16, "little")
+        ).digest()
+
+        return int.from_bytes(digest, "little") & self._half_mask
+
+    def _encrypt(self, value: int) -> int:
+        left: int = value >> self._half_bits
+        right: int = value & self._half_mask
+
+        for round_index in range(self._rounds):
+            left, right = right, left ^ self._round(round_index, right)
+
+        return (left << self._half_bits) | right
+
+    def permute(self, value: int) -> int:
+        """
+        Map a value to its unique image inside the domain.
+
+        Args:
+            value: Integer in range [0, domain)
+
+        Returns:
+            Permuted integer in range [0, domain)
+
+        Raises:
+            ValueError: If the value is outside the domain
+        """
+
+        if not 0 <= value < self._domain:
+            raise ValueError(f"Value {value} is outside the permutation domain")
+
+        value = self._encrypt(value)
+
+        while value >= self._domain:
+            value = self._encrypt(value)
+
+        return value
+
+
+__all__ = ["ALPHABET", "encode_base62", "FeistelPermutation"]
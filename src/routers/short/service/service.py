@@ -1,33 +1,45 @@
-import string
-import random
+from datetime import timedelta
 
-from typing import Optional
+from typing import Dict, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.database.crud import ShortRepository
-from infrastructure.database.models import Short
+from src.config import config
 
 from .base import BaseService
+from .generators import (BaseCodeGenerator,
+                         RandomCodeGenerator,
+                         SequenceCodeGenerator,
+                         ReservoirCodeGenerator)
+
+generators: Dict[str, BaseCodeGenerator] = {
+    "random": RandomCodeGenerator(
+        length=config.code.length
+    ),
+    "sequence": SequenceCodeGenerator(
+        length=config.code.length,
+        secret=config.code.secret.get_secret_value().encode(),
+        block_size=config.code.block_size
+    ),
+    "reservoir": ReservoirCodeGenerator(
+        length=config.code.length,
+        low_watermark=config.code.low_watermark,
+        high_watermark=config.code.high_watermark,
+        batch_size=config.code.refill_batch_size,
+        lease=timedelta(seconds=config.code.lease_ttl)
+    ),
+}
 
 
 class Service(BaseService):
-    async def generate_code(self, session: AsyncSession, max_length: int = 6) -> str:
-        alphabet: str = string.ascii_letters + string.digits
+    def __init__(self, strategy: Optional[str] = None) -> None:
+        super().__init__(generator=generators[strategy or config.code.strategy])
 
-        code: str = str()
+    async def generate_code(self, session: AsyncSession) -> str:
+        return await self.generator.generate(session=session)
 
-        while True:
-            code = code.join(random.choice(alphabet) for _ in range(max_length))
+    async def generate_codes(self, session: AsyncSession, count: int) -> List[str]:
+        return await self.generator.generate_many(session=session, count=count)
 
-            exist: Optional[Short] = await ShortRepository().get(
-                session=session,
-                target=Short.code,
-                value=code
-            )
 
-            if not exist:
-                return code
-
-
-__all__ = ["Service"]
+__all__ = ["Service", "generators"]
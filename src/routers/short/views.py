@@ -1,25 +1,45 @@
+import csv
+import io
+import uuid
+
+from datetime import datetime, timezone
 from http import HTTPStatus
 
-from typing import Annotated, Optional, Dict, Any, Sequence
+from typing import Annotated, Optional, Dict, Any, Sequence, List, AsyncIterator, Tuple, Literal
+
+from fastapi import APIRouter, Header, Body, Path, Query, Depends, HTTPException, UploadFile
 
-from fastapi import APIRouter, Header, Body, Path, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import StreamingResponse
 
-from src.routers.schemas import Response, ErrorResponse, Message
+from src.config import config
+from src.routers.redirect.resolver import forget
+from src.routers.schemas import Response, PageResponse, ErrorResponse, Message
+from src.routers.streaming import stream_response
+from src.tasks.purge import Purge
 
+from infrastructure.cache import code_filter
 from infrastructure.database import database
-from infrastructure.database.models import Short
-from infrastructure.database.crud import ShortRepository
+from infrastructure.database.session import LazySession
+from infrastructure.database.models import Short, ShortClickHourly, ShortClickDaily
+from infrastructure.database.crud import ShortRepository, ClickRepository
 
-from .service import Service
-from .schemas import BaseShort, CreateShort, GetShortByID, UpdateShort
+from .service import Service, Importer, read_lines
+from .service.importer import Format
+from .pagination import encode_cursor, decode_cursor
+from .schemas import (BaseShort, CreateShort, GetShortByID, UpdateShort, BatchItem, DeletedShorts,
+                      ImportResult, ClickBucket, ClickStats)
 
 router: APIRouter = APIRouter(
     prefix="/shorts",
     tags=["shorts"]
 )
 
+CODE_ATTEMPTS: int = 3
+# PostgreSQL reports the violated constraint by name, SQLite by column
+UNIQUE_CODE: Tuple[str, ...] = ("uq_shorts_code", "shorts.code")
+
 
 @router.post(
     path="/",
@@ -37,7 +57,7 @@ router: APIRouter = APIRouter(
         """,
     response_description="Details of created short URL"
 )
-async def create_short(session: Annotated[AsyncSession, Depends(database.session)],
+async def create_short(session: Annotated[LazySession, Depends(database.session)],
                        model: Annotated[CreateShort, Body()]) -> Response:
     """
     Endpoint to create shortened URL entries.
@@ -52,27 +72,48 @@ async def create_short(session: Annotated[AsyncSession, Depends(database.session
     Raises:
         HTTPException 409: If custom code already exists
         HTTPException 422: If URL validation fails
+        HTTPException 503: If no free code could be generated
+
+    Code conflicts are resolved by a single INSERT ... ON CONFLICT DO NOTHING,
+    so there is no pre-check and no race between concurrent requests.
+    Generated codes that turn out to be taken are regenerated.
     """
 
-    if model.code is not None:
-        exists: Optional[Short] = await ShortRepository().get(session=session, target=Short.code, value=model.code)
+    data: Dict[str, Any] = model.model_dump()
+    data["url"] = str(model.url)
 
-        if exists:
-            raise HTTPException(
-                status_code=HTTPStatus.CONFLICT,
-                detail=ErrorResponse(
-                    detail=[Message(msg="The code is busy")]
-                ).model_dump()
-            )
+    short: Optional[Short] = None
 
-    if model.code is None:
-        code: str = await Service().generate_code(session=session)
-        model.code = code
+    for _ in range(1 if model.code is not None else CODE_ATTEMPTS):
+        if model.code is None:
+            try:
+                data["code"] = (await Service().generate_codes(session=session, count=1))[0]
+            except OverflowError:
+                break
 
-    data: Dict[str, Any] = model.model_dump()
-    data["url"] = str(model.url)
+        short = await ShortRepository().add_unique(session=session, target=data)
+
+        if short:
+            break
 
-    short: Optional[Short] = await ShortRepository().add(session=session, target=Short(**data))
+    if not short and model.code is not None:
+        raise HTTPException(
+            status_code=HTTPStatus.CONFLICT,
+            detail=ErrorResponse(
+                detail=[Message(msg="The code is busy")]
+            ).model_dump()
+        )
+
+    if not short:
+        raise HTTPException(
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            detail=ErrorResponse(
+                detail=[Message(msg="Failed to generate a free code")]
+            ).model_dump()
+        )
+
+    forget(short.code)
+    code_filter.add(short.code)
 
     return Response(
         detail=[Message(msg="Short URL created")],
@@ -80,35 +121,206 @@ async def create_short(session: Annotated[AsyncSession, Depends(database.session
     )
 
 
+@router.post(
+    path="/batch",
+    response_model=Response,
+    status_code=HTTPStatus.OK,
+    summary="Create short URLs in bulk",
+    description="""
+        Creates many short URL entries in a single transaction.
+
+        All items are written with one multi-row INSERT ... ON CONFLICT DO NOTHING
+        statement; generated codes that turn out to be taken are regenerated.
+
+        Responses:
+        - 200 OK: Returns the outcome of every item in request order
+        """,
+    response_description="Per-item creation results"
+)
+async def create_shorts(session: Annotated[LazySession, Depends(database.session)],
+                        models: Annotated[List[CreateShort], Body(min_length=1,
+                                                                  max_length=config.short.batch_max_size)]
+                        ) -> Response:
+    """
+    Endpoint to create many shortened URL entries at once.
+
+    Args:
+        session: Database session from dependency
+        models: Request body containing the URL details of every item
+
+    Returns:
+        Response with one result per item, reporting either the created
+        short URL or the reason it was not created
+    """
+
+    results: List[Optional[BatchItem]] = [None] * len(models)
+    pending: Dict[str, int] = {}
+    generated: List[int] = []
+
+    for index, model in enumerate(models):
+        if model.code is None:
+            generated.append(index)
+        elif model.code in pending:
+            results[index] = BatchItem(index=index, success=False, msg="The code is busy")
+        else:
+            pending[model.code] = index
+
+    exhausted: bool = False
+
+    for _ in range(CODE_ATTEMPTS):
+        retry: List[int] = []
+
+        try:
+            codes: List[str] = (
+                await Service().generate_codes(session=session, count=len(generated)) if generated else []
+            )
+        except OverflowError:
+            codes, exhausted = [], True
+            retry.extend(generated)
+
+        for index, code in zip(generated, codes):
+            if code in pending:
+                retry.append(index)
+            else:
+                pending[code] = index
+
+        targets: List[Dict[str, Any]] = []
+
+        for code, index in pending.items():
+            data: Dict[str, Any] = models[index].model_dump()
+            data["url"] = str(models[index].url)
+            data["code"] = code
+            targets.append(data)
+
+        shorts: Sequence[Short] = (
+            await ShortRepository().add_many(session=session, targets=targets, commit=False) if targets else []
+        )
+
+        for short in shorts:
+            index: int = pending.pop(short.code)
+            results[index] = BatchItem(index=index, success=True, short=BaseShort.model_validate(short))
+
+        for code, index in pending.items():
+            if models[index].code is None:
+                retry.append(index)
+            else:
+                results[index] = BatchItem(index=index, success=False, msg="The code is busy")
+
+        pending = {}
+        generated = retry
+
+        if not generated or exhausted:
+            break
+
+    for index in generated:
+        results[index] = BatchItem(index=index, success=False, msg="Failed to generate a free code")
+
+    await session.commit()
+
+    for result in results:
+        if result.success:
+            forget(result.short.code)
+            code_filter.add(result.short.code)
+
+    return Response(
+        detail=[Message(msg="Short URLs processed")],
+        content=results
+    )
+
+
+@router.post(
+    path="/import",
+    response_model=Response,
+    status_code=HTTPStatus.OK,
+    summary="Import short URLs in bulk",
+    description="""
+        Imports short URLs from an uploaded NDJSON or CSV document.
+
+        Records are validated as they are read, loaded into a staging table
+        with PostgreSQL COPY and merged in a single conflict-aware statement.
+        Records without a code get a generated one.
+
+        Responses:
+        - 200 OK: Returns numbers of inserted, conflicting and invalid records
+        """,
+    response_description="Import summary"
+)
+async def import_shorts(session: Annotated[LazySession, Depends(database.session)],
+                        file: UploadFile,
+                        fmt: Annotated[Format, Query(alias="format")] = "ndjson") -> Response:
+    """
+    Endpoint to import short URL records from a document.
+
+    Args:
+        session: Database session from dependency
+        file: Uploaded NDJSON or CSV document
+        fmt: Document format
+
+    Returns:
+        Response with the import summary
+    """
+
+    result: ImportResult = await Importer(batch_size=config.short.import_batch_size).run(
+        session=session,
+        lines=read_lines(file.read),
+        fmt=fmt,
+        on_insert=code_filter.add
+    )
+
+    return Response(
+        detail=[Message(msg="Short URLs imported")],
+        content=[result]
+    )
+
+
 @router.get(
     path="/",
-    response_model=Response,
+    response_model=PageResponse,
     status_code=HTTPStatus.OK,
     summary="Retrieve all short URLs",
     description="""
-    Returns all existing short URL mappings in the system.
+    Returns existing short URL mappings in the system, one page at a time.
+
+    Pages are ordered by creation time; pass `next_cursor` of a page as
+    `cursor` to get the following one.
 
     Responses:
     - 200 OK: Returns list of short URLs
+    - 400 Bad Request: If the cursor is malformed
     - 404 Not Found: If no short URLs exist in the system
     """,
     response_description="List of short URL entries"
 )
-async def get_shorts(session: Annotated[AsyncSession, Depends(database.session)]) -> Response:
+async def get_shorts(session: Annotated[LazySession, Depends(database.read_session)],
+                     limit: Annotated[int, Query(ge=1, le=config.short.page_max_size)] = config.short.page_size,
+                     cursor: Annotated[Optional[str], Query()] = None) -> PageResponse:
     """
     Retrieve paginated list of all short URLs.
 
         Args:
             session: Database session from dependency
+            limit: Maximum number of short URLs on the page
+            cursor: Cursor of the page to retrieve, None for the first page
 
         Returns:
-            Response containing list of short URLs
+            Response containing list of short URLs and the cursor of the next page
 
         Raises:
+            HTTPException 400: If the cursor is malformed
             HTTPException 404: If no short URLs exist
         """
 
-    shorts: Sequence[Short] = await ShortRepository().get_all(session=session)
+    try:
+        after: Optional[Tuple[datetime, uuid.UUID]] = decode_cursor(cursor) if cursor is not None else None
+    except ValueError:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=ErrorResponse(
+                detail=[Message(msg="Malformed cursor")]
+            ).model_dump()
+        )
+
+    shorts: Sequence[Short] = await ShortRepository().get_page(session=session, limit=limit + 1, after=after)
 
     if not shorts:
         raise HTTPException(
@@ -118,9 +330,66 @@ async def get_shorts(session: Annotated[AsyncSession, Depends(database.session)]
             ).model_dump()
         )
 
-    return Response(
+    return PageResponse(
         detail=[Message(msg="Short URLs received")],
-        content=[BaseShort.model_validate(short) for short in shorts]
+        content=[BaseShort.model_validate(short) for short in shorts[:limit]],
+        next_cursor=encode_cursor(shorts[limit - 1]) if len(shorts) > limit else None
+    )
+
+
+@router.get(
+    path="/export",
+    status_code=HTTPStatus.OK,
+    summary="Export all short URLs",
+    description="""
+    Streams every short URL as NDJSON (one JSON object per line) or CSV.
+
+    Rows are read through a server-side cursor, so memory use does not
+    depend on the number of exported short URLs.
+    """,
+    response_class=StreamingResponse,
+    response_description="Stream of short URL entries"
+)
+async def export_shorts(format: Annotated[Literal["ndjson", "csv"], Query()] = "ndjson") -> StreamingResponse:
+    """
+    Export all short URL records.
+
+    Args:
+        format: Output format, either NDJSON or CSV
+
+    Returns:
+        Streamed response with one short URL per line
+    """
+
+    async def lines() -> AsyncIterator[str]:
+        buffer: io.StringIO = io.StringIO()
+        writer = csv.writer(buffer)
+
+        if format == "csv":
+            writer.writerow(BaseShort.model_fields)
+            yield buffer.getvalue()
+
+            buffer.seek(0)
+            buffer.truncate()
+
+        async with database.read_session_factory() as session:
+            async for short in ShortRepository().stream(session=session, fetch_size=config.short.export_fetch_size):
+                model: BaseShort = BaseShort.model_validate(short)
+
+                if format == "ndjson":
+                    yield model.model_dump_json() + "\n"
+                    continue
+
+                writer.writerow(model.model_dump(mode="json").values())
+                yield buffer.getvalue()
+
+                buffer.seek(0)
+                buffer.truncate()
+
+    return StreamingResponse(
+        content=lines(),
+        media_type="application/x-ndjson" if format == "ndjson" else "text/csv",
+        headers={"Content-Disposition": f'attachment; filename="shorts.{format}"'}
     )
 
 
@@ -138,7 +407,7 @@ async def get_shorts(session: Annotated[AsyncSession, Depends(database.session)]
     """,
     response_description="Short URL details"
 )
-async def get_short_by_id(session: Annotated[AsyncSession, Depends(database.session)],
+async def get_short_by_id(session: Annotated[LazySession, Depends(database.session)],
                           model: Annotated[GetShortByID, Path()]) -> Response:
     """Retrieve details for a short URL by either ID.
 
@@ -167,6 +436,91 @@ async def get_short_by_id(session: Annotated[AsyncSession, Depends(database.sess
         content=[BaseShort.model_validate(short)]
     )
 
+@router.get(
+    path="/{id}/stats",
+    response_model=Response,
+    status_code=HTTPStatus.OK,
+    summary="Retrieve click statistics of a short URL",
+    description="""
+    Returns redirect counts of a short URL per hour or per day.
+
+    Answered from pre-aggregated rollups only; hourly buckets are kept for a
+    limited retention period, daily buckets indefinitely. Hits reach the
+    rollups after the next click buffer flush.
+
+    Responses:
+    - 200 OK: Returns click statistics
+    - 404 Not Found: If no matching short URL exists
+    """,
+    response_description="Click statistics"
+)
+async def get_short_stats(session: Annotated[LazySession, Depends(database.read_session)],
+                          model: Annotated[GetShortByID, Path()],
+                          start: Annotated[Optional[datetime], Query(alias="from")] = None,
+                          end: Annotated[Optional[datetime], Query(alias="to")] = None,
+                          granularity: Annotated[Literal["hour", "day"], Query()] = "day") -> Response:
+    """
+    Retrieve click statistics of a short URL.
+
+    Args:
+        session: Database session
+        id: UUID of the short URL
+        start: Include buckets starting at or after this moment
+        end: Include buckets starting before this moment
+        granularity: Size of the time buckets
+
+    Returns:
+        Response containing the click statistics
+
+    Raises:
+        HTTPException 404: If no matching short URL exists
+    """
+
+    short: Optional[Short] = await ShortRepository().get(session=session, target=Short.id, value=model.id)
+
+    if not short and database.replicas:
+        # Short URLs created moments ago may not have reached the replica yet
+        async with database.session_factory() as primary:
+            short = await ShortRepository().get(session=primary, target=Short.id, value=model.id)
+
+    if not short:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=ErrorResponse(
+                detail=[Message(msg="Short link with such ID does not exist")]
+            ).model_dump()
+        )
+
+    # Buckets are UTC hours and days, so compare and truncate in UTC; naive values are taken as UTC
+    if end is not None:
+        end = end.replace(tzinfo=timezone.utc) if end.tzinfo is None else end.astimezone(timezone.utc)
+
+    if start is not None:
+        start = start.replace(tzinfo=timezone.utc) if start.tzinfo is None else start.astimezone(timezone.utc)
+        start = start.replace(minute=0, second=0, microsecond=0)
+
+        if granularity == "day":
+            start = start.replace(hour=0)
+
+    buckets: Sequence[Tuple[datetime, int]] = await ClickRepository().get_buckets(
+        session=session,
+        model=ShortClickHourly if granularity == "hour" else ShortClickDaily,
+        short_id=model.id,
+        start=start,
+        end=end
+    )
+
+    return Response(
+        detail=[Message(msg="Click statistics received")],
+        content=[ClickStats(
+            id=model.id,
+            granularity=granularity,
+            total=sum(hits for _, hits in buckets),
+            buckets=[ClickBucket(bucket=bucket, hits=hits) for bucket, hits in buckets]
+        )]
+    )
+
+
 @router.delete(
     path="/",
     response_model=Response,
@@ -174,28 +528,58 @@ async def get_short_by_id(session: Annotated[AsyncSession, Depends(database.sess
     summary="Delete all short URLs",
     description="""
     **DANGER**: Permanently deletes ALL short URLs in the system.
+
+    Rows are deleted in fixed-size chunks and streamed back as they go.
+    The deletion carries on to the end even if the client disconnects.
+    If the client reads too slowly, the listing stops and ends with the
+    number of further deleted rows instead.
+    With `count_only=true` everything is deleted in a single statement
+    and only the number of deleted rows is returned.
     
     Responses:
-    - 200 OK: Returns list of deleted short URLs
+    - 200 OK: Returns list (or count) of deleted short URLs
     - 404 No Content: If no short URLs existed
     """,
     response_description="List of deleted short URL entries"
 )
-async def delete_shorts(session: Annotated[AsyncSession, Depends(database.session)]) -> Response:
+async def delete_shorts(session: Annotated[LazySession, Depends(database.session)],
+                        count_only: Annotated[bool, Query()] = False) -> Response | StreamingResponse:
     """
     Permanently delete all short URL records.
 
    Args:
        session: Database session from dependency
+       count_only: Return the number of deleted rows instead of the rows
 
    Returns:
-       Response containing list of deleted short URLs
+       Response containing the number of deleted short URLs, or a streamed
+       response containing the list of deleted short URLs
 
    Raises:
        HTTPException 404: If no short URLs existed
    """
 
-    shorts: Sequence[Short] = await ShortRepository().get_all(session=session)
+    if count_only:
+        count: int = await ShortRepository().delete_all(session=session)
+
+        forget()
+        code_filter.clear()
+
+        if not count:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail=ErrorResponse(
+                    detail=[Message(msg="There are no available links created")]
+                ).model_dump()
+            )
+
+        return Response(
+            detail=[Message(msg="Short URLs deleted")],
+            content=[DeletedShorts(count=count)]
+        )
+
+    shorts: Sequence[Short] = await ShortRepository().delete_chunk(session=session,
+                                                                   size=config.short.delete_chunk_size)
 
     if not shorts:
         raise HTTPException(
@@ -205,12 +589,18 @@ async def delete_shorts(session: Annotated[AsyncSession, Depends(database.sessio
             ).model_dump()
         )
 
-    for short in shorts:
-        await ShortRepository().delete(session=session, target=short)
+    purge: Purge = Purge(shorts)
 
-    return Response(
-        detail=[Message(msg="Short URLs deleted")],
-        content=[BaseShort.model_validate(short) for short in shorts]
+    async def deleted() -> AsyncIterator[BaseShort | DeletedShorts]:
+        async for short in purge.deleted():
+            yield BaseShort.model_validate(short)
+
+        if purge.unreported:
+            yield DeletedShorts(count=purge.unreported)
+
+    return StreamingResponse(
+        content=stream_response(message="Short URLs deleted", items=deleted()),
+        media_type="application/json"
     )
 
 
@@ -228,7 +618,7 @@ async def delete_shorts(session: Annotated[AsyncSession, Depends(database.sessio
     """,
     response_description="Details of deleted short URL"
 )
-async def delete_short(session: Annotated[AsyncSession, Depends(database.session)],
+async def delete_short(session: Annotated[LazySession, Depends(database.session)],
                        model: Annotated[GetShortByID, Path()]) -> Response:
     """
     Delete a specific short URL entry.
@@ -256,6 +646,8 @@ async def delete_short(session: Annotated[AsyncSession, Depends(database.session
 
     await ShortRepository().delete(session=session, target=short)
 
+    forget(short.code)
+
     return Response(
         detail=[Message(msg="Short URL deleted")],
         content=[BaseShort.model_validate(short)]
@@ -277,7 +669,7 @@ async def delete_short(session: Annotated[AsyncSession, Depends(database.session
     """,
     response_description="Updated short URL details"
 )
-async def update_short(session: Annotated[AsyncSession, Depends(database.session)],
+async def update_short(session: Annotated[LazySession, Depends(database.session)],
                        model: Annotated[GetShortByID, Header()],
                        updated_model: Annotated[UpdateShort, Body()]) -> Response:
     """Update an existing short URL entry.
@@ -294,41 +686,57 @@ async def update_short(session: Annotated[AsyncSession, Depends(database.session
         HTTPException 400: If no valid fields provided
         HTTPException 404: If short URL not found
         HTTPException 409: If new code already exists
+
+    The update is a single UPDATE ... RETURNING round trip; a missing row
+    and a taken code are told apart by the result and the violated constraint.
     """
 
-    short: Optional[Short] = await ShortRepository().get(session=session, target=Short.id, value=model.id)
+    update_data: Dict[str, Any] = updated_model.model_dump(exclude_unset=True)
 
-    if not short:
+    if not update_data:
         raise HTTPException(
-            status_code=HTTPStatus.NOT_FOUND,
+            status_code=HTTPStatus.BAD_REQUEST,
             detail=ErrorResponse(
-                detail=[Message(msg="Short link with such ID does not exist")]
+                detail=[Message(msg="No fields provided for update")]
             ).model_dump()
         )
 
-    if not updated_model.model_dump(exclude_unset=True):
+    try:
+        updated: Optional[Tuple[Short, str]] = await ShortRepository().update_returning(
+            session=session,
+            target=Short.id,
+            value=model.id,
+            previous=Short.code,
+            **update_data
+        )
+    except IntegrityError as error:
+        await session.rollback()
+
+        if not any(marker in str(error.orig) for marker in UNIQUE_CODE):
+            raise
+
         raise HTTPException(
-            status_code=HTTPStatus.BAD_REQUEST,
+            status_code=HTTPStatus.CONFLICT,
             detail=ErrorResponse(
-                detail=[Message(msg="No fields provided for update")]
+                detail=[Message(msg="The code is busy")]
             ).model_dump()
         )
 
-    short_unique: Optional[Short] = await ShortRepository().get(session=session, target=Short.code,
-                                                                value=updated_model.code)
-    if short_unique:
+    if updated is None:
         raise HTTPException(
-            status_code=HTTPStatus.CONFLICT,
+            status_code=HTTPStatus.NOT_FOUND,
             detail=ErrorResponse(
-                detail=[Message(msg="The code is busy")]
+                detail=[Message(msg="Short link with such ID does not exist")]
             ).model_dump()
         )
 
-    short = await ShortRepository().update(
-        session=session,
-        instance=short,
-        **updated_model.model_dump(exclude_unset=True)
-    )
+    short, previous_code = updated
+
+    forget(previous_code)
+    forget(short.code)
+
+    if short.code != previous_code:
+        code_filter.add(short.code)
 
     return Response(
         detail=[Message(msg="Short URL updated")],
@@ -0,0 +1,19 @@
+from typing import Any, Dict
+
+from pydantic import BaseModel, Field
+
+
+class Stats(BaseModel):
+    """Model for in-process lookup layer statistics of the current worker"""
+
+    cache: Dict[str, Any] = Field(
+        ...,
+        description="Redirect cache statistics"
+    )
+    filter: Dict[str, Any] = Field(
+        ...,
+        description="Negative-lookup filter statistics"
+    )
+
+
+__all__ = ["Stats"]
@@ -0,0 +1,36 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter
+
+from src.routers.schemas import Response, Message
+
+from infrastructure.cache import redirect_cache, code_filter
+
+from .schemas import Stats
+
+router: APIRouter = APIRouter(
+    prefix="/stats",
+    tags=["stats"]
+)
+
+
+@router.get(
+    path="/",
+    response_model=Response,
+    status_code=HTTPStatus.OK,
+    summary="Get lookup statistics",
+    description="Returns redirect cache and negative-lookup filter statistics of the worker serving the request",
+    response_description="Lookup layer statistics"
+)
+def get_stats() -> Response:
+    """
+    Endpoint to inspect in-process lookup layers.
+
+    Returns:
+        Response: Standard response with cache and filter statistics
+    """
+
+    return Response(
+        detail=[Message(msg="Statistics received")],
+        content=[Stats(cache=redirect_cache.stats(), filter=code_filter.stats())]
+    )
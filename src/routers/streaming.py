@@ -0,0 +1,36 @@
+from typing import AsyncIterable, AsyncIterator
+
+from pydantic import BaseModel
+
+from .schemas import Message, Response
+
+
+async def stream_response(message: str, items: AsyncIterable[BaseModel]) -> AsyncIterator[bytes]:
+    """
+    Serialize a standard success response incrementally.
+
+    Produces the same JSON document as `Response(detail=[Message(msg=message)], content=items)`
+    while holding only one item in memory at a time.
+
+    Args:
+        message: Message placed in the response detail
+        items: Models making up the response content
+
+    Yields:
+        Chunks of the JSON document
+    """
+
+    head: str = Response(detail=[Message(msg=message)]).model_dump_json(exclude={"content"})
+
+    yield head[:-1].encode() + b',"content":['
+
+    separator: bytes = b""
+
+    async for item in items:
+        yield separator + item.model_dump_json().encode()
+        separator = b","
+
+    yield b"]}"
+
+
+__all__ = ["stream_response"]
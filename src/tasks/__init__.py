@@ -0,0 +1,23 @@
+from .code_filter import run_code_filter
+from .code_reservoir import run_code_reservoir
+from .click_flush import run_click_flush, run_click_compaction
+from .expiry_sweep import run_expiry_sweep
+from .metrics_sync import run_metrics_sync
+from .warm_up import warm_up_pools, preload_cache
+from .cache_snapshot import load_snapshot, run_cache_snapshot
+from .purge import Purge, purges
+
+__all__ = [
+    "run_code_filter",
+    "run_code_reservoir",
+    "run_click_flush",
+    "run_click_compaction",
+    "run_expiry_sweep",
+    "run_metrics_sync",
+    "warm_up_pools",
+    "preload_cache",
+    "load_snapshot",
+    "run_cache_snapshot",
+    "Purge",
+    "purges",
+]
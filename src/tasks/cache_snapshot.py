@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import struct
+
+from datetime import datetime, timezone
+
+from typing import List, Tuple
+
+from src.config import config
+from src.routers.redirect.resolver import remember
+
+from infrastructure.cache import redirect_cache, RedirectEntry
+from infrastructure.cache.snapshot import fingerprint, read_snapshot, write_snapshot
+from infrastructure.database import database
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+source: int = fingerprint(database.engine.url.render_as_string(hide_password=True))
+
+
+def save_snapshot() -> int:
+    """
+    Write this worker's most recently used redirect entries to the snapshot file.
+
+    Returns:
+        Number of written entries
+    """
+
+    return write_snapshot(
+        path=config.snapshot.path,
+        entries=redirect_cache.hottest(config.snapshot.size),
+        source=source
+    )
+
+
+def load_snapshot() -> int:
+    """
+    Fill the redirect cache from the snapshot file, unless it is missing, stale or corrupt.
+
+    Entries are cached for what was left of their cache lifetime when the
+    snapshot was written, minus its age, and never outlive the short URLs
+    they hold. Deactivated entries and ones that expired meanwhile are
+    skipped, so a change the node missed while it was down is not served
+    for longer than an entry it had already cached.
+
+    Returns:
+        Number of loaded entries
+    """
+
+    try:
+        entries: List[Tuple[str, RedirectEntry, float]] = read_snapshot(
+            path=config.snapshot.path,
+            source=source,
+            max_age=config.snapshot.max_age
+        )
+    except (OSError, ValueError, struct.error):
+        logger.exception("Failed to read the redirect cache snapshot")
+        return 0
+
+    now: datetime = datetime.now(tz=timezone.utc)
+    loaded: int = 0
+
+    # Hottest entries come first; caching them last keeps them the most recently used.
+    for code, entry, lifetime in reversed(entries):
+        if not entry.is_activated or entry.expires_at is not None and entry.expires_at <= now:
+            continue
+
+        remember(code, entry, ttl=lifetime)
+        loaded += 1
+
+    return loaded
+
+
+async def run_cache_snapshot() -> None:
+    """
+    Write snapshots periodically, until cancelled; a last one is written on shutdown.
+    """
+
+    try:
+        while True:
+            await asyncio.sleep(config.snapshot.interval)
+
+            try:
+                save_snapshot()
+            except OSError:
+                logger.exception("Failed to write the redirect cache snapshot")
+    finally:
+        try:
+            save_snapshot()
+        except OSError:
+            logger.exception("Failed to write the redirect cache snapshot")
+
+
+__all__ = ["save_snapshot", "load_snapshot", "run_cache_snapshot"]
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import uuid
+
+from datetime import datetime, timedelta, timezone
+
+from typing import Dict, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.config import config
+
+from infrastructure.analytics import click_buffer
+from infrastructure.database import database
+from infrastructure.database.crud import ClickRepository
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def flush_clicks() -> None:
+    """
+    Write buffered hits to the database in a single statement.
+
+    Hits are put back into the buffer if the write fails or is cancelled,
+    whatever the error, so a drained batch is never silently dropped.
+    """
+
+    hits: Dict[Tuple[uuid.UUID, int], int] = click_buffer.drain()
+
+    if not hits:
+        return
+
+    try:
+        async with database.session_factory() as session:
+            await ClickRepository().add_hits(
+                session=session,
+                hits={
+                    (short_id, datetime.fromtimestamp(hour * 3600, tz=timezone.utc)): amount
+                    for (short_id, hour), amount in hits.items()
+                }
+            )
+    except BaseException:
+        click_buffer.restore(hits)
+        raise
+
+
+async def run_click_flush() -> None:
+    """
+    Flush buffered hits periodically or when the buffer fills up, until cancelled.
+
+    After a failed flush, the next attempt waits for the flush interval,
+    doubled with every further failure up to `retry_max_interval`, however
+    full the buffer is. Remaining hits are flushed on shutdown if
+    `drain_on_shutdown` is set.
+    """
+
+    failures: int = 0
+
+    try:
+        while True:
+            if failures:
+                await asyncio.sleep(min(
+                    config.clicks.flush_interval * 2 ** min(failures - 1, 16),
+                    config.clicks.retry_max_interval
+                ))
+            else:
+                await click_buffer.wait(timeout=config.clicks.flush_interval)
+
+            try:
+                await flush_clicks()
+            except (SQLAlchemyError, OSError):
+                failures += 1
+                logger.exception("Failed to flush buffered clicks (attempt %d)", failures)
+            else:
+                failures = 0
+    finally:
+        if config.clicks.drain_on_shutdown:
+            await flush_clicks()
+
+
+async def run_click_compaction() -> None:
+    """
+    Prune hourly rollups past their retention period periodically, until cancelled.
+
+    Daily rollups are maintained alongside hourly ones, so pruning folds
+    old hours into the daily granularity without losing hits.
+    """
+
+    while True:
+        try:
+            async with database.session_factory() as session:
+                await ClickRepository().prune_hourly(
+                    session=session,
+                    before=datetime.now(tz=timezone.utc) - timedelta(days=config.clicks.hourly_retention_days)
+                )
+        except SQLAlchemyError:
+            logger.exception("Failed to compact click rollups")
+
+        await asyncio.sleep(config.clicks.compaction_interval)
+
+
+__all__ = ["flush_clicks", "run_click_flush", "run_click_compaction"]
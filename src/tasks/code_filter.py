@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import math
+
+from datetime import datetime, timedelta
+from time import monotonic
+
+from typing import AbstractSet, Optional, Set, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.config import config
+
+from infrastructure.cache import code_filter
+from infrastructure.cache.bloom import CountingBloomFilter
+from infrastructure.database import database
+from infrastructure.database.crud import ShortRepository
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def fill_code_filter(
+        target: CountingBloomFilter,
+        since: Optional[datetime] = None,
+        skip: AbstractSet[str] = frozenset()
+) -> Tuple[datetime, Set[str]]:
+    """
+    Stream existing codes from the database into a filter.
+
+    Args:
+        target: Filter to add codes to
+        since: Only add codes created or updated at or after this moment
+        skip: Codes already added by the previous refresh, not added again
+
+    Returns:
+        Database time the snapshot was taken at, used as the next watermark,
+        and the codes read when `since` is given, to be skipped by the next refresh
+    """
+
+    read: Set[str] = set()
+
+    async with database.session_factory() as session:
+        now: datetime = await session.scalar(select(func.now()))
+
+        async for code in ShortRepository().stream_codes(
+                session=session,
+                since=since,
+                fetch_size=config.filter.fetch_size
+        ):
+            if code not in skip:
+                target.add(code)
+
+            if since is not None:
+                read.add(code)
+
+    return now, read
+
+
+async def run_code_filter() -> None:
+    """
+    Build the negative-lookup filter and keep it current until cancelled.
+
+    The filter is fully rebuilt every `rebuild_interval` seconds to drop
+    deleted codes, and incrementally refreshed with recently created or
+    updated codes in between. Refreshes re-read an overlap window; codes the
+    previous refresh already added are skipped so they are not counted twice.
+    """
+
+    watermark: Optional[datetime] = None
+    recent: Set[str] = set()
+    rebuilt_at: float = -math.inf
+
+    while True:
+        try:
+            if watermark is None or monotonic() - rebuilt_at >= config.filter.rebuild_interval:
+                fresh: CountingBloomFilter = code_filter.spawn()
+                watermark, recent = await fill_code_filter(target=fresh)
+                code_filter.swap(fresh)
+                rebuilt_at = monotonic()
+            else:
+                watermark, recent = await fill_code_filter(
+                    target=code_filter,
+                    since=watermark - timedelta(seconds=config.filter.refresh_overlap),
+                    skip=recent
+                )
+        except SQLAlchemyError:
+            logger.exception("Failed to refresh the code filter")
+
+        await asyncio.sleep(config.filter.refresh_interval)
+
+
+__all__ = ["fill_code_filter", "run_code_filter"]
@@ -0,0 +1,43 @@
+import asyncio
+import logging
+
+from time import monotonic
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.config import config
+from src.routers.short.service import generators
+from src.routers.short.service.generators import ReservoirCodeGenerator
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def run_code_reservoir() -> None:
+    """
+    Keep the code reservoir of this worker filled until cancelled.
+
+    Refills whenever the reservoir drops below the low watermark, renews
+    the leases of held codes, reclaims expired reservations of any worker,
+    and releases the reservations of this worker on shutdown.
+    """
+
+    generator: ReservoirCodeGenerator = generators["reservoir"]
+    renewed_at: float = monotonic()
+
+    try:
+        while True:
+            try:
+                await generator.refill()
+
+                if monotonic() - renewed_at >= config.code.lease_renew_interval:
+                    await generator.renew()
+                    renewed_at = monotonic()
+            except (SQLAlchemyError, OverflowError):
+                logger.exception("Failed to maintain the code reservoir")
+
+            await generator.wait(timeout=config.code.lease_renew_interval)
+    finally:
+        await generator.release()
+
+
+__all__ = ["run_code_reservoir"]
@@ -0,0 +1,64 @@
+import asyncio
+import logging
+
+from typing import Sequence
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.config import config
+from src.routers.redirect.resolver import forget
+
+from infrastructure.database import database
+from infrastructure.database.crud import ShortRepository
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def sweep_expired() -> int:
+    """
+    Delete or deactivate every expired short URL in bounded batches.
+
+    Each batch is its own transaction, so locks are held only briefly.
+    Handled codes are dropped from the redirect cache through `forget`, so
+    the invalidation is repeated after the replica lag; deleted ones stay in
+    the code filter until its next rebuild.
+
+    Returns:
+        Number of handled short URLs
+    """
+
+    deactivate: bool = config.expiry.mode == "deactivate"
+    total: int = 0
+
+    while True:
+        async with database.session_factory() as session:
+            codes: Sequence[str] = await ShortRepository().sweep_expired(
+                session=session,
+                limit=config.expiry.batch_size,
+                deactivate=deactivate
+            )
+
+        for code in codes:
+            forget(code)
+
+        total += len(codes)
+
+        if len(codes) < config.expiry.batch_size:
+            return total
+
+
+async def run_expiry_sweep() -> None:
+    """
+    Sweep expired short URLs periodically, until cancelled.
+    """
+
+    while True:
+        try:
+            await sweep_expired()
+        except SQLAlchemyError:
+            logger.exception("Failed to sweep expired short URLs")
+
+        await asyncio.sleep(config.expiry.interval)
+
+
+__all__ = ["sweep_expired", "run_expiry_sweep"]
@@ -0,0 +1,18 @@
+import asyncio
+
+from src.config import config
+from src.routers.metrics.sync import sync_metrics
+
+
+async def run_metrics_sync() -> None:
+    """
+    Sync metrics periodically, until cancelled.
+    """
+
+    while True:
+        sync_metrics()
+
+        await asyncio.sleep(config.metrics.sync_interval)
+
+
+__all__ = ["run_metrics_sync"]
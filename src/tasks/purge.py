@@ -0,0 +1,96 @@
+import asyncio
+import logging
+
+from typing import AsyncIterator, Optional, Sequence, Set
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.config import config
+from src.routers.redirect.resolver import forget
+
+from infrastructure.database import database
+from infrastructure.database.crud import ShortRepository
+from infrastructure.database.models import Short
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+PROGRESS_CHUNKS: int = 8
+
+purges: Set[asyncio.Task] = set()
+
+
+class Purge:
+    """
+    Deletes every short URL chunk by chunk in a task of its own.
+
+    The deletion runs to completion whether or not anybody follows it: a
+    client disconnecting from the streamed response only stops the
+    reporting, never the deletion, so the table is not left half-wiped.
+    At most `PROGRESS_CHUNKS` deleted chunks wait for a slow follower; once
+    they are exceeded, further rows are only counted in `unreported`
+    instead of blocking the deletion or piling up in memory.
+    Running purges are kept in `purges` so shutdown can wait for them.
+
+    Args:
+        chunk: Short URLs already deleted by the caller
+    """
+
+    def __init__(self, chunk: Sequence[Short]) -> None:
+        # One slot more than reported chunks, so the end marker always fits
+        self._progress: asyncio.Queue[Optional[Sequence[Short]]] = asyncio.Queue(maxsize=PROGRESS_CHUNKS + 1)
+        self._listening: bool = True
+        self._error: Optional[BaseException] = None
+
+        self.unreported: int = 0
+
+        task: asyncio.Task = asyncio.create_task(self._run(chunk))
+        purges.add(task)
+        task.add_done_callback(purges.discard)
+
+    async def _run(self, chunk: Sequence[Short]) -> None:
+        try:
+            async with database.session_factory() as session:
+                while chunk:
+                    for short in chunk:
+                        forget(short.code)
+
+                    if self._listening:
+                        if self.unreported or self._progress.qsize() >= PROGRESS_CHUNKS:
+                            self.unreported += len(chunk)
+                        else:
+                            self._progress.put_nowait(chunk)
+
+                    chunk = await ShortRepository().delete_chunk(session=session,
+                                                                 size=config.short.delete_chunk_size)
+        except SQLAlchemyError as error:
+            logger.exception("Failed to delete all short URLs")
+            self._error = error
+        finally:
+            self._progress.put_nowait(None)
+
+    async def deleted(self) -> AsyncIterator[Short]:
+        """
+        Follow the purge.
+
+        Once the follower fell too far behind, the remaining rows are not
+        yielded; their number is in `unreported` when iteration ends.
+
+        Yields:
+            Deleted short URLs, as their chunks are committed
+
+        Raises:
+            SQLAlchemyError: If the purge failed before deleting everything
+        """
+
+        try:
+            while (chunk := await self._progress.get()) is not None:
+                for short in chunk:
+                    yield short
+        finally:
+            self._listening = False
+
+        if self._error is not None:
+            raise self._error
+
+
+__all__ = ["Purge", "purges"]
@@ -0,0 +1,64 @@
+import logging
+
+from datetime import datetime, timedelta, timezone
+
+from typing import Sequence
+
+from sqlalchemy import Row
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.config import config
+from src.routers.redirect.resolver import remember
+
+from infrastructure.cache import RedirectEntry
+from infrastructure.database import database
+from infrastructure.database.crud import ShortRepository
+from infrastructure.database.crud.short import redirect_lookup
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def warm_up_pools() -> None:
+    """
+    Fill the connection pools and prepare the redirect lookup on them.
+
+    A failure is logged and startup continues; connections are then opened
+    by the first requests, as without warming.
+    """
+
+    try:
+        await database.warm_up(statements=[(redirect_lookup, {"code": ""})])
+    except (SQLAlchemyError, OSError):
+        logger.exception("Failed to warm up the connection pools")
+
+
+async def preload_cache() -> int:
+    """
+    Load the most clicked active short URLs into this worker's redirect cache.
+
+    A failure is logged and startup continues with a cold cache.
+
+    Returns:
+        Number of preloaded codes
+    """
+
+    since: datetime = datetime.now(tz=timezone.utc) - timedelta(hours=config.cache.preload_window)
+
+    try:
+        async with database.read_session_factory() as session:
+            rows: Sequence[Row] = await ShortRepository().get_hottest(
+                session=session,
+                since=since,
+                limit=config.cache.preload
+            )
+    except (SQLAlchemyError, OSError):
+        logger.exception("Failed to preload the redirect cache")
+        return 0
+
+    for code, *columns in rows:
+        remember(code, RedirectEntry(*columns))
+
+    return len(rows)
+
+
+__all__ = ["warm_up_pools", "preload_cache"]
@@ -0,0 +1,124 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+
+from typing import Dict, Iterator, Tuple
+
+import httpx
+import pytest
+
+from src.config import config
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+
+STARTUP_TIMEOUT: float = 30
+
+BACKENDS: Tuple[str, ...] = ("memory", "sqlite", "postgres")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+
+        return sock.getsockname()[1]
+
+
+def postgres_available() -> bool:
+    try:
+        with socket.create_connection((config.database.host, config.database.port), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+@pytest.fixture(
+    scope="session",
+    params=[(backend, metrics) for backend in BACKENDS for metrics in (True, False)],
+    ids=lambda param: f"{param[0]}-metrics-{'on' if param[1] else 'off'}"
+)
+def server(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> Iterator[Tuple[str, bool]]:
+    """
+    Run the application in a worker process of its own for one backend and metrics setting.
+
+    Configuration is read at import, so every combination gets a fresh
+    process. The postgres backend uses the database configured through the
+    environment, is migrated to the latest revision and has its short URLs
+    wiped by the tests; it is skipped when the server cannot be reached.
+
+    Yields:
+        Base URL of the application and whether metrics are enabled
+    """
+
+    backend, metrics = request.param
+
+    if backend == "postgres":
+        if not postgres_available():
+            pytest.skip(f"PostgreSQL is not reachable at {config.database.host}:{config.database.port}")
+
+        subprocess.run(
+            [sys.executable, "-m", "alembic", "upgrade", "head"],
+            cwd=ROOT,
+            env={**os.environ, "CONFIG__DATABASE__HOST_ALEMBIC": config.database.host},
+            check=True,
+            capture_output=True
+        )
+
+    port: int = free_port()
+    env: Dict[str, str] = {
+        **os.environ,
+        "CONFIG__DATABASE__BACKEND": backend,
+        "CONFIG__DATABASE__PATH": str(tmp_path_factory.mktemp(backend) / "shorter.db"),
+        "CONFIG__METRICS__ENABLED": str(metrics).lower(),
+        "CONFIG__CLICKS__FLUSH_INTERVAL": "0.1",
+        "CONFIG__SNAPSHOT__ENABLED": "false",
+    }
+    env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+
+    process: subprocess.Popen = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+        env=env
+    )
+    url: str = f"http://127.0.0.1:{port}"
+    deadline: float = time.monotonic() + STARTUP_TIMEOUT
+
+    try:
+        while True:
+            try:
+                httpx.get(f"{url}/healths/")
+                break
+            except httpx.TransportError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    pytest.fail(f"Application did not start on the {backend} backend")
+
+                time.sleep(0.1)
+
+        yield url, metrics
+    finally:
+        process.terminate()
+        process.wait()
+
+
+@pytest.fixture
+def client(server: Tuple[str, bool]) -> Iterator[httpx.Client]:
+    """
+    Client of the running application, starting every test with no short URLs.
+    """
+
+    with httpx.Client(base_url=server[0], follow_redirects=False) as client:
+        client.delete("/shorts/", params={"count_only": True})
+
+        yield client
+
+
+@pytest.fixture
+def metrics(server: Tuple[str, bool]) -> bool:
+    """
+    Whether the running application collects metrics.
+    """
+
+    return server[1]
@@ -0,0 +1,46 @@
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+
+def test_metrics(client: httpx.Client, metrics: bool) -> None:
+    client.get("/healths/")
+
+    response: httpx.Response = client.get("/metrics")
+
+    if metrics:
+        assert response.status_code == HTTPStatus.OK
+        assert "http_requests_total" in response.text
+    else:
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_serves_requests(client: httpx.Client) -> None:
+    response: httpx.Response = client.post("/shorts/", json={"code": "met001", "url": "https://example.com/"})
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert client.get("/redirects/met001").status_code == HTTPStatus.TEMPORARY_REDIRECT
+
+
+def unused_sessions(client: httpx.Client) -> float:
+    for line in client.get("/metrics").text.splitlines():
+        if line.startswith('db_request_sessions_total{used="false"}'):
+            return float(line.split()[-1])
+
+    return 0
+
+
+def test_redirect_lookups_count_sessions(client: httpx.Client, metrics: bool) -> None:
+    if not metrics:
+        pytest.skip("Metrics are disabled")
+
+    client.post("/shorts/", json={"code": "met001", "url": "https://example.com/"})
+    client.get("/redirects/met001")
+
+    before: float = unused_sessions(client)
+
+    for _ in range(2):
+        client.get("/redirects/met001")
+
+    assert unused_sessions(client) == before + 2
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+
+import httpx
+
+JSON: dict = {"accept": "application/json"}
+
+
+def test_redirect(client: httpx.Client) -> None:
+    client.post("/shorts/", json={"code": "red001", "url": "https://example.com/target"})
+
+    response: httpx.Response = client.get("/redirects/red001")
+
+    assert response.status_code == HTTPStatus.TEMPORARY_REDIRECT
+    assert response.headers["location"] == "https://example.com/target"
+
+
+def test_redirect_json(client: httpx.Client) -> None:
+    client.post("/shorts/", json={"code": "red001", "url": "https://example.com/target"})
+
+    response: httpx.Response = client.get("/redirects/red001", headers=JSON)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["content"][0]["url"] == "https://example.com/target"
+
+
+def test_redirect_missing(client: httpx.Client) -> None:
+    assert client.get("/redirects/red404").status_code == HTTPStatus.NOT_FOUND
+    assert client.get("/redirects/red404", headers=JSON).status_code == HTTPStatus.NOT_FOUND
+
+
+def test_redirect_deactivated(client: httpx.Client) -> None:
+    short: dict = client.post("/shorts/", json={"code": "red001", "url": "https://example.com/"}).json()["content"][0]
+
+    assert client.get("/redirects/red001").status_code == HTTPStatus.TEMPORARY_REDIRECT
+
+    client.put(f"/shorts/{short['id']}", headers={"id": short["id"]}, json={"is_activated": False})
+
+    for headers in ({}, JSON):
+        response: httpx.Response = client.get("/redirects/red001", headers=headers)
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert "deactivated" in response.text
+
+
+def test_redirect_expired(client: httpx.Client) -> None:
+    past: str = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
+
+    client.post("/shorts/", json={"code": "red001", "url": "https://example.com/", "expires_at": past})
+
+    for headers in ({}, JSON):
+        response: httpx.Response = client.get("/redirects/red001", headers=headers)
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert "expired" in response.text
@@ -0,0 +1,259 @@
+import json
+import time
+import uuid
+
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+
+from typing import Any, Dict, List
+
+import httpx
+
+MISSING: str = str(uuid.UUID(int=0))
+
+
+def create(client: httpx.Client, code: str, url: str = "https://example.com/") -> Dict[str, Any]:
+    response: httpx.Response = client.post("/shorts/", json={"code": code, "url": url})
+
+    assert response.status_code == HTTPStatus.CREATED, response.text
+
+    return response.json()["content"][0]
+
+
+def test_create(client: httpx.Client) -> None:
+    short: Dict[str, Any] = create(client, "tst001", "https://example.com/a")
+
+    assert short["code"] == "tst001"
+    assert short["url"] == "https://example.com/a"
+    assert short["is_activated"] is True
+
+
+def test_create_generates_code(client: httpx.Client) -> None:
+    response: httpx.Response = client.post("/shorts/", json={"url": "https://example.com/"})
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json()["content"][0]["code"]
+
+
+def test_create_conflict(client: httpx.Client) -> None:
+    create(client, "tst001")
+
+    response: httpx.Response = client.post("/shorts/", json={"code": "tst001", "url": "https://example.com/"})
+
+    assert response.status_code == HTTPStatus.CONFLICT
+
+
+def test_batch(client: httpx.Client) -> None:
+    create(client, "tst001")
+
+    response: httpx.Response = client.post("/shorts/batch", json=[
+        {"url": "https://example.com/1"},
+        {"url": "https://example.com/2", "code": "tst001"},
+        {"url": "https://example.com/3", "code": "tst002"},
+    ])
+
+    assert response.status_code == HTTPStatus.OK
+    assert [item["success"] for item in response.json()["content"]] == [True, False, True]
+
+
+def test_import_ndjson(client: httpx.Client) -> None:
+    create(client, "tst001")
+
+    lines: List[str] = [json.dumps({"code": f"imp{index:03d}", "url": f"https://example.com/{index}"})
+                        for index in range(3)]
+    lines += [json.dumps({"code": "tst001", "url": "https://example.com/"}), "not json"]
+
+    response: httpx.Response = client.post("/shorts/import", files={"file": ("shorts.ndjson", "\n".join(lines))})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["content"][0] == {"inserted": 3, "conflicting": 1, "invalid": 1}
+
+
+def test_import_csv(client: httpx.Client) -> None:
+    document: str = 'code,url\r\ncsv001,https://example.com/a\r\ncsv002,"https://example.com/b?q=""x"""\r\n'
+
+    response: httpx.Response = client.post(
+        "/shorts/import",
+        params={"format": "csv"},
+        files={"file": ("shorts.csv", document)}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["content"][0] == {"inserted": 2, "conflicting": 0, "invalid": 0}
+
+
+def test_list_with_cursor(client: httpx.Client) -> None:
+    codes: List[str] = [create(client, f"lst{index:03d}")["code"] for index in range(5)]
+
+    seen: List[str] = []
+    params: Dict[str, Any] = {"limit": 2}
+
+    while True:
+        response: httpx.Response = client.get("/shorts/", params=params)
+
+        assert response.status_code == HTTPStatus.OK
+
+        page: Dict[str, Any] = response.json()
+        seen += [short["code"] for short in page["content"]]
+
+        if page["next_cursor"] is None:
+            break
+
+        params["cursor"] = page["next_cursor"]
+
+    assert seen == codes
+
+
+def test_list_empty(client: httpx.Client) -> None:
+    assert client.get("/shorts/").status_code == HTTPStatus.NOT_FOUND
+
+
+def test_list_malformed_cursor(client: httpx.Client) -> None:
+    assert client.get("/shorts/", params={"cursor": "garbage"}).status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_export(client: httpx.Client) -> None:
+    for index in range(3):
+        create(client, f"exp{index:03d}")
+
+    response: httpx.Response = client.get("/shorts/export")
+
+    assert response.status_code == HTTPStatus.OK
+    assert sorted(json.loads(line)["code"] for line in response.text.splitlines()) == ["exp000", "exp001", "exp002"]
+
+    response = client.get("/shorts/export", params={"format": "csv"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.text.splitlines()) == 4
+
+
+def test_get(client: httpx.Client) -> None:
+    short: Dict[str, Any] = create(client, "tst001")
+
+    response: httpx.Response = client.get(f"/shorts/{short['id']}")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["content"][0]["code"] == "tst001"
+    assert client.get(f"/shorts/{MISSING}").status_code == HTTPStatus.NOT_FOUND
+
+
+def test_stats(client: httpx.Client) -> None:
+    short: Dict[str, Any] = create(client, "tst001")
+
+    for _ in range(2):
+        assert client.get("/redirects/tst001").status_code == HTTPStatus.TEMPORARY_REDIRECT
+
+    deadline: float = time.monotonic() + 10
+
+    while True:
+        response: httpx.Response = client.get(f"/shorts/{short['id']}/stats")
+
+        assert response.status_code == HTTPStatus.OK
+
+        if response.json()["content"][0]["total"] == 2 or time.monotonic() > deadline:
+            break
+
+        time.sleep(0.1)
+
+    stats: Dict[str, Any] = response.json()["content"][0]
+
+    assert stats["total"] == 2
+    assert sum(bucket["hits"] for bucket in stats["buckets"]) == 2
+
+    response = client.get(f"/shorts/{short['id']}/stats", params={"granularity": "day"})
+
+    assert sum(bucket["hits"] for bucket in response.json()["content"][0]["buckets"]) == 2
+    assert client.get(f"/shorts/{MISSING}/stats").status_code == HTTPStatus.NOT_FOUND
+
+
+def test_lookup_stats(client: httpx.Client) -> None:
+    response: httpx.Response = client.get("/stats/")
+
+    assert response.status_code == HTTPStatus.OK
+    assert {"cache", "filter"} <= response.json()["content"][0].keys()
+
+
+def test_update(client: httpx.Client) -> None:
+    short: Dict[str, Any] = create(client, "tst001")
+
+    response: httpx.Response = client.put(
+        f"/shorts/{short['id']}",
+        headers={"id": short["id"]},
+        json={"code": "tst002", "url": "https://example.com/new"}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["content"][0]["code"] == "tst002"
+    assert client.get("/redirects/tst001").status_code == HTTPStatus.NOT_FOUND
+    assert client.get("/redirects/tst002").headers["location"] == "https://example.com/new"
+
+
+def test_update_missing(client: httpx.Client) -> None:
+    response: httpx.Response = client.put(f"/shorts/{MISSING}", headers={"id": MISSING}, json={"url": "https://x.io"})
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_update_conflict(client: httpx.Client) -> None:
+    short: Dict[str, Any] = create(client, "tst001")
+    create(client, "tst002")
+
+    response: httpx.Response = client.put(f"/shorts/{short['id']}", headers={"id": short["id"]}, json={"code": "tst002"})
+
+    assert response.status_code == HTTPStatus.CONFLICT
+
+
+def test_delete(client: httpx.Client) -> None:
+    short: Dict[str, Any] = create(client, "tst001")
+
+    assert client.get("/redirects/tst001").status_code == HTTPStatus.TEMPORARY_REDIRECT
+    assert client.delete(f"/shorts/{short['id']}").status_code == HTTPStatus.OK
+    assert client.get("/redirects/tst001").status_code == HTTPStatus.NOT_FOUND
+    assert client.delete(f"/shorts/{short['id']}").status_code == HTTPStatus.NOT_FOUND
+
+
+def test_delete_all_streamed(client: httpx.Client) -> None:
+    for index in range(3):
+        create(client, f"del{index:03d}")
+
+    response: httpx.Response = client.delete("/shorts/")
+
+    assert response.status_code == HTTPStatus.OK
+    assert sorted(short["code"] for short in response.json()["content"]) == ["del000", "del001", "del002"]
+    assert client.get("/shorts/").status_code == HTTPStatus.NOT_FOUND
+    assert client.delete("/shorts/").status_code == HTTPStatus.NOT_FOUND
+
+
+def test_delete_all_count(client: httpx.Client) -> None:
+    for index in range(3):
+        create(client, f"del{index:03d}")
+
+    response: httpx.Response = client.delete("/shorts/", params={"count_only": True})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["content"][0]["count"] == 3
+    assert client.get("/redirects/del000").status_code == HTTPStatus.NOT_FOUND
+
+
+def test_stats_naive_range(client: httpx.Client) -> None:
+    short: Dict[str, Any] = create(client, "tst001")
+    client.get("/redirects/tst001")
+
+    now: datetime = datetime.now(timezone.utc).replace(tzinfo=None)
+    params: Dict[str, str] = {
+        "from": (now - timedelta(hours=1)).isoformat(),
+        "to": (now + timedelta(hours=1)).isoformat(),
+    }
+    deadline: float = time.monotonic() + 10
+
+    while True:
+        response: httpx.Response = client.get(f"/shorts/{short['id']}/stats", params=params)
+
+        assert response.status_code == HTTPStatus.OK
+
+        if response.json()["content"][0]["total"] == 1 or time.monotonic() > deadline:
+            break
+
+        time.sleep(0.1)
+
+    assert sum(bucket["hits"] for bucket in response.json()["content"][0]["buckets"]) == 1